@@ -26,10 +26,50 @@ DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
 MODEL_PATH = Path(__file__).parent.parent / 'models'
 ALLOWED_MODELS = ['svm', 'logistic_regression', 'random_forest']
 DEFAULT_MODEL = 'random_forest'
+# joblib compression level for saved artifacts; 0 keeps them memory-mappable
+ARTIFACT_COMPRESSION = int(os.getenv('ARTIFACT_COMPRESSION', '0'))
+# Watch MODEL_PATH and switch to newly trained artifacts without a restart
+MODEL_HOT_RELOAD = os.getenv('MODEL_HOT_RELOAD', 'False').lower() == 'true'
+MODEL_RELOAD_INTERVAL = float(os.getenv('MODEL_RELOAD_INTERVAL', '10'))  # seconds
+# Train on the built-in dataset when no artifact exists (development only)
+TRAIN_MODEL_IF_MISSING = os.getenv('TRAIN_MODEL_IF_MISSING', 'False').lower() == 'true'
+
+# Cascade inference: a fast model answers unless its top-class probability
+# falls inside the uncertainty band, in which case DEFAULT_MODEL decides
+CASCADE_ENABLED = os.getenv('CASCADE_ENABLED', 'False').lower() == 'true'
+CASCADE_FAST_MODEL = os.getenv('CASCADE_FAST_MODEL', 'logistic_regression')
+CASCADE_UNCERTAINTY_BAND = (
+    float(os.getenv('CASCADE_BAND_LOW', '0.0')),
+    float(os.getenv('CASCADE_BAND_HIGH', '0.9')),
+)
+
+# Prediction cache: repeat submissions of the same parameters skip the model
+PREDICTION_CACHE_SIZE = int(os.getenv('PREDICTION_CACHE_SIZE', '1024'))
+PREDICTION_CACHE_TTL = float(os.getenv('PREDICTION_CACHE_TTL', '3600'))  # seconds
+PREDICTION_CACHE_PRECISION = int(os.getenv('PREDICTION_CACHE_PRECISION', '4'))  # decimals
+
+# Micro-batching: concurrent single-record predictions are collected for up
+# to MICRO_BATCH_MAX_WAIT_MS or MICRO_BATCH_MAX_SIZE rows and scored together
+MICRO_BATCHING_ENABLED = os.getenv('MICRO_BATCHING_ENABLED', 'False').lower() == 'true'
+MICRO_BATCH_MAX_SIZE = int(os.getenv('MICRO_BATCH_MAX_SIZE', '64'))
+MICRO_BATCH_MAX_WAIT_MS = float(os.getenv('MICRO_BATCH_MAX_WAIT_MS', '2'))
 
 # Logging settings
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOG_FILE = Path(__file__).parent.parent / 'logs' / 'app.log'
+# Request tracing: nested stage timings written to LOG_FILE as JSON lines
+TRACING_ENABLED = os.getenv('TRACING_ENABLED', 'False').lower() == 'true'
+# Sampled cProfile of Streamlit reruns, shown to admins in the sidebar
+PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'False').lower() == 'true'
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', '0.05'))  # fraction of reruns
+PROFILE_DIR = Path(os.getenv('PROFILE_DIR', str(LOG_FILE.parent / 'profiles')))
+PROFILE_KEEP = int(os.getenv('PROFILE_KEEP', '50'))  # newest .prof files kept
+PROFILE_TOP_N = int(os.getenv('PROFILE_TOP_N', '20'))
+# SQL statements slower than this are logged with their parameter types
+SLOW_QUERY_MS = float(os.getenv('SLOW_QUERY_MS', '100'))
+# A statement repeated this often in one page render or service call is
+# logged as a likely N+1
+QUERY_REPEAT_WARNING = int(os.getenv('QUERY_REPEAT_WARNING', '10'))
 
 # API settings
 API_V1_PREFIX = "/api/v1"
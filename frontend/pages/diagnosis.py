@@ -146,7 +146,14 @@ def display_diagnosis_result(disease, confidence):
 def diagnosis_page(user: User, db: Session):
     """Diagnosis page with active database session."""
     # Initialize services
-    diagnosis_service = DiagnosisService()
+    try:
+        diagnosis_service = DiagnosisService()
+    except FileNotFoundError:
+        st.error(
+            "No trained diagnosis model is available. Run "
+            "`python scripts/train_model.py` and reload the page."
+        )
+        return
     
     # Render the diagnosis form
     params = render_diagnosis_form()
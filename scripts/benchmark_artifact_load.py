@@ -0,0 +1,68 @@
+import sys
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from config.settings import DEFAULT_MODEL, ALLOWED_MODELS
+from src.ml_models.artifacts import read_manifest, verify_artifact
+from src.ml_models.factory import create_model, get_model_class
+from src.ml_models.training_data import make_synthetic_dataset
+from scripts.benchmark_utils import time_calls, summarize, print_table
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare load time of compressed and uncompressed model artifacts."
+    )
+    parser.add_argument("--model", choices=ALLOWED_MODELS, default=DEFAULT_MODEL)
+    parser.add_argument("--train-rows", type=int, default=50000)
+    parser.add_argument("--compress", type=int, nargs="+", default=[0, 3, 9])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"🧠 Training {args.model} on {args.train_rows} synthetic rows...")
+    model = create_model(args.model)
+    model.train(*make_synthetic_dataset(args.train_rows))
+    record = dict(zip(model.feature_names, make_synthetic_dataset(1, random_state=7)[0][0]))
+    model_class = get_model_class(args.model)
+
+    rows = []
+    for compress in args.compress:
+        with tempfile.TemporaryDirectory() as model_dir:
+            start = time.perf_counter()
+            path = model.save_artifact(Path(model_dir), compress=compress)
+            save_time = time.perf_counter() - start
+            manifest = read_manifest(path)
+
+            def load_and_predict():
+                model_class.from_artifact(path).get_prediction_with_confidence(record)
+
+            rows.append({
+                'compress': compress,
+                'size_mib': sum(f['bytes'] for f in manifest['files'].values()) / 2**20,
+                'save_s': save_time,
+                'manifest_ms': summarize(time_calls(
+                    lambda: read_manifest(path), repeat=args.repeat, warmup=1
+                ))['p50_ms'],
+                'load_ms': summarize(time_calls(
+                    lambda: model_class.from_artifact(path), repeat=args.repeat, warmup=1
+                ))['p50_ms'],
+                'load_predict_ms': summarize(time_calls(
+                    load_and_predict, repeat=args.repeat, warmup=1
+                ))['p50_ms'],
+                'verify_ms': summarize(time_calls(
+                    lambda: verify_artifact(path, manifest), repeat=args.repeat, warmup=1
+                ))['p50_ms'],
+            })
+
+    print(f"\n{args.model} artifact load times (median of {args.repeat}, warm page cache):")
+    print_table(rows, [
+        'compress', 'size_mib', 'save_s', 'manifest_ms', 'load_ms', 'load_predict_ms', 'verify_ms'
+    ])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import sys
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+import numpy as np
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from config.settings import DEFAULT_MODEL, MICRO_BATCH_MAX_SIZE, MICRO_BATCH_MAX_WAIT_MS
+from src.ml_models.batching import MicroBatcher
+from src.ml_models.factory import create_model
+from src.ml_models.registry import ModelRegistry
+from src.ml_models.training_data import make_synthetic_dataset
+from scripts.benchmark_utils import summarize, print_table
+
+def run_callers(predict, records: list, callers: int) -> dict:
+    """Split records across concurrent callers and time every request."""
+    shares = [records[i::callers] for i in range(callers)]
+    latencies = [np.empty(len(share)) for share in shares]
+    barrier = threading.Barrier(callers + 1)
+
+    def caller(index: int) -> None:
+        barrier.wait()
+        for i, record in enumerate(shares[index]):
+            start = time.perf_counter()
+            predict(record)
+            latencies[index][i] = time.perf_counter() - start
+
+    threads = [threading.Thread(target=caller, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    stats = summarize(np.concatenate(latencies))
+    stats['requests_per_s'] = len(records) / elapsed
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare direct and micro-batched prediction throughput under concurrency."
+    )
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--train-rows", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--callers", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--max-batch-size", type=int, default=MICRO_BATCH_MAX_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=MICRO_BATCH_MAX_WAIT_MS)
+    args = parser.parse_args()
+
+    X_train, y_train = make_synthetic_dataset(args.train_rows)
+    # Distinct records, so the prediction cache never answers for the model
+    X_test, _ = make_synthetic_dataset(args.requests, random_state=7)
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        print(f"🧠 Training {args.model} on {args.train_rows} synthetic rows...")
+        model = create_model(args.model)
+        model.train(X_train, y_train)
+        model.save_artifact(Path(model_dir))
+        registry = ModelRegistry(Path(model_dir))
+        model = registry.get(args.model)
+        records = [dict(zip(model.feature_names, row)) for row in X_test]
+
+        rows = []
+        for callers in args.callers:
+            model.prediction_cache.clear()
+            direct = run_callers(model.get_prediction_with_confidence, records, callers)
+
+            batcher = MicroBatcher(
+                args.model, args.max_batch_size, args.max_wait_ms, registry=registry
+            )
+            batcher.start()
+            batched = run_callers(batcher.get_prediction_with_confidence, records, callers)
+            batcher.stop()
+
+            for mode, stats in [("direct", direct), ("batched", batched)]:
+                rows.append({
+                    'callers': callers,
+                    'mode': mode,
+                    'requests_per_s': f"{stats['requests_per_s']:,.0f}",
+                    'p50_ms': stats['p50_ms'],
+                    'p99_ms': stats['p99_ms'],
+                    'mean_batch': batcher.stats()['mean_batch_size'] if mode == "batched" else 1.0,
+                })
+
+    print(f"\n{args.requests} requests to {args.model}, batches of up to "
+          f"{args.max_batch_size} rows or {args.max_wait_ms} ms:")
+    print_table(rows, ['callers', 'mode', 'requests_per_s', 'p50_ms', 'p99_ms', 'mean_batch'])
+
+if __name__ == "__main__":
+    main()
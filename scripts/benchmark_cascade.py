@@ -0,0 +1,87 @@
+import sys
+import argparse
+import itertools
+import tempfile
+from pathlib import Path
+import numpy as np
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from config.settings import CASCADE_FAST_MODEL, CASCADE_UNCERTAINTY_BAND, DEFAULT_MODEL
+from src.ml_models.cascade import CascadeModel
+from src.ml_models.factory import create_model
+from src.ml_models.registry import ModelRegistry
+from src.ml_models.training_data import make_synthetic_dataset
+from scripts.benchmark_utils import time_calls, summarize, print_table
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report how often the cascade short-circuits and the latency it saves."
+    )
+    parser.add_argument("--train-rows", type=int, default=5000)
+    parser.add_argument("--test-rows", type=int, default=2000)
+    parser.add_argument(
+        "--band-high", type=float, nargs="+",
+        default=[0.7, 0.8, 0.9, CASCADE_UNCERTAINTY_BAND[1], 0.95, 0.99]
+    )
+    args = parser.parse_args()
+
+    X_train, y_train = make_synthetic_dataset(args.train_rows)
+    X_test, _ = make_synthetic_dataset(args.test_rows, random_state=7)
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        for name in (CASCADE_FAST_MODEL, DEFAULT_MODEL):
+            print(f"🧠 Training {name} on {args.train_rows} synthetic rows...")
+            model = create_model(name)
+            model.train(X_train, y_train)
+            model.save_artifact(Path(model_dir))
+        registry = ModelRegistry(Path(model_dir))
+        slow = registry.get(DEFAULT_MODEL)
+
+        records = [dict(zip(slow.feature_names, row)) for row in X_test]
+        reference, _ = slow.predict_batch(X_test)
+        slow_only = summarize(time_calls(
+            lambda cycle=itertools.cycle(records): slow.get_prediction_with_confidence(next(cycle)),
+            repeat=len(records)
+        ))
+
+        rows = [{
+            'band': f"{DEFAULT_MODEL} only",
+            'short_circuit': 0.0,
+            'agreement': 1.0,
+            'p50_ms': slow_only['p50_ms'],
+            'p99_ms': slow_only['p99_ms'],
+            'mean_ms': slow_only['mean_ms'],
+            'saved_s': 0.0,
+        }]
+        for band_high in sorted(set(args.band_high)):
+            cascade = CascadeModel(
+                CASCADE_FAST_MODEL, DEFAULT_MODEL,
+                band=(CASCADE_UNCERTAINTY_BAND[0], band_high), registry=registry
+            )
+            predictions, _, _ = cascade.predict_batch(X_test)
+            cascade.stats.reset()
+            latency = summarize(time_calls(
+                lambda cycle=itertools.cycle(records): cascade.get_prediction_with_confidence(next(cycle)),
+                repeat=len(records), warmup=0
+            ))
+            report = cascade.stats.report()
+            rows.append({
+                'band': f"[{CASCADE_UNCERTAINTY_BAND[0]}, {band_high})",
+                'short_circuit': report['short_circuit_fraction'],
+                'agreement': float(np.mean(predictions == reference)),
+                'p50_ms': latency['p50_ms'],
+                'p99_ms': latency['p99_ms'],
+                'mean_ms': latency['mean_ms'],
+                'saved_s': report['estimated_seconds_saved'],
+            })
+
+    print(f"\nCascade {CASCADE_FAST_MODEL} -> {DEFAULT_MODEL} over {args.test_rows} single-row requests:")
+    print_table(rows, [
+        'band', 'short_circuit', 'agreement', 'p50_ms', 'p99_ms', 'mean_ms', 'saved_s'
+    ])
+
+if __name__ == "__main__":
+    main()
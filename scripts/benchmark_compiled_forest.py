@@ -0,0 +1,54 @@
+import sys
+import argparse
+from pathlib import Path
+import numpy as np
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.ml_models.random_forest import RandomForestModel
+from src.ml_models.training_data import make_synthetic_dataset
+from scripts.benchmark_utils import time_calls, summarize, print_table
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the compiled forest against sklearn predict_proba."
+    )
+    parser.add_argument("--train-rows", type=int, default=20000)
+    parser.add_argument("--check-rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"🧠 Training random forest on {args.train_rows} synthetic rows...")
+    model = RandomForestModel()
+    X, y = make_synthetic_dataset(args.train_rows)
+    model.train(X, y)
+    compiled = model.compiled
+    print(f"   {compiled.n_trees} trees, {len(compiled.feature)} nodes, depth {compiled.max_depth}")
+
+    X_check, _ = make_synthetic_dataset(args.check_rows, random_state=7)
+    expected = model.model.predict_proba(model.scaler.transform(X_check))
+    actual = compiled.predict_proba(X_check)
+    if np.array_equal(expected, actual):
+        print(f"✅ Probabilities identical on {args.check_rows} rows")
+    else:
+        print(f"❌ Max probability difference {np.abs(expected - actual).max():.3e}")
+        sys.exit(1)
+
+    rows = []
+    for name, predict_proba in [
+        ("sklearn", lambda X: model.model.predict_proba(model.scaler.transform(X))),
+        ("compiled", compiled.predict_proba),
+    ]:
+        samples = time_calls(
+            lambda: predict_proba(X_check[np.random.randint(len(X_check))][None, :]),
+            repeat=args.repeat
+        )
+        rows.append({'engine': name, **summarize(samples)})
+
+    print("\nSingle-row predict_proba latency (scaling included):")
+    print_table(rows, ['engine', 'p50_ms', 'p99_ms', 'mean_ms'])
+
+if __name__ == "__main__":
+    main()
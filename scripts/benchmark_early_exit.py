@@ -0,0 +1,86 @@
+import sys
+import argparse
+import itertools
+import time
+from pathlib import Path
+import numpy as np
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.ml_models.random_forest import RandomForestModel
+from src.ml_models.compiled_forest import EARLY_EXIT_TREE_CHUNK
+from src.ml_models.training_data import make_synthetic_dataset
+from scripts.benchmark_utils import time_calls, summarize, print_table
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Trace latency against agreement for early-exit forest voting."
+    )
+    parser.add_argument("--train-rows", type=int, default=5000)
+    parser.add_argument("--test-rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=1000)
+    parser.add_argument("--tree-chunk", type=int, default=EARLY_EXIT_TREE_CHUNK)
+    parser.add_argument(
+        "--tolerance", type=float, nargs="+",
+        default=[0.0, 0.25, 0.5, 0.75, 0.9]
+    )
+    args = parser.parse_args()
+
+    print(f"🧠 Training random forest on {args.train_rows} synthetic rows...")
+    model = RandomForestModel()
+    model.train(*make_synthetic_dataset(args.train_rows))
+    # A wider spread leaves more borderline rows, which is where exits are late
+    X_test, _ = make_synthetic_dataset(args.test_rows, random_state=7, spread=3.0)
+    records = [dict(zip(model.feature_names, row)) for row in X_test[:args.repeat]]
+
+    reference, reference_proba, reference_confidence = model.predict_with_proba(X_test)
+    full = summarize(time_calls(
+        lambda cycle=itertools.cycle(records): model.get_prediction_with_confidence(next(cycle)),
+        repeat=args.repeat
+    ))
+    start = time.perf_counter()
+    model.predict_with_proba(X_test)
+    full_batch = time.perf_counter() - start
+
+    rows = [{
+        'tolerance': 'full',
+        'mean_trees': float(model.compiled.n_trees),
+        'agreement': 1.0,
+        'max_conf_diff': 0.0,
+        'single_p50_ms': full['p50_ms'],
+        'single_p99_ms': full['p99_ms'],
+        'batch_s': full_batch,
+    }]
+    for tolerance in sorted(set(args.tolerance)):
+        start = time.perf_counter()
+        predictions, _, confidences, trees_used = model.predict_early_exit(
+            X_test, tree_chunk=args.tree_chunk, tolerance=tolerance
+        )
+        batch_time = time.perf_counter() - start
+        single = summarize(time_calls(
+            lambda cycle=itertools.cycle(records): model.get_prediction_with_confidence_early_exit(
+                next(cycle), tree_chunk=args.tree_chunk, tolerance=tolerance
+            ),
+            repeat=args.repeat
+        ))
+        rows.append({
+            'tolerance': tolerance,
+            'mean_trees': float(trees_used.mean()),
+            'agreement': float(np.mean(predictions == reference)),
+            'max_conf_diff': float(np.abs(confidences - reference_confidence).max()),
+            'single_p50_ms': single['p50_ms'],
+            'single_p99_ms': single['p99_ms'],
+            'batch_s': batch_time,
+        })
+
+    print(f"\nEarly exit over {model.compiled.n_trees} trees in chunks of {args.tree_chunk}, "
+          f"{args.test_rows} rows:")
+    print_table(rows, [
+        'tolerance', 'mean_trees', 'agreement', 'max_conf_diff',
+        'single_p50_ms', 'single_p99_ms', 'batch_s'
+    ])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""Latency benchmarks of the request hot path on small and large SQLite datasets.
+
+Run as a script::
+
+    python scripts/benchmark_hot_path.py --output results.json --baseline previous.json
+
+or under pytest, one test per case and dataset::
+
+    pytest scripts/benchmark_hot_path.py
+
+Under pytest the results are written to BENCHMARK_OUTPUT (default
+benchmark_results/hot_path-<timestamp>.json) and, when BENCHMARK_BASELINE
+points at an earlier result file, a case whose p50 grew by more than
+BENCHMARK_MAX_REGRESSION (default 0.25) fails.
+"""
+import os
+import sys
+import json
+import shutil
+import argparse
+import platform
+import itertools
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+import numpy as np
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from src.database.database import Base, instrument_engine
+from src.database.models import PatientRecord, User
+from src.ml_models.preprocessing import FEATURE_NAMES
+from src.ml_models.random_forest import RandomForestModel
+from src.ml_models.registry import model_registry
+from src.ml_models.training_data import make_synthetic_dataset
+from src.services.auth_service import authenticate_user
+from src.services.diagnosis_service import DiagnosisService
+from scripts.benchmark_utils import time_calls, summarize, print_table
+from scripts.generate_synthetic_data import (
+    SYNTHETIC_PASSWORD, blood_pressure_readings, parse_args, populate
+)
+
+# Patients generated per dataset
+DATASETS = {
+    'small': int(os.getenv('BENCHMARK_SMALL_PATIENTS', '200')),
+    'large': int(os.getenv('BENCHMARK_LARGE_PATIENTS', '50000')),
+}
+# Timed calls per case; password hashing is deliberately slow
+REPEATS = {
+    'preprocess_data': 1000,
+    'rf_predict': 1000,
+    'rf_get_confidence_score': 1000,
+    'predict_disease': 200,
+    'authenticate_user': 10,
+    'history_query': 500,
+}
+WARMUP = 5
+DATA_DIR = Path(tempfile.gettempdir()) / 'medical-diagnosis-benchmarks'
+RESULTS_DIR = project_root / 'benchmark_results'
+
+def form_records(n_records: int, random_state: int = 7) -> List[Dict[str, object]]:
+    """Distinct submissions shaped like the diagnosis form, blood pressure as a string."""
+    X, _ = make_synthetic_dataset(n_records, random_state=random_state)
+    readings = blood_pressure_readings(X[:, 1], np.random.default_rng(random_state))
+    records = []
+    for row, reading in zip(X, readings):
+        record = dict(zip(FEATURE_NAMES, np.round(row, 1).tolist()))
+        record['blood_pressure'] = str(reading)
+        record['age'] = int(row[FEATURE_NAMES.index('age')])
+        records.append(record)
+    return records
+
+def dataset_path(name: str, patients: int, rebuild: bool = False) -> Path:
+    """Pristine SQLite file for a dataset, generated once and reused."""
+    path = DATA_DIR / f"{name}-{patients}.db"
+    if path.exists() and not rebuild:
+        return path
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    building = path.with_suffix('.building')
+    building.unlink(missing_ok=True)
+    engine = create_engine(f"sqlite:///{building}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        populate(db, parse_args([
+            '--patients', str(patients), '--clinicians', '20', '--prefix', name
+        ]), verbose=False)
+    finally:
+        db.close()
+        engine.dispose()
+    os.replace(building, path)
+    return path
+
+@contextmanager
+def benchmark_model(model_dir: Path) -> Iterator[None]:
+    """Save a random forest artifact and serve it from the shared registry meanwhile.
+
+    The service reads the process-wide registry, so it is pointed at
+    ``model_dir`` for the duration and then restored, without the
+    benchmark model left loaded.
+    """
+    model = RandomForestModel()
+    model.train_and_evaluate(*make_synthetic_dataset(5000))
+    model.save_artifact(model_dir)
+    previous_dir = model_registry.model_dir
+    model_registry.model_dir = model_dir
+    model_registry.unload()
+    try:
+        yield
+    finally:
+        model_registry.model_dir = previous_dir
+        model_registry.unload()
+
+class HotPathBenchmark:
+    """One dataset's database copy, service and inputs for every case."""
+
+    def __init__(self, name: str, patients: int, work_dir: Path, rebuild: bool = False):
+        self.name = name
+        self.patients = patients
+        # predict_disease writes rows, so every run starts from a fresh copy
+        database = work_dir / f"{name}.db"
+        shutil.copyfile(dataset_path(name, patients, rebuild), database)
+        self.engine = create_engine(
+            f"sqlite:///{database}", connect_args={"check_same_thread": False}
+        )
+        # Same per-statement accounting as the application engine
+        instrument_engine(self.engine)
+        self.db = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)()
+
+        self.service = DiagnosisService('random_forest')
+        self.model = self.service.model
+        rng = np.random.default_rng(0)
+        self.records = form_records(max(REPEATS.values()) + WARMUP)
+        self.features = [self.model.preprocess_data(record) for record in self.records]
+        record_ids = self.db.execute(select(PatientRecord.record_id)).scalars().all()
+        usernames = self.db.execute(
+            select(User.username).where(User.role == 'patient')
+        ).scalars().all()
+        self.record_ids = rng.choice(record_ids, size=len(self.records)).tolist()
+        self.usernames = rng.choice(usernames, size=len(self.records)).tolist()
+
+    def close(self) -> None:
+        self.db.close()
+        self.engine.dispose()
+
+    def cases(self) -> Dict[str, Callable[[], object]]:
+        """Callables that each run one hot-path call on the next input."""
+        records = itertools.cycle(self.records)
+        features = itertools.cycle(self.features)
+        submissions = itertools.cycle(zip(self.records, self.record_ids))
+        usernames = itertools.cycle(self.usernames)
+        history_ids = itertools.cycle(self.record_ids)
+        return {
+            'preprocess_data': lambda: self.model.preprocess_data(next(records)),
+            'rf_predict': lambda: self.model.predict(next(features)),
+            'rf_get_confidence_score': lambda: self.model.get_confidence_score(next(features)),
+            # Inserts the measurements and the diagnosis, one commit each
+            'predict_disease': lambda: self.service.predict_disease(self.db, *next(submissions)),
+            'authenticate_user': lambda: authenticate_user(
+                self.db, next(usernames), SYNTHETIC_PASSWORD
+            ),
+            # What history_page loads: the diagnoses and each disease name
+            'history_query': lambda: [
+                diagnosis.disease.name
+                for diagnosis in self.service.get_patient_diagnoses(self.db, next(history_ids))
+            ],
+        }
+
+    def run(self, case: str) -> Dict[str, float]:
+        # Time model calls, not hits left over from an earlier case or dataset
+        self.model.prediction_cache.clear()
+        return summarize(time_calls(self.cases()[case], repeat=REPEATS[case], warmup=WARMUP))
+
+def report(results: Dict[str, Dict[str, Dict[str, float]]]) -> Dict[str, object]:
+    """Results with enough context to compare runs."""
+    return {
+        'benchmark': 'hot_path',
+        'created_at': datetime.utcnow().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'datasets': DATASETS,
+        'results': results,
+    }
+
+def write_report(results: Dict[str, Dict[str, Dict[str, float]]], output: Optional[Path]) -> Path:
+    if output is None:
+        output = RESULTS_DIR / f"hot_path-{datetime.utcnow():%Y%m%d%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report(results), indent=2))
+    return output
+
+def regressions(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, object],
+    max_regression: float
+) -> List[Dict[str, object]]:
+    """Cases whose p50 grew by more than ``max_regression`` over the baseline."""
+    slower = []
+    for dataset, cases in results.items():
+        for case, summary in cases.items():
+            before = baseline['results'].get(dataset, {}).get(case)
+            if before is None:
+                continue
+            ratio = summary['p50_ms'] / before['p50_ms']
+            if ratio > 1 + max_regression:
+                slower.append({
+                    'dataset': dataset, 'case': case, 'baseline_p50_ms': before['p50_ms'],
+                    'p50_ms': summary['p50_ms'], 'ratio': ratio,
+                })
+    return slower
+
+# --- pytest entry point -------------------------------------------------------
+
+try:
+    import pytest
+except ImportError:
+    pytest = None
+
+if pytest is not None:
+    _results: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    @pytest.fixture(scope='module')
+    def model_dir(tmp_path_factory):
+        path = tmp_path_factory.mktemp('models')
+        with benchmark_model(path):
+            yield path
+
+    @pytest.fixture(scope='module', params=list(DATASETS))
+    def hot_path(request, model_dir, tmp_path_factory):
+        bench = HotPathBenchmark(
+            request.param, DATASETS[request.param], tmp_path_factory.mktemp(request.param)
+        )
+        yield bench
+        bench.close()
+
+    @pytest.fixture(scope='module', autouse=True)
+    def results_file():
+        yield
+        if _results:
+            path = write_report(_results, Path(os.environ['BENCHMARK_OUTPUT'])
+                                if os.getenv('BENCHMARK_OUTPUT') else None)
+            print(f"\nBenchmark results written to {path}")
+
+    @pytest.mark.parametrize('case', list(REPEATS))
+    def test_hot_path(hot_path, case):
+        summary = hot_path.run(case)
+        _results.setdefault(hot_path.name, {})[case] = summary
+        assert summary['n'] == REPEATS[case]
+
+        baseline = os.getenv('BENCHMARK_BASELINE')
+        if baseline:
+            slower = regressions(
+                {hot_path.name: {case: summary}}, json.loads(Path(baseline).read_text()),
+                float(os.getenv('BENCHMARK_MAX_REGRESSION', '0.25'))
+            )
+            assert not slower, f"p50 regression: {slower}"
+
+# --- script entry point -------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time the diagnosis hot path on small and large synthetic SQLite databases."
+    )
+    parser.add_argument("--datasets", nargs="+", choices=list(DATASETS), default=list(DATASETS))
+    parser.add_argument("--cases", nargs="+", choices=list(REPEATS), default=list(REPEATS))
+    parser.add_argument("--output", type=Path, default=None,
+                        help="JSON result file (default: benchmark_results/hot_path-<timestamp>.json)")
+    parser.add_argument("--baseline", type=Path, default=None,
+                        help="Earlier result file to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="Allowed relative p50 growth over the baseline")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Regenerate the cached synthetic databases")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    rows = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        print("🧠 Training benchmark model...")
+        with benchmark_model(Path(work_dir)):
+            for name in args.datasets:
+                print(f"🧠 Preparing {name} dataset ({DATASETS[name]} patients)...")
+                bench = HotPathBenchmark(name, DATASETS[name], Path(work_dir), args.rebuild)
+                try:
+                    for case in args.cases:
+                        summary = bench.run(case)
+                        results.setdefault(name, {})[case] = summary
+                        rows.append({'dataset': name, 'case': case, **summary})
+                finally:
+                    bench.close()
+
+    print()
+    print_table(rows, ['dataset', 'case', 'p50_ms', 'p95_ms', 'p99_ms', 'mean_ms', 'n'])
+    path = write_report(results, args.output)
+    print(f"✅ Results written to {path}")
+
+    if args.baseline:
+        slower = regressions(results, json.loads(args.baseline.read_text()), args.max_regression)
+        if slower:
+            print(f"❌ {len(slower)} case(s) slower than {args.baseline} by more than "
+                  f"{args.max_regression:.0%}:")
+            print_table(slower, ['dataset', 'case', 'baseline_p50_ms', 'p50_ms', 'ratio'])
+            sys.exit(1)
+        print(f"✅ No p50 regressions against {args.baseline}")
+
+if __name__ == "__main__":
+    main()
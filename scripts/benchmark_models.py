@@ -0,0 +1,69 @@
+import sys
+import argparse
+import itertools
+import time
+from pathlib import Path
+import numpy as np
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from config.settings import ALLOWED_MODELS
+from src.ml_models.factory import create_model
+from src.ml_models.training_data import make_synthetic_dataset
+from scripts.benchmark_utils import time_calls, summarize, print_table
+
+def to_records(X: np.ndarray, feature_names) -> list:
+    """Turn raw feature rows into the dicts the diagnosis form submits."""
+    return [dict(zip(feature_names, row)) for row in X]
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare latency and accuracy of all diagnosis models."
+    )
+    parser.add_argument("--train-rows", type=int, default=5000)
+    parser.add_argument("--test-rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+
+    X_train, y_train = make_synthetic_dataset(args.train_rows)
+    X_test, y_test = make_synthetic_dataset(args.test_rows, random_state=7)
+
+    rows = []
+    for name in ALLOWED_MODELS:
+        print(f"🧠 Training {name} on {args.train_rows} synthetic rows...")
+        model = create_model(name)
+        start = time.perf_counter()
+        model.train(X_train, y_train)
+        training_time = time.perf_counter() - start
+
+        metrics = model.evaluate_model(model.scale_features(X_test), y_test)
+        records = itertools.cycle(to_records(X_test[:args.repeat], model.feature_names))
+        single = summarize(time_calls(
+            lambda: model.get_prediction_with_confidence(next(records)),
+            repeat=args.repeat
+        ))
+
+        start = time.perf_counter()
+        model.predict_batch(X_test)
+        batch_time = time.perf_counter() - start
+
+        rows.append({
+            'model': name,
+            'accuracy': metrics['accuracy'],
+            'f1_score': metrics['f1_score'],
+            'train_s': training_time,
+            'single_p50_ms': single['p50_ms'],
+            'single_p99_ms': single['p99_ms'],
+            'batch_rows_per_s': f"{args.test_rows / batch_time:,.0f}",
+        })
+
+    print()
+    print_table(rows, [
+        'model', 'accuracy', 'f1_score', 'train_s',
+        'single_p50_ms', 'single_p99_ms', 'batch_rows_per_s'
+    ])
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import time
+import numpy as np
+from typing import Callable, Dict, List
+
+def time_calls(func: Callable[[], object], repeat: int = 1000, warmup: int = 20) -> np.ndarray:
+    """Time repeated calls of ``func`` and return each latency in seconds."""
+    for _ in range(warmup):
+        func()
+    samples = np.empty(repeat)
+    for i in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples[i] = time.perf_counter() - start
+    return samples
+
+def summarize(samples: np.ndarray) -> Dict[str, float]:
+    """Latency percentiles of a sample, in milliseconds."""
+    samples_ms = np.asarray(samples) * 1000
+    return {
+        'p50_ms': float(np.percentile(samples_ms, 50)),
+        'p95_ms': float(np.percentile(samples_ms, 95)),
+        'p99_ms': float(np.percentile(samples_ms, 99)),
+        'mean_ms': float(samples_ms.mean()),
+        'n': int(len(samples_ms)),
+    }
+
+def print_table(rows: List[Dict[str, object]], columns: List[str]) -> None:
+    """Print benchmark rows as an aligned text table."""
+    widths = {
+        column: max(len(column), *(len(_format(row.get(column))) for row in rows))
+        for column in columns
+    }
+    print("  ".join(column.ljust(widths[column]) for column in columns))
+    for row in rows:
+        print("  ".join(_format(row.get(column)).ljust(widths[column]) for column in columns))
+
+def _format(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:.4f}"
+    return str(value)
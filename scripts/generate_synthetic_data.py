@@ -0,0 +1,321 @@
+import sys
+import time
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from sqlalchemy import func, insert, select, text
+from src.database.database import SessionLocal, init_db
+from src.database.models import Diagnosis, Disease, MedicalParameter, PatientRecord, User
+from src.ml_models.training_data import LABEL_NAMES, sample_cluster_features
+from src.services.auth_service import get_password_hash
+
+# Every synthetic account shares this password, hashed once
+SYNTHETIC_PASSWORD = "Synthetic123!"
+BLOOD_TYPES = ['O+', 'O-', 'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-']
+GENDERS = ['female', 'male']
+
+def next_id(db, column) -> int:
+    """First free primary key of a table."""
+    return (db.execute(select(func.max(column))).scalar() or 0) + 1
+
+def label_disease_ids(db) -> np.ndarray:
+    """Disease id of every model label, indexed by the label.
+
+    Diseases are matched to LABEL_NAMES by name, never by id, since an
+    existing database may already use the label numbers for other
+    diseases. A missing disease is created, keeping the label as its id
+    when that id is free. Training reads the diagnoses' disease ids as
+    labels and predict_disease looks predictions up by id, so a model
+    trained on this data predicts the right diseases.
+    """
+    by_name = dict(db.execute(select(Disease.name, Disease.disease_id)).all())
+    taken = set(by_name.values())
+    disease_ids = np.empty(max(LABEL_NAMES) + 1, dtype=np.int64)
+    missing = []
+    for label, name in LABEL_NAMES.items():
+        disease_id = by_name.get(name)
+        if disease_id is None:
+            disease_id = label if label not in taken else max(taken) + 1
+            taken.add(disease_id)
+            missing.append({
+                'disease_id': disease_id, 'name': name,
+                'description': f"{name} (model label {label})"
+            })
+        disease_ids[label] = disease_id
+    if missing:
+        db.execute(insert(Disease.__table__), missing)
+        db.commit()
+    return disease_ids
+
+def blood_pressure_readings(mean_arterial: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Systolic/diastolic strings whose mean arterial pressure matches the feature."""
+    pulse = rng.normal(45, 8, size=len(mean_arterial)).clip(25, 70)
+    diastolic = np.rint(mean_arterial - pulse / 3)
+    systolic = np.rint(diastolic + pulse)
+    return np.char.add(np.char.add(systolic.astype(int).astype(str), '/'),
+                       diastolic.astype(int).astype(str))
+
+def insert_batches(db, model, rows: List[Dict], batch_size: int) -> None:
+    """Bulk insert plain dictionaries, one executemany per batch.
+
+    Goes through the Core table rather than the ORM, which would split a
+    batch by which columns are None and add per-row bookkeeping.
+    """
+    for start in range(0, len(rows), batch_size):
+        db.execute(insert(model.__table__), rows[start:start + batch_size])
+
+def create_clinicians(db, count: int, prefix: str, password_hash: str) -> np.ndarray:
+    """Create the doctor accounts that review diagnoses and return their ids."""
+    first_id = next_id(db, User.user_id)
+    ids = np.arange(first_id, first_id + count)
+    db.execute(insert(User.__table__), [
+        {
+            'user_id': int(user_id),
+            'username': f"{prefix}_doctor_{user_id}",
+            'email': f"{prefix}_doctor_{user_id}@example.com",
+            'password_hash': password_hash,
+            'first_name': "Doctor",
+            'last_name': str(user_id),
+            'role': 'doctor',
+        }
+        for user_id in ids
+    ])
+    db.commit()
+    return ids
+
+def generate_patients(
+    db,
+    n_patients: int,
+    rng: np.random.Generator,
+    first_user_id: int,
+    first_record_id: int,
+    first_parameter_id: int,
+    first_diagnosis_id: int,
+    clinicians: np.ndarray,
+    disease_ids: np.ndarray,
+    args: argparse.Namespace,
+    password_hash: str,
+) -> Dict[str, int]:
+    """Generate and insert one chunk of patients with their full history."""
+    user_ids = np.arange(first_user_id, first_user_id + n_patients)
+    record_ids = np.arange(first_record_id, first_record_id + n_patients)
+    now = datetime.utcnow()
+
+    # Each patient belongs to one cluster; some progress one stage over time
+    labels = rng.choice(list(LABEL_NAMES), size=n_patients, p=args.class_weights)
+    baseline = sample_cluster_features(labels, rng, args.spread)
+    ages = baseline[:, 6].clip(18, 95)
+    progresses = (rng.random(n_patients) < args.progression_rate) & (labels < max(LABEL_NAMES))
+    birth_dates = [now - timedelta(days=float(age) * 365.25) for age in ages]
+
+    users = [
+        {
+            'user_id': int(user_id),
+            'username': f"{args.prefix}_patient_{user_id}",
+            'email': f"{args.prefix}_patient_{user_id}@example.com",
+            'password_hash': password_hash,
+            'first_name': "Patient",
+            'last_name': str(user_id),
+            'date_of_birth': birth_date,
+            'gender': GENDERS[i % 2],
+            'role': 'patient',
+            'created_at': now,
+            'updated_at': now,
+        }
+        for i, (user_id, birth_date) in enumerate(zip(user_ids, birth_dates))
+    ]
+    heights = rng.normal(170, 10, size=n_patients).clip(140, 210)
+    records = [
+        {
+            'record_id': int(record_id),
+            'user_id': int(user_id),
+            'blood_type': BLOOD_TYPES[int(blood_type)],
+            'height': round(float(height), 1),
+            'weight': round(float(bmi * (height / 100) ** 2), 1),
+            'created_at': now,
+            'updated_at': now,
+        }
+        for record_id, user_id, blood_type, height, bmi in zip(
+            record_ids, user_ids, rng.integers(len(BLOOD_TYPES), size=n_patients),
+            heights, baseline[:, 4].clip(15, 60)
+        )
+    ]
+
+    # Measurement time series: visits spread over the history window, with
+    # small visit-to-visit noise and a shift toward the next cluster for
+    # patients who progress
+    visits = rng.poisson(args.measurements - 1, size=n_patients) + 1
+    owner = np.repeat(np.arange(n_patients), visits)
+    n_measurements = len(owner)
+    days_ago = rng.uniform(0, args.history_days, size=n_measurements)
+    # Oldest first within each patient so progress runs forward in time
+    order = np.lexsort((-days_ago, owner))
+    days_ago = days_ago[order]
+    progress = 1 - days_ago / args.history_days
+
+    target = baseline.copy()
+    target[progresses] = sample_cluster_features(labels[progresses] + 1, rng, args.spread)
+    features = baseline[owner] + (target - baseline)[owner] * progress[:, None]
+    features = (features * rng.normal(1, 0.03, size=features.shape)).clip(0.1, None)
+    progressed = progresses[owner]
+    measurement_dates = [now - timedelta(days=float(d)) for d in days_ago]
+    ages_then = (ages[owner] - days_ago / 365.25).clip(1, None).astype(int)
+    readings = blood_pressure_readings(features[:, 1], rng)
+    parameter_ids = np.arange(first_parameter_id, first_parameter_id + n_measurements)
+
+    parameters = [
+        {
+            'parameter_id': int(parameter_ids[i]),
+            'record_id': int(record_ids[owner[i]]),
+            'glucose_level': round(float(features[i, 0]), 1),
+            'blood_pressure': str(readings[i]),
+            'skin_thickness': round(float(features[i, 2]), 1),
+            'insulin_level': round(float(features[i, 3]), 1),
+            'bmi': round(float(features[i, 4]), 1),
+            'diabetes_pedigree_function': round(float(features[i, 5]), 3),
+            'age': int(ages_then[i]),
+            'measurement_date': measurement_dates[i],
+        }
+        for i in range(n_measurements)
+    ]
+
+    # Some visits end in a diagnosis shortly after the measurement; its label
+    # is the stage the patient has reached, occasionally mislabelled
+    diagnosed = np.flatnonzero(rng.random(n_measurements) < args.diagnosis_rate)
+    stage = labels[owner[diagnosed]] + (progressed[diagnosed] & (progress[diagnosed] > 0.5))
+    noisy = rng.random(len(diagnosed)) < args.label_noise
+    stage[noisy] = rng.choice(list(LABEL_NAMES), size=noisy.sum())
+    reviewed = rng.random(len(diagnosed)) < args.reviewed_fraction
+    reviewers = rng.choice(clinicians, size=len(diagnosed)) if len(clinicians) else None
+    confidences = rng.uniform(55, 99, size=len(diagnosed))
+    delays = rng.uniform(0, 2, size=len(diagnosed))
+    diagnoses = [
+        {
+            'diagnosis_id': first_diagnosis_id + j,
+            'record_id': int(record_ids[owner[i]]),
+            'disease_id': int(disease_ids[stage[j]]),
+            'confidence_score': round(float(confidences[j]), 2),
+            'diagnosis_date': min(measurement_dates[i] + timedelta(hours=float(delays[j])), now),
+            'notes': "Synthetic diagnosis",
+            'model_version': "synthetic",
+            'status': 'confirmed' if reviewed[j] and reviewers is not None else 'pending',
+            'reviewed_by': int(reviewers[j]) if reviewed[j] and reviewers is not None else None,
+        }
+        for j, i in enumerate(diagnosed)
+    ]
+
+    insert_batches(db, User, users, args.batch_size)
+    insert_batches(db, PatientRecord, records, args.batch_size)
+    insert_batches(db, MedicalParameter, parameters, args.batch_size)
+    insert_batches(db, Diagnosis, diagnoses, args.batch_size)
+    db.commit()
+    return {
+        'users': len(users),
+        'records': len(records),
+        'measurements': len(parameters),
+        'diagnoses': len(diagnoses),
+    }
+
+def reset_sequences(db) -> None:
+    """Move PostgreSQL id sequences past the explicitly inserted keys."""
+    if db.get_bind().dialect.name != 'postgresql':
+        return
+    for model, column in [
+        (User, 'user_id'), (PatientRecord, 'record_id'),
+        (MedicalParameter, 'parameter_id'), (Diagnosis, 'diagnosis_id'),
+    ]:
+        table = model.__tablename__
+        db.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', '{column}'), "
+            f"COALESCE((SELECT MAX({column}) FROM {table}), 1))"
+        ))
+    db.commit()
+
+def populate(db, args: argparse.Namespace, verbose: bool = True) -> Dict[str, int]:
+    """Insert the clinicians and patients described by ``args`` and return row counts."""
+    rng = np.random.default_rng(args.seed)
+    password_hash = get_password_hash(SYNTHETIC_PASSWORD)
+    disease_ids = label_disease_ids(db)
+    if verbose:
+        print("  Labels stored as disease ids " + ", ".join(
+            f"{name}={disease_ids[label]}" for label, name in LABEL_NAMES.items()
+        ))
+    clinicians = create_clinicians(db, args.clinicians, args.prefix, password_hash)
+    totals = {'users': 0, 'records': 0, 'measurements': 0, 'diagnoses': 0}
+    start = time.perf_counter()
+    for done in range(0, args.patients, args.chunk_size):
+        counts = generate_patients(
+            db, min(args.chunk_size, args.patients - done), rng,
+            next_id(db, User.user_id), next_id(db, PatientRecord.record_id),
+            next_id(db, MedicalParameter.parameter_id), next_id(db, Diagnosis.diagnosis_id),
+            clinicians, disease_ids, args, password_hash
+        )
+        for table, count in counts.items():
+            totals[table] += count
+        if verbose:
+            rows = sum(totals.values())
+            print(f"  {totals['users']}/{args.patients} patients, {rows} rows "
+                  f"({rows / (time.perf_counter() - start):.0f} rows/s)")
+    reset_sequences(db)
+    return totals
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Bulk-insert synthetic patients, measurement histories and diagnoses."
+    )
+    parser.add_argument("--patients", type=int, default=100000)
+    parser.add_argument("--measurements", type=float, default=4.0,
+                        help="Mean measurements per patient (at least one each)")
+    parser.add_argument("--diagnosis-rate", type=float, default=0.5,
+                        help="Fraction of measurements followed by a diagnosis")
+    parser.add_argument("--reviewed-fraction", type=float, default=0.9,
+                        help="Fraction of diagnoses confirmed by a clinician")
+    parser.add_argument("--label-noise", type=float, default=0.02,
+                        help="Fraction of diagnoses given a random label")
+    parser.add_argument("--progression-rate", type=float, default=0.1,
+                        help="Fraction of patients moving to the next stage over their history")
+    parser.add_argument("--class-weights", type=float, nargs=len(LABEL_NAMES),
+                        default=[0.5, 0.3, 0.2], help="Share of patients per label")
+    parser.add_argument("--spread", type=float, default=2.0,
+                        help="Cluster standard deviation multiplier")
+    parser.add_argument("--history-days", type=float, default=3 * 365)
+    parser.add_argument("--clinicians", type=int, default=50)
+    parser.add_argument("--chunk-size", type=int, default=50000,
+                        help="Patients generated and committed at a time")
+    parser.add_argument("--batch-size", type=int, default=10000,
+                        help="Rows per bulk insert statement")
+    parser.add_argument("--prefix", default=None,
+                        help="Username prefix (default: synth<timestamp>)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+    args.prefix = args.prefix or f"synth{datetime.utcnow():%Y%m%d%H%M%S}"
+    weights = np.asarray(args.class_weights)
+    args.class_weights = weights / weights.sum()
+    return args
+
+def main():
+    args = parse_args()
+    print(f"🌱 Generating {args.patients} synthetic patients in chunks of {args.chunk_size}...")
+    init_db()
+    db = SessionLocal()
+    try:
+        start = time.perf_counter()
+        totals = populate(db, args)
+        print(f"✅ Inserted {totals} in {time.perf_counter() - start:.1f}s; "
+              f"accounts use the password {SYNTHETIC_PASSWORD!r}")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error generating synthetic data: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
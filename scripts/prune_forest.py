@@ -0,0 +1,139 @@
+import sys
+import argparse
+import itertools
+from pathlib import Path
+import numpy as np
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from config.settings import MODEL_PATH
+from src.ml_models.artifacts import estimator_path, find_artifact, new_version, read_manifest
+from src.ml_models.preprocessing import FEATURE_NAMES
+from src.ml_models.pruning import prune_search
+from src.ml_models.random_forest import RandomForestModel
+from src.services.training_service import load_dataset, load_holdout_data
+from scripts.benchmark_utils import time_calls, summarize, print_table
+
+def load_validation_data(model: RandomForestModel, source: str, rows: int):
+    """Rows the forest was not trained on.
+
+    A forest trained on the database is scored on the diagnoses its
+    training held out; other forests on fresh synthetic rows.
+    """
+    if source is None:
+        source = "db" if model.batch_watermarks else "synthetic"
+    if source == "db":
+        if not model.batch_watermarks:
+            raise ValueError(
+                "The artifact was not trained on the database; its held-out rows are unknown"
+            )
+        from src.database.database import SessionLocal
+        db = SessionLocal()
+        try:
+            return load_holdout_data(db, model.batch_watermarks)
+        finally:
+            db.close()
+    X, y, _ = load_dataset("synthetic", rows, random_state=11)
+    return X, y
+
+def artifact_bytes(path: Path) -> int:
+    """Size of an artifact's files, from its manifest or, for legacy artifacts, the disk."""
+    manifest = read_manifest(path)
+    if manifest is not None:
+        return sum(f['bytes'] for f in manifest['files'].values())
+    return sum(file.stat().st_size for file in (path, estimator_path(path)) if file.exists())
+
+def profile(path: Path, X_val: np.ndarray, y_val: np.ndarray, repeat: int) -> dict:
+    """Size, load time, latency and F1 of a saved random forest artifact."""
+    model = RandomForestModel.from_artifact(path)
+    records = [dict(zip(model.feature_names, row)) for row in X_val[:repeat]]
+    latency = summarize(time_calls(
+        lambda cycle=itertools.cycle(records): model.get_prediction_with_confidence(next(cycle)),
+        repeat=len(records), warmup=0
+    ))
+    return {
+        'trees': model.compiled.n_trees,
+        'max_depth': model.compiled.max_depth,
+        'nodes': model.compiled.n_nodes,
+        'compiled_mib': model.compiled.nbytes / 2**20,
+        'artifact_mib': artifact_bytes(path) / 2**20,
+        'load_ms': summarize(time_calls(
+            lambda: RandomForestModel.from_artifact(path), repeat=10, warmup=1
+        ))['p50_ms'],
+        'row_p50_ms': latency['p50_ms'],
+        'row_p99_ms': latency['p99_ms'],
+        'f1_score': model.evaluate_model(X_val, y_val)['f1_score'],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Shrink a trained random forest while keeping weighted F1 within a tolerance."
+    )
+    parser.add_argument("--artifact", type=Path, default=None,
+                        help="Artifact to prune (default: latest random forest)")
+    parser.add_argument("--model-dir", type=Path, default=MODEL_PATH,
+                        help="Directory serving the artifact to prune")
+    parser.add_argument("--output-dir", type=Path, default=None,
+                        help="Directory the slim artifact is written to (default: <model-dir>/pruned)")
+    parser.add_argument("--promote", action="store_true",
+                        help="Write the slim artifact to --model-dir, where it is served as the "
+                             "latest version; pruned forests cannot be updated incrementally")
+    parser.add_argument("--tolerance", type=float, default=0.01,
+                        help="Largest allowed drop in weighted F1")
+    parser.add_argument("--source", choices=["synthetic", "db"], default=None,
+                        help="Validation data: the rows held out of the forest's database "
+                             "training, or fresh synthetic rows (default: db if trained on it)")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+
+    try:
+        path = args.artifact or find_artifact(RandomForestModel.name, FEATURE_NAMES, args.model_dir)
+        if path is None:
+            raise FileNotFoundError("No random forest artifact found. Run scripts/train_model.py first.")
+        model = RandomForestModel.from_artifact(path)
+        X_val, y_val = load_validation_data(model, args.source, args.rows)
+
+        print(f"🧠 Searching tree subsets and depths of {path.name} "
+              f"(F1 tolerance {args.tolerance})...")
+        best, baseline, candidates = prune_search(model.compiled, X_val, y_val, args.tolerance)
+        print_table([vars(c) for c in candidates], ['max_depth', 'n_trees', 'n_nodes', 'f1_score'])
+        print(f"✅ Keeping {best.n_trees} trees cut at depth {best.max_depth} "
+              f"(F1 {best.f1_score:.4f} vs {baseline:.4f})")
+
+        slim = RandomForestModel()
+        slim.model = None
+        slim.scaler = model.scaler
+        slim.compiled = model.compiled.prune(np.arange(best.n_trees), best.max_depth)
+        slim.version = new_version()
+        # Same training data as the source, so incremental updates and
+        # held-out validation still line up with it
+        slim.trained_at = model.trained_at
+        slim.watermark = model.watermark
+        slim.batch_watermarks = model.batch_watermarks
+        slim.label_names = model.label_names
+        slim.metrics = slim.evaluate_model(X_val, y_val)
+        output_dir = args.model_dir if args.promote else (args.output_dir or args.model_dir / "pruned")
+        slim_path = slim.save_artifact(output_dir)
+        if args.promote:
+            print(f"✅ Slim artifact promoted to {slim_path}")
+        else:
+            print(f"✅ Slim artifact saved to {slim_path}; rerun with --promote to serve it")
+
+        rows = [
+            {'artifact': 'original', **profile(path, X_val, y_val, args.repeat)},
+            {'artifact': 'pruned', **profile(slim_path, X_val, y_val, args.repeat)},
+        ]
+        print()
+        print_table(rows, [
+            'artifact', 'trees', 'max_depth', 'nodes', 'compiled_mib', 'artifact_mib',
+            'load_ms', 'row_p50_ms', 'row_p99_ms', 'f1_score'
+        ])
+    except Exception as e:
+        print(f"❌ Error pruning model: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
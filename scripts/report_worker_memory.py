@@ -0,0 +1,98 @@
+import sys
+import argparse
+import multiprocessing
+import tempfile
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.ml_models.base_model import BaseDiagnosisModel
+from src.ml_models.random_forest import RandomForestModel
+from src.ml_models.training_data import make_synthetic_dataset
+from scripts.benchmark_utils import print_table
+
+def read_memory() -> dict:
+    """Resident, proportional and private memory of this process, in MiB."""
+    fields = {}
+    with open("/proc/self/smaps_rollup") as rollup:
+        for line in rollup:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {
+        'rss': fields['Rss'],
+        'pss': fields['Pss'],
+        'private': fields['Private_Clean'] + fields['Private_Dirty'],
+    }
+
+def worker(path: str, records: list, barrier, results) -> None:
+    """Load the artifact, serve some predictions and report memory."""
+    before = read_memory()
+    model = RandomForestModel.from_artifact(Path(path))
+    for record in records:
+        model.get_prediction_with_confidence(record)
+    # Measure once every worker holds the model, so shared pages are split
+    barrier.wait()
+    after = read_memory()
+    results.put({key: after[key] - before[key] for key in after} | {'total_rss': after['rss']})
+    barrier.wait()
+
+def measure(path: Path, records: list, workers: int) -> list:
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    processes = [
+        context.Process(target=worker, args=(str(path), records, barrier, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    samples = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Report per-worker memory of pickled vs memory-mapped forest artifacts."
+    )
+    parser.add_argument("--train-rows", type=int, default=100000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"🧠 Training random forest on {args.train_rows} synthetic rows...")
+    model = RandomForestModel()
+    model.train(*make_synthetic_dataset(args.train_rows))
+    X_test, _ = make_synthetic_dataset(args.requests, random_state=7)
+    records = [dict(zip(model.feature_names, row)) for row in X_test]
+
+    rows = []
+    with tempfile.TemporaryDirectory() as model_dir:
+        legacy_path = Path(model_dir) / "random_forest-legacy.joblib"
+        # The previous format: one pickle holding the sklearn estimator
+        BaseDiagnosisModel.save_model(model, str(legacy_path))
+        mapped_path = model.save_artifact(Path(model_dir))
+
+        for label, path in [("pickled", legacy_path), ("memory-mapped", mapped_path)]:
+            print(f"🧠 Starting {args.workers} workers on the {label} artifact...")
+            samples = measure(path, records, args.workers)
+            rows.append({
+                'format': label,
+                'model_rss_mib': sum(s['rss'] for s in samples) / len(samples),
+                'model_pss_mib': sum(s['pss'] for s in samples) / len(samples),
+                'model_private_mib': sum(s['private'] for s in samples) / len(samples),
+                'worker_rss_mib': sum(s['total_rss'] for s in samples) / len(samples),
+                'all_workers_pss_mib': sum(s['pss'] for s in samples),
+            })
+
+    print(f"\nMemory added by loading the model, per worker ({args.workers} workers):")
+    print_table(rows, [
+        'format', 'model_rss_mib', 'model_pss_mib', 'model_private_mib',
+        'worker_rss_mib', 'all_workers_pss_mib'
+    ])
+
+if __name__ == "__main__":
+    main()
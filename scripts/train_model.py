@@ -0,0 +1,109 @@
+import sys
+import argparse
+from pathlib import Path
+from typing import Optional
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from config.settings import MODEL_PATH, ALLOWED_MODELS, DEFAULT_MODEL, ARTIFACT_COMPRESSION
+from src.ml_models.factory import create_model
+
+def train_model(model_name: str, model_dir: Path, compress: int = ARTIFACT_COMPRESSION) -> Path:
+    """Train the model offline and write a versioned artifact."""
+    model = create_model(model_name)
+    metrics = model.train_default()
+
+    print("Model Performance Metrics:")
+    for metric, value in metrics.items():
+        print(f"{metric}: {value:.4f}")
+
+    return model.save_artifact(model_dir, compress=compress)
+
+def train_model_from_database(
+    model_name: str,
+    model_dir: Path,
+    compress: int = ARTIFACT_COMPRESSION,
+    fetch_size: Optional[int] = None
+) -> Path:
+    """Train on reviewed diagnoses, write an artifact and record its metrics."""
+    from src.database.database import SessionLocal
+    from src.services.diagnosis_service import DiagnosisService
+    from src.services.training_service import (
+        TRAINING_FETCH_SIZE, disease_names, load_training_data
+    )
+
+    db = SessionLocal()
+    try:
+        X, y, watermark = load_training_data(db, fetch_size=fetch_size or TRAINING_FETCH_SIZE)
+        if len(y) == 0:
+            raise ValueError("No reviewed diagnoses with medical parameters found")
+        print(f"Loaded {len(y)} reviewed diagnoses up to id {watermark}")
+
+        model = create_model(model_name)
+        metrics = model.train_and_evaluate(X, y)
+        # Incremental updates continue after the last diagnosis trained on
+        model.watermark = watermark
+        model.batch_watermarks = [watermark]
+        model.label_names = disease_names(db, model.classes_)
+        print("Model Performance Metrics:")
+        for metric, value in metrics.items():
+            print(f"{metric}: {value:.4f}")
+
+        path = model.save_artifact(model_dir, compress=compress)
+        DiagnosisService.update_model_performance(
+            db, metrics,
+            parameters={
+                'estimator': model.model.get_params(),
+                'source': 'database',
+                'training_rows': int(len(y)),
+                'watermark': watermark,
+                'artifact_version': model.version,
+            },
+            model_name=model_name,
+            dataset_version=model.version
+        )
+        return path
+    finally:
+        db.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the diagnosis model offline.")
+    parser.add_argument(
+        "--model", choices=ALLOWED_MODELS, default=DEFAULT_MODEL,
+        help="Model to train"
+    )
+    parser.add_argument(
+        "--model-dir", type=Path, default=MODEL_PATH,
+        help="Directory the versioned artifact is written to"
+    )
+    parser.add_argument(
+        "--compress", type=int, choices=range(10), default=ARTIFACT_COMPRESSION,
+        help="joblib compression level; 0 keeps the artifact memory-mappable"
+    )
+    parser.add_argument(
+        "--source", choices=["default", "db"], default="default",
+        help="Built-in dataset, or reviewed diagnoses streamed from the database"
+    )
+    parser.add_argument(
+        "--fetch-size", type=int, default=None,
+        help="Rows per round trip when reading from the database"
+    )
+    args = parser.parse_args()
+
+    print(f"🧠 Training {args.model} model...")
+    try:
+        if args.source == "db":
+            path = train_model_from_database(
+                args.model, args.model_dir, args.compress, args.fetch_size
+            )
+        else:
+            path = train_model(args.model, args.model_dir, args.compress)
+        print(f"✅ Model artifact saved to {path}")
+    except Exception as e:
+        print(f"❌ Error training model: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import sys
+import json
+import argparse
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from config.settings import MODEL_PATH, ALLOWED_MODELS, DEFAULT_MODEL
+from src.ml_models.artifacts import new_version
+from src.ml_models.factory import create_model
+from src.ml_models.tuning import (
+    SEARCH_SPACES, grid_candidates, mark_pareto_front, pick_candidate,
+    random_candidates, search
+)
+from src.services.training_service import load_dataset
+from scripts.benchmark_utils import print_table
+
+def candidate_parameters(result, search_id: str) -> dict:
+    """What model_performance stores about one candidate."""
+    return {
+        'estimator': result.params,
+        'search_id': search_id,
+        'cv_folds': result.folds,
+        'training_seconds': result.training_seconds,
+        'latency_p50_ms': result.latency_p50_ms,
+        'latency_p99_ms': result.latency_p99_ms,
+        'pareto': result.pareto,
+    }
+
+def record_result(db, model_name: str, search_id: str, result):
+    """Store one finished candidate in model_performance, tagged with the search id.
+
+    Called as each candidate finishes, so an interrupted search keeps what it did.
+    """
+    from src.services.diagnosis_service import DiagnosisService
+    return DiagnosisService.update_model_performance(
+        db, result.metrics,
+        parameters=candidate_parameters(result, search_id),
+        model_name=model_name,
+        dataset_version=search_id
+    )
+
+def mark_recorded_front(db, recorded: list, search_id: str) -> None:
+    """Set the Pareto flag, known only once the search ends, on the recorded rows."""
+    for performance, result in recorded:
+        performance.parameters = json.dumps(candidate_parameters(result, search_id), default=str)
+    db.commit()
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Cross-validate model parameters in parallel and report the accuracy/latency Pareto front."
+    )
+    parser.add_argument("--model", choices=ALLOWED_MODELS, default=DEFAULT_MODEL)
+    parser.add_argument("--source", choices=["default", "synthetic", "db"], default="synthetic")
+    parser.add_argument("--rows", type=int, default=5000, help="Rows of synthetic data")
+    parser.add_argument("--candidates", type=int, default=None,
+                        help="Sample this many candidates instead of the full grid")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--no-record", action="store_true",
+                        help="Do not write candidates to model_performance")
+    parser.add_argument("--save-artifact", action="store_true",
+                        help="Retrain the picked candidate on all data and save it")
+    parser.add_argument("--f1-tolerance", type=float, default=0.005,
+                        help="Pick the fastest front candidate this close to the best F1")
+    parser.add_argument("--model-dir", type=Path, default=MODEL_PATH)
+    args = parser.parse_args()
+
+    db = None
+    done = []
+    recorded = []
+    try:
+        X, y, label_names = load_dataset(args.source, args.rows)
+        space = SEARCH_SPACES[args.model]
+        candidates = (
+            random_candidates(space, args.candidates) if args.candidates
+            else list(grid_candidates(space))
+        )
+        search_id = f"search-{new_version()}"
+        if not args.no_record:
+            from src.database.database import SessionLocal
+            db = SessionLocal()
+
+        def on_result(result):
+            done.append(result)
+            if db is not None:
+                recorded.append((record_result(db, args.model, search_id, result), result))
+            print(f"  [{len(done)}/{len(candidates)}] f1={result.metrics['f1_score']:.4f} "
+                  f"p50={result.latency_p50_ms:.3f}ms {result.params}")
+
+        print(f"🧠 Evaluating {len(candidates)} {args.model} candidates "
+              f"with {args.folds}-fold CV on {len(y)} rows...")
+        results = search(
+            args.model, X, y, candidates, n_splits=args.folds, max_workers=args.workers,
+            on_result=on_result
+        )
+        front = mark_pareto_front(results)
+
+        print("\nAccuracy/latency Pareto front (fastest first):")
+        print_table([
+            {
+                'f1_score': r.metrics['f1_score'],
+                'accuracy': r.metrics['accuracy'],
+                'p50_ms': r.latency_p50_ms,
+                'p99_ms': r.latency_p99_ms,
+                'train_s': r.training_seconds,
+                'params': r.params,
+            }
+            for r in front
+        ], ['f1_score', 'accuracy', 'p50_ms', 'p99_ms', 'train_s', 'params'])
+
+        if db is not None:
+            mark_recorded_front(db, recorded, search_id)
+            print(f"✅ Recorded {len(recorded)} candidates as {search_id}")
+
+        picked = pick_candidate(front, args.f1_tolerance)
+        print(f"✅ Picked {picked.params} (f1={picked.metrics['f1_score']:.4f}, "
+              f"p50={picked.latency_p50_ms:.3f}ms)")
+        if args.save_artifact:
+            model = create_model(args.model)
+            model.model.set_params(**picked.params)
+            model.train_and_evaluate(X, y)
+            model.label_names = label_names
+            path = model.save_artifact(args.model_dir)
+            print(f"✅ Model artifact saved to {path}")
+    except Exception as e:
+        print(f"❌ Error tuning model: {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        if db is not None:
+            print(f"\n⚠️ Interrupted; {len(recorded)} candidates kept as {search_id}")
+        sys.exit(130)
+    finally:
+        if db is not None:
+            db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import sys
+import argparse
+from pathlib import Path
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from config.settings import MODEL_PATH
+from src.database.database import SessionLocal
+from src.services.training_service import (
+    INCREMENTAL_NEW_TREES, TRAINING_FETCH_SIZE, update_model_incrementally
+)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Add trees fitted on newly reviewed diagnoses to the latest random forest."
+    )
+    parser.add_argument(
+        "--model-dir", type=Path, default=MODEL_PATH,
+        help="Directory holding the artifact to extend; the update is written there too"
+    )
+    parser.add_argument(
+        "--new-trees", type=int, default=INCREMENTAL_NEW_TREES,
+        help="Trees fitted on the new data"
+    )
+    parser.add_argument(
+        "--fetch-size", type=int, default=TRAINING_FETCH_SIZE,
+        help="Rows per round trip when reading from the database"
+    )
+    args = parser.parse_args()
+
+    print("🧠 Updating random forest with newly reviewed diagnoses...")
+    db = SessionLocal()
+    try:
+        path = update_model_incrementally(
+            db, args.model_dir, new_trees=args.new_trees, fetch_size=args.fetch_size
+        )
+        if path is None:
+            print("✅ No new reviewed diagnoses; the model is up to date")
+        else:
+            print(f"✅ Updated model artifact saved to {path}")
+    except Exception as e:
+        print(f"❌ Error updating model: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
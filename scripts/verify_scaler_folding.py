@@ -0,0 +1,64 @@
+import sys
+import argparse
+import time
+from pathlib import Path
+import numpy as np
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.ml_models.random_forest import RandomForestModel
+from src.ml_models.training_data import make_synthetic_dataset
+
+CHUNK_SIZE = 100000
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check that folding the scaler into tree thresholds keeps predictions identical."
+    )
+    parser.add_argument("--train-rows", type=int, default=20000)
+    parser.add_argument("--check-rows", type=int, default=2000000)
+    args = parser.parse_args()
+
+    print(f"🧠 Training random forest on {args.train_rows} synthetic rows...")
+    model = RandomForestModel()
+    X, y = make_synthetic_dataset(args.train_rows)
+    # Measurements are recorded at one decimal, which makes threshold ties likely
+    model.train(np.round(X, 1), y)
+    folded = model.compiled
+
+    X_check, _ = make_synthetic_dataset(args.check_rows, random_state=7)
+    failed = False
+    for label, data in [("continuous", X_check), ("rounded", np.round(X_check, 1))]:
+        label_mismatches = 0
+        max_difference = 0.0
+        scaled_time = folded_time = 0.0
+        for start in range(0, len(data), CHUNK_SIZE):
+            chunk = data[start:start + CHUNK_SIZE]
+
+            # Reference: the scaler followed by the sklearn forest
+            begin = time.perf_counter()
+            expected = model.model.predict_proba(model.scaler.transform(chunk))
+            scaled_time += time.perf_counter() - begin
+
+            begin = time.perf_counter()
+            actual = folded.predict_proba(chunk)
+            folded_time += time.perf_counter() - begin
+
+            label_mismatches += int((expected.argmax(axis=1) != actual.argmax(axis=1)).sum())
+            max_difference = max(max_difference, float(np.abs(expected - actual).max()))
+
+        status = "✅" if max_difference == 0 else "❌"
+        failed |= max_difference != 0
+        print(
+            f"{status} {label}: {len(data)} rows, {label_mismatches} label mismatches, "
+            f"max probability difference {max_difference:.3e}, "
+            f"scaler+sklearn {scaled_time:.2f}s, folded compiled forest {folded_time:.2f}s"
+        )
+
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
-from sqlalchemy import create_engine
+import time
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from config.settings import DATABASE_URL
+from src.monitoring.query_stats import record_query
 
 # Create SQLAlchemy engine with SQLite
 engine = create_engine(
@@ -9,6 +12,20 @@ engine = create_engine(
     connect_args={"check_same_thread": False}  # Needed for SQLite
 )
 
+def instrument_engine(target: Engine) -> None:
+    """Time every statement on ``target`` and count it toward the open query scopes."""
+    @event.listens_for(target, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(target, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        record_query(
+            statement, parameters, time.perf_counter() - context._query_started, executemany
+        )
+
+instrument_engine(engine)
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text, JSON, CheckConstraint
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text, JSON, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 from .database import Base
 
@@ -63,6 +63,8 @@ class MedicalParameter(Base):
         CheckConstraint('glucose_level > 0', name='chk_glucose_level'),
         CheckConstraint('bmi > 0', name='chk_bmi'),
         CheckConstraint('age > 0', name='chk_age'),
+        # Training picks the latest measurement of a record before each diagnosis
+        Index('ix_medical_parameters_record_date', 'record_id', 'measurement_date'),
     )
 
     # Relationships
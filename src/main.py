@@ -6,12 +6,17 @@ import sys
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
+from config.settings import MODEL_HOT_RELOAD
 from src.database.database import SessionLocal
 from src.services.auth_service import authenticate_user, create_user
 from src.database.schemas import UserCreate
 from frontend.pages.diagnosis import diagnosis_page
 from sqlalchemy.orm import joinedload
 from src.database.models import User, Diagnosis, PatientRecord
+from src.ml_models.hot_reload import model_watcher
+from src.monitoring.profiling import page_profiler
+from src.monitoring.query_stats import query_scope
+from src.monitoring.tracing import span
 
 # Configure Streamlit page
 st.set_page_config(
@@ -21,6 +26,15 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def start_model_watcher():
+    """Start one artifact watcher per server process."""
+    model_watcher.start()
+    return model_watcher
+
+if MODEL_HOT_RELOAD:
+    start_model_watcher()
+
 # Initialize session state
 if 'user' not in st.session_state:
     st.session_state.user = None
@@ -284,29 +298,58 @@ def main_page():
         st.rerun()
     
     # Main content based on selected page
-    if st.session_state.current_page == "Home":
-        home_page()
-    elif st.session_state.current_page == "New Diagnosis":
-        # Pass fresh database session to diagnosis page
-        user, db = refresh_user()
-        if user and user.patient_record:
-            diagnosis_page(user, db)
-        else:
-            st.error("Please complete your medical profile first")
-    elif st.session_state.current_page == "History":
-        history_page()
-    elif st.session_state.current_page == "Profile":
-        profile_page()
+    page = st.session_state.current_page
+    captured = []
+    try:
+        with page_profiler.profile(page) as captured, span('render_page', page=page), \
+                query_scope(f"page:{page}"):
+            if page == "Home":
+                home_page()
+            elif page == "New Diagnosis":
+                # Pass fresh database session to diagnosis page
+                with span('refresh_user'):
+                    user, db = refresh_user()
+                if user and user.patient_record:
+                    diagnosis_page(user, db)
+                else:
+                    st.error("Please complete your medical profile first")
+            elif page == "History":
+                history_page()
+            elif page == "Profile":
+                profile_page()
+    finally:
+        # Kept across st.rerun() so the panel shows it on the next run
+        if captured:
+            st.session_state.last_profile = captured[0]
+
+    if page_profiler.enabled and st.session_state.user.role == 'admin':
+        profiler_panel()
+
+def profiler_panel():
+    """Sidebar table of the latest sampled profile, for admins."""
+    profile = st.session_state.get('last_profile')
+    with st.sidebar.expander("Profiler"):
+        if profile is None:
+            st.caption(f"No rerun profiled yet ({page_profiler.sample_rate:.0%} are sampled)")
+            return
+        st.caption(
+            f"{profile.page} at {profile.captured_at}: "
+            f"{profile.total_seconds * 1000:.1f} ms in {profile.path.name}"
+        )
+        st.dataframe(profile.top, hide_index=True)
 
 def main():
-    if st.session_state.user is None:
-        tab1, tab2 = st.tabs(["Login", "Sign Up"])
-        with tab1:
-            login_page()
-        with tab2:
-            signup_page()
-    else:
-        main_page()
+    with span('streamlit_run', authenticated=st.session_state.user is not None):
+        if st.session_state.user is None:
+            tab1, tab2 = st.tabs(["Login", "Sign Up"])
+            with tab1:
+                with span('render_page', page="Login"), query_scope("page:Login"):
+                    login_page()
+            with tab2:
+                with span('render_page', page="Sign Up"), query_scope("page:Sign Up"):
+                    signup_page()
+        else:
+            main_page()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
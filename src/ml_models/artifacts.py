@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+from config.settings import MODEL_PATH
+
+ARTIFACT_SUFFIX = ".joblib"
+# Sidecar holding an estimator that is only needed on some code paths
+ESTIMATOR_SUFFIX = ".estimator" + ARTIFACT_SUFFIX
+# Small JSON description of an artifact, readable without unpickling it
+MANIFEST_SUFFIX = ".json"
+MANIFEST_FORMAT = 1
+
+# Prefix of payload files while they are written, outside every version glob
+PARTIAL_PREFIX = ".partial-"
+
+def new_version() -> str:
+    """Generate a sortable version string for a freshly trained artifact.
+
+    Microseconds keep two saves within one second apart; older 14-digit
+    versions still sort before any newer one.
+    """
+    return datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
+
+def artifact_path(name: str, version: str, model_dir: Optional[Path] = None) -> Path:
+    """Build the path of a versioned model artifact."""
+    model_dir = Path(model_dir or MODEL_PATH)
+    return model_dir / f"{name}-{version}{ARTIFACT_SUFFIX}"
+
+def estimator_path(path: Path) -> Path:
+    """Path of the lazily loaded estimator stored next to an artifact."""
+    path = Path(path)
+    return path.with_name(path.name[:-len(ARTIFACT_SUFFIX)] + ESTIMATOR_SUFFIX)
+
+def manifest_path(path: Path) -> Path:
+    """Path of the JSON manifest describing an artifact."""
+    path = Path(path)
+    return path.with_name(path.name[:-len(ARTIFACT_SUFFIX)] + MANIFEST_SUFFIX)
+
+def partial_path(path: Path) -> Path:
+    """Temporary name a payload file is written under before it is moved into place."""
+    path = Path(path)
+    return path.with_name(PARTIAL_PREFIX + path.name)
+
+def publish_partial(files: List[Path]) -> List[Path]:
+    """Atomically rename written partial files to their final names."""
+    published = []
+    for path in files:
+        target = path.with_name(path.name[len(PARTIAL_PREFIX):])
+        os.replace(path, target)
+        published.append(target)
+    return published
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    """Hex SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def write_manifest(path: Path, manifest: Dict[str, Any]) -> Path:
+    """Write an artifact's manifest atomically.
+
+    Call this after the payload files are written: a manifest on disk means
+    the artifact is complete.
+    """
+    target = manifest_path(path)
+    temporary = target.with_name(target.name + ".tmp")
+    temporary.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(temporary, target)
+    return target
+
+def read_manifest(path: Path) -> Optional[Dict[str, Any]]:
+    """Read an artifact's manifest, or None for artifacts saved without one."""
+    target = manifest_path(path)
+    if not target.exists():
+        return None
+    return json.loads(target.read_text())
+
+def is_compressed(path: Path) -> bool:
+    """Whether an artifact was saved compressed (and so cannot be memory-mapped)."""
+    manifest = read_manifest(path)
+    return bool(manifest and manifest.get('compression'))
+
+def check_manifest(manifest: Dict[str, Any], name: str, feature_names: Sequence[str]) -> None:
+    """Raise ValueError if an artifact cannot serve this model and feature layout."""
+    if manifest.get('format_version', 0) > MANIFEST_FORMAT:
+        raise ValueError(
+            f"Artifact format {manifest['format_version']} is newer than supported "
+            f"({MANIFEST_FORMAT})"
+        )
+    if manifest.get('name') != name:
+        raise ValueError(f"Artifact is for model '{manifest.get('name')}', not '{name}'")
+    if list(manifest.get('feature_names', [])) != list(feature_names):
+        raise ValueError(
+            f"Artifact features {manifest.get('feature_names')} do not match "
+            f"{list(feature_names)}"
+        )
+
+def verify_artifact(path: Path, manifest: Optional[Dict[str, Any]] = None) -> None:
+    """Raise ValueError if any payload file does not match its recorded hash."""
+    manifest = manifest or read_manifest(path)
+    if manifest is None:
+        raise ValueError(f"No manifest found for {path}")
+    for file_name, recorded in manifest['files'].items():
+        actual = file_sha256(Path(path).with_name(file_name))
+        if actual != recorded['sha256']:
+            raise ValueError(f"Checksum mismatch for {file_name}")
+
+def artifact_version(name: str, path: Path) -> Optional[str]:
+    """Version encoded in an artifact file name, or None for the legacy file."""
+    file_name = Path(path).name
+    prefix = f"{name}-"
+    if not file_name.startswith(prefix):
+        return None
+    return file_name[len(prefix):-len(ARTIFACT_SUFFIX)]
+
+def list_versions(name: str, model_dir: Optional[Path] = None) -> List[str]:
+    """List the available artifact versions of a model, oldest first."""
+    model_dir = Path(model_dir or MODEL_PATH)
+    if not model_dir.exists():
+        return []
+    prefix = f"{name}-"
+    versions = [
+        path.name[len(prefix):-len(ARTIFACT_SUFFIX)]
+        for path in model_dir.glob(f"{prefix}*{ARTIFACT_SUFFIX}")
+        if not path.name.endswith(ESTIMATOR_SUFFIX)
+    ]
+    return sorted(versions)
+
+def latest_artifact(name: str, model_dir: Optional[Path] = None) -> Optional[Path]:
+    """Get the newest artifact of a model, falling back to the unversioned file."""
+    model_dir = Path(model_dir or MODEL_PATH)
+    versions = list_versions(name, model_dir)
+    if versions:
+        return artifact_path(name, versions[-1], model_dir)
+    legacy_path = model_dir / f"{name}{ARTIFACT_SUFFIX}"
+    if legacy_path.exists():
+        return legacy_path
+    return None
+
+def find_artifact(
+    name: str, feature_names: Sequence[str], model_dir: Optional[Path] = None
+) -> Optional[Path]:
+    """Get the newest artifact whose manifest is compatible, without unpickling.
+
+    The manifest is written last, so a versioned artifact without one is
+    still being saved and is skipped. Only the legacy unversioned file,
+    saved before manifests existed, is assumed compatible without one.
+    """
+    model_dir = Path(model_dir or MODEL_PATH)
+    for version in reversed(list_versions(name, model_dir)):
+        path = artifact_path(name, version, model_dir)
+        manifest = read_manifest(path)
+        if manifest is None:
+            continue
+        try:
+            check_manifest(manifest, name, feature_names)
+        except ValueError:
+            continue
+        return path
+    legacy_path = model_dir / f"{name}{ARTIFACT_SUFFIX}"
+    if legacy_path.exists():
+        return legacy_path
+    return None
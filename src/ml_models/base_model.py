@@ -1,120 +1,338 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 import numpy as np
-from typing import Dict, Any, Tuple, List
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Any, Tuple, List, Optional, Union
 from sklearn.base import BaseEstimator
 from sklearn.preprocessing import StandardScaler
+from config.settings import ARTIFACT_COMPRESSION
+from src.monitoring.tracing import span
+from .artifacts import (
+    MANIFEST_FORMAT, artifact_path, check_manifest, file_sha256, find_artifact,
+    is_compressed, manifest_path, new_version, partial_path, publish_partial,
+    read_manifest, verify_artifact, write_manifest
+)
+from .prediction_cache import PredictionCache
+from .preprocessing import (
+    FEATURE_NAMES, build_feature_matrix, clean_columns, parse_blood_pressure,
+    to_columns
+)
+from .training_data import LABEL_NAMES, load_default_dataset, split_validation
+
+# Records accepted by the batch prediction API
+BatchInput = Union[List[Dict[str, Any]], pd.DataFrame, np.ndarray]
 
 class BaseDiagnosisModel(ABC):
+    # Registry name of the model, used for artifact file names
+    name: str = None
+
     def __init__(self):
         self.model: BaseEstimator = None
         self.scaler: StandardScaler = None
-        self.feature_names = [
-            'glucose_level', 'blood_pressure', 'skin_thickness',
-            'insulin_level', 'bmi', 'diabetes_pedigree_function', 'age'
-        ]
+        self.version: Optional[str] = None
+        self.trained_at: Optional[str] = None
+        self.metrics: Dict[str, float] = {}
+        # Highest diagnosis id in the training data, for incremental updates
+        self.watermark: Optional[int] = None
+        # Watermark after each training read (full fit, then every update),
+        # so the rows held out of each id range can be found again
+        self.batch_watermarks: List[int] = []
+        # Name of each class label, as given by the data the model was trained on
+        self.label_names: Dict[int, str] = {}
+        self.feature_names = list(FEATURE_NAMES)
+        self.prediction_cache = PredictionCache()
+        self._frozen = False
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, '_frozen', False):
+            raise AttributeError(
+                f"{type(self).__name__} is frozen and shared between sessions; "
+                "load a new instance instead of modifying it"
+            )
+        super().__setattr__(name, value)
+
+    def freeze(self) -> None:
+        """Make the model read-only so it can be shared across threads."""
+        self._frozen = True
 
     def clean_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Clean input data by handling missing values and outliers."""
+        cleaned = clean_columns(to_columns(data))
         cleaned_data = {}
         for feature in self.feature_names:
-            value = data.get(feature, 0)
-            # Handle missing values
-            if value is None or value == '':
-                value = 0
-            # Handle outliers using basic range checking
-            if feature == 'glucose_level':
-                value = np.clip(float(value), 0, 500)
-            elif feature == 'blood_pressure':
-                if isinstance(value, str) and '/' in value:
-                    systolic, diastolic = map(float, value.split('/'))
-                    systolic = np.clip(systolic, 70, 200)
-                    diastolic = np.clip(diastolic, 40, 130)
-                    value = f"{systolic}/{diastolic}"
-            elif feature == 'skin_thickness':
-                value = np.clip(float(value), 0, 100)
-            elif feature == 'insulin_level':
-                value = np.clip(float(value), 0, 1000)
-            elif feature == 'bmi':
-                value = np.clip(float(value), 0, 100)
-            elif feature == 'diabetes_pedigree_function':
-                value = np.clip(float(value), 0, 10)
-            elif feature == 'age':
-                value = np.clip(float(value), 0, 120)
-            cleaned_data[feature] = value
+            if feature == 'blood_pressure':
+                systolic, diastolic = cleaned['systolic'][0], cleaned['diastolic'][0]
+                if np.isnan(systolic):
+                    value = data.get(feature, 0)
+                    cleaned_data[feature] = 0 if value is None or value == '' else value
+                else:
+                    cleaned_data[feature] = f"{systolic}/{diastolic}"
+            else:
+                cleaned_data[feature] = cleaned[feature][0]
         return cleaned_data
 
     def transform_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Transform data into the correct format for model input."""
         transformed_data = data.copy()
-        
+
         # Handle blood pressure transformation
         if 'blood_pressure' in transformed_data:
-            bp_str = transformed_data['blood_pressure']
-            if isinstance(bp_str, str) and '/' in bp_str:
-                systolic, diastolic = map(float, bp_str.split('/'))
-                # Use mean arterial pressure formula
-                transformed_data['blood_pressure'] = (systolic + 2 * diastolic) / 3
-        
+            _, _, mean_arterial = parse_blood_pressure([transformed_data['blood_pressure']])
+            if not np.isnan(mean_arterial[0]):
+                transformed_data['blood_pressure'] = mean_arterial[0]
+
         return transformed_data
 
     def create_feature_vector(self, data: Dict[str, Any]) -> np.ndarray:
         """Create feature vector from transformed data."""
-        features = np.array([[
-            float(data.get(feature, 0)) for feature in self.feature_names
-        ]])
-        return features
+        return build_feature_matrix(data)
 
     def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        """Complete preprocessing pipeline."""
-        # 1. Clean the data
-        cleaned_data = self.clean_data(data)
-        
-        # 2. Transform the data
-        transformed_data = self.transform_data(cleaned_data)
-        
-        # 3. Create feature vector
-        features = self.create_feature_vector(transformed_data)
-        
-        # 4. Scale features if scaler exists
-        if self.scaler:
-            features = self.scaler.transform(features)
-        
+        """Complete preprocessing pipeline for a single record."""
+        return self.preprocess_batch([data])
+
+    def preprocess_batch(self, data: BatchInput) -> np.ndarray:
+        """Preprocess many records into one model-ready feature matrix.
+
+        Cleaning, blood pressure conversion and feature assembly run as
+        whole-column NumPy operations. A 2-D ndarray is taken as raw features
+        in ``feature_names`` order, with blood pressure already converted to
+        mean arterial pressure.
+        """
+        return self.scale_features(build_feature_matrix(data))
+
+    def scale_features(self, features: np.ndarray) -> np.ndarray:
+        """Scale a raw feature matrix into model input space."""
+        if self.scaler and len(features):
+            # Same arithmetic as StandardScaler.transform without its
+            # per-call input validation, which dominates single-row latency
+            features = (features - self.scaler.mean_) / self.scaler.scale_
         return features
 
+    def warm_up(self) -> None:
+        """Run one throwaway prediction so the first real request is not slower."""
+        self.predict_with_proba(self.scale_features(np.zeros((1, len(self.feature_names)))))
+
     @abstractmethod
     def train(self, X: np.ndarray, y: np.ndarray) -> None:
         """Train the model with given data."""
         pass
 
+    def fit_scaled(self, X_scaled: np.ndarray, y: np.ndarray) -> None:
+        """Fit the estimator on features already scaled by ``self.scaler``.
+
+        Lets callers that reuse one fitted scaler (cross-validation folds)
+        skip rescaling for every candidate.
+        """
+        self.model.fit(X_scaled, y)
+
     @abstractmethod
     def predict(self, X: np.ndarray) -> np.ndarray:
         """Make predictions for given data."""
         pass
 
     def get_prediction_with_confidence(self, data: Dict[str, Any]) -> Tuple[int, float]:
-        """Get prediction and confidence score."""
+        """Get prediction and confidence score.
+
+        Results are cached per model version and rounded cleaned features;
+        legacy artifacts saved without a version are never cached. Only this
+        single-record path reads the cache: batch prediction, the cascade and
+        the micro-batcher always run the model.
+        """
         # Follow the system architecture flow
-        features = self.preprocess_data(data)
-        prediction = self.predict(features)
-        confidence = self.get_confidence_score(features)
-        return int(prediction[0]), float(confidence)
+        with span('preprocess'):
+            features = build_feature_matrix([data])
+        cache = self.prediction_cache
+        key = None
+        if cache.enabled and self.version is not None:
+            key = cache.make_key(self.version, features[0])
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        with span('model_inference', model=self.name):
+            predictions, _, confidences = self.predict_with_proba(self.scale_features(features))
+        result = (int(predictions[0]), float(confidences[0]))
+        if key is not None:
+            cache.put(key, result)
+        return result
 
     @abstractmethod
     def get_confidence_score(self, X: np.ndarray) -> float:
         """Get confidence score for the prediction."""
         pass
 
-    def save_model(self, path: str) -> None:
-        """Save model to disk."""
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Get class probabilities for preprocessed features."""
+        return self.model.predict_proba(X)
+
+    @property
+    def classes_(self) -> np.ndarray:
+        """Class labels in the column order of ``predict_proba``."""
+        return self.model.classes_
+
+    @staticmethod
+    def scale_confidence(probabilities: np.ndarray) -> np.ndarray:
+        """Turn class probabilities into per-row confidence percentages."""
+        confidence = np.max(probabilities, axis=-1) * 100  # Convert to percentage
+
+        # Apply sigmoid scaling to boost mid-range confidences
+        return 100 / (1 + np.exp(-0.1 * (confidence - 50)))
+
+    def predict_with_proba(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get labels, raw probabilities and confidences from one model pass."""
+        probabilities = self.predict_proba(X)
+        predictions = self.classes_[np.argmax(probabilities, axis=1)]
+        return predictions, probabilities, self.scale_confidence(probabilities)
+
+    def predict_proba_batch(self, data: BatchInput) -> np.ndarray:
+        """Get class probabilities for every record in one model call."""
+        features = self.preprocess_batch(data)
+        if features.shape[0] == 0:
+            return np.empty((0, len(self.classes_)))
+        return self.predict_proba(features)
+
+    def predict_batch(self, data: BatchInput) -> Tuple[np.ndarray, np.ndarray]:
+        """Get predictions and confidence scores for every record."""
+        features = self.preprocess_batch(data)
+        if features.shape[0] == 0:
+            return np.empty(0, dtype=self.classes_.dtype), np.empty(0)
+        predictions, _, confidences = self.predict_with_proba(features)
+        return predictions, confidences
+
+    def train_default(self) -> Dict[str, float]:
+        """Train on the built-in dataset and return validation metrics."""
+        X, y = load_default_dataset()
+        self.label_names = dict(LABEL_NAMES)
+        return self.train_and_evaluate(X, y)
+
+    def train_and_evaluate(
+        self, X: np.ndarray, y: np.ndarray, test_size: float = 0.2
+    ) -> Dict[str, float]:
+        """Train on a stratified split of raw features and return validation metrics."""
+        # Split into training and validation sets
+        X_train, X_val, y_train, y_val = split_validation(X, y, test_size)
+
+        self.train(X_train, y_train)
+        self.version = new_version()
+        self.trained_at = datetime.utcnow().isoformat()
+        self.metrics = self.evaluate_model(self.scale_features(X_val), y_val)
+        return self.metrics
+
+    def save_model(self, path: str, compress: int = 0) -> List[Path]:
+        """Save model to disk and return the files written."""
         import joblib
-        joblib.dump({'model': self.model, 'scaler': self.scaler}, path)
+        joblib.dump({
+            'model': self.model,
+            'scaler': self.scaler,
+            'version': self.version
+        }, path, compress=compress)
+        return [Path(path)]
 
     def load_model(self, path: str) -> None:
-        """Load model from disk."""
+        """Load model from disk.
+
+        Large arrays in the uncompressed artifact are memory-mapped, so worker
+        processes on one host share a single page-cache copy. The mapping is
+        copy-on-write because some estimators (libsvm) require writable
+        buffers; pages they never write stay shared.
+        """
         import joblib
-        data = joblib.load(path)
+        data = joblib.load(path, mmap_mode=None if is_compressed(path) else 'c')
         self.model = data['model']
         self.scaler = data['scaler']
+        self.version = data.get('version')
+        self.prediction_cache.clear()
+
+    def save_artifact(
+        self, model_dir: Optional[Path] = None, compress: int = ARTIFACT_COMPRESSION
+    ) -> Path:
+        """Save the trained model as a versioned artifact under MODEL_PATH.
+
+        The payload is written under temporary names and renamed into place,
+        and the JSON manifest is written last, once the payload is complete.
+        """
+        if self.version is None:
+            self.version = new_version()
+        if self.trained_at is None:
+            self.trained_at = datetime.utcnow().isoformat()
+        path = artifact_path(self.name, self.version, model_dir)
+        if path.exists() or manifest_path(path).exists():
+            # Replacing a served version in place would bypass the watcher
+            raise FileExistsError(f"Artifact version {self.version} already exists in {path.parent}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            partial = self.save_model(str(partial_path(path)), compress=compress)
+        except BaseException:
+            for leftover in path.parent.glob(partial_path(path).stem + '*'):
+                leftover.unlink(missing_ok=True)
+            raise
+        files = publish_partial(partial)
+        write_manifest(path, self.build_manifest(files, compress))
+        return path
+
+    def build_manifest(self, files: List[Path], compress: int) -> Dict[str, Any]:
+        """Describe an artifact for deployment checks that must not unpickle it."""
+        return {
+            'format_version': MANIFEST_FORMAT,
+            'name': self.name,
+            'model_class': type(self).__name__,
+            'version': self.version,
+            'trained_at': self.trained_at,
+            'feature_names': list(self.feature_names),
+            # Unnamed labels stay null rather than being guessed from the id
+            'labels': {str(label): self.label_names.get(int(label)) for label in self.classes_},
+            'metrics': {metric: float(value) for metric, value in self.metrics.items()},
+            'watermark': self.watermark,
+            'batch_watermarks': list(self.batch_watermarks),
+            'compression': compress,
+            'files': {
+                path.name: {'sha256': file_sha256(path), 'bytes': path.stat().st_size}
+                for path in files
+            },
+        }
+
+    @classmethod
+    def from_artifact(
+        cls,
+        path: Optional[Path] = None,
+        train_if_missing: bool = False,
+        verify: bool = False
+    ) -> 'BaseDiagnosisModel':
+        """Load a trained model, training from scratch only if explicitly asked.
+
+        The manifest, when present, is checked against this model's name and
+        features before anything is unpickled; ``verify`` also checks hashes.
+        """
+        model = cls()
+        path = path or find_artifact(cls.name, model.feature_names)
+        if path is not None and Path(path).exists():
+            manifest = read_manifest(path)
+            if manifest is not None:
+                check_manifest(manifest, cls.name, model.feature_names)
+                if verify:
+                    verify_artifact(path, manifest)
+            model.load_model(str(path))
+            if manifest is not None:
+                model.trained_at = manifest.get('trained_at')
+                model.metrics = manifest.get('metrics', {})
+                model.watermark = manifest.get('watermark')
+                model.batch_watermarks = manifest.get('batch_watermarks') or (
+                    [model.watermark] if model.watermark is not None else []
+                )
+                model.label_names = {
+                    int(label): name for label, name in manifest.get('labels', {}).items()
+                    if name is not None
+                }
+        elif train_if_missing:
+            model.train_default()
+        else:
+            raise FileNotFoundError(
+                f"No trained artifact found for model '{cls.name}'. "
+                "Run scripts/train_model.py first."
+            )
+        return model
 
     def evaluate_model(self, X_test: np.ndarray, y_test: np.ndarray) -> Dict[str, float]:
         """Evaluate model performance."""
@@ -0,0 +1,161 @@
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from typing import Dict, Any, Optional, Tuple
+from config.settings import DEFAULT_MODEL, MICRO_BATCH_MAX_SIZE, MICRO_BATCH_MAX_WAIT_MS
+from .base_model import BaseDiagnosisModel
+from .preprocessing import build_feature_matrix
+from .registry import ModelRegistry, model_registry
+
+logger = logging.getLogger(__name__)
+
+# Queued in place of a request to stop the worker thread
+_STOP = object()
+
+class MicroBatcher:
+    """Coalesce concurrent single-record predictions into one model call.
+
+    Callers submit records from any thread and get a future. A background
+    worker takes the first queued request, keeps collecting until
+    ``max_batch_size`` rows or ``max_wait_ms`` have passed, and scores the
+    whole batch with one vectorized ``predict_proba``. The worker only
+    waits for stragglers while the previous batch had more than one row and
+    some submitted request is not in the batch yet, so blocked callers are
+    never held back by ``max_wait_ms``. Batched requests bypass the model's
+    prediction cache and are always scored.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        max_batch_size: int = MICRO_BATCH_MAX_SIZE,
+        max_wait_ms: float = MICRO_BATCH_MAX_WAIT_MS,
+        registry: ModelRegistry = model_registry,
+    ):
+        self.model_name = model_name
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.registry = registry
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._outstanding = 0
+        self.batches = 0
+        self.rows = 0
+
+    def start(self) -> None:
+        """Start the worker thread if it is not already running."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=f"micro-batcher-{self.model_name}", daemon=True
+                )
+                self._thread.start()
+
+    def stop(self) -> None:
+        """Finish queued requests and stop the worker thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def submit(self, data: Dict[str, Any]) -> Future:
+        """Queue one record and return a future of (prediction, confidence, model)."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            self.start()
+        future: Future = Future()
+        with self._lock:
+            self._outstanding += 1
+        self._queue.put((data, future))
+        return future
+
+    def get_prediction_with_confidence(
+        self, data: Dict[str, Any], timeout: Optional[float] = None
+    ) -> Tuple[int, float, BaseDiagnosisModel]:
+        """Get prediction, confidence and the model that scored the batch.
+
+        On a timeout the request is cancelled, so the worker skips it.
+        """
+        future = self.submit(data)
+        try:
+            return future.result(timeout)
+        except FuturesTimeoutError:
+            future.cancel()
+            raise
+
+    def stats(self) -> Dict[str, float]:
+        """Batches run so far and their mean size."""
+        return {
+            'batches': self.batches,
+            'rows': self.rows,
+            'mean_batch_size': self.rows / self.batches if self.batches else 0.0,
+        }
+
+    def _collect(self, first, wait: bool) -> Tuple[list, bool]:
+        batch = [first]
+        deadline = time.monotonic() + (self.max_wait_ms / 1000 if wait else 0)
+        while len(batch) < self.max_batch_size:
+            # Everyone who submitted is already in: waiting would only delay them
+            timeout = deadline - time.monotonic() if len(batch) < self._outstanding else 0
+            try:
+                # Take whatever is already queued even once the wait is over
+                item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        stopping = False
+        concurrent = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            batch, stopping = self._collect(first, wait=concurrent)
+            concurrent = len(batch) > 1
+            try:
+                self._score(batch)
+            except Exception:
+                # One bad batch must not take the worker down with it
+                logger.exception("Micro-batch scoring failed")
+
+    def _score(self, batch: list) -> None:
+        with self._lock:
+            self._outstanding -= len(batch)
+        # Skip requests their callers cancelled while they were queued
+        batch = [item for item in batch if item[1].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        records = [data for data, _ in batch]
+        try:
+            model = self.registry.get(self.model_name)
+            predictions, _, confidences = model.predict_with_proba(
+                model.scale_features(build_feature_matrix(records))
+            )
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.rows += len(batch)
+        for (_, future), prediction, confidence in zip(batch, predictions, confidences):
+            future.set_result((int(prediction), float(confidence), model))
+
+_batchers: Dict[str, MicroBatcher] = {}
+_batchers_lock = threading.Lock()
+
+def get_batcher(model_name: str = DEFAULT_MODEL) -> MicroBatcher:
+    """Get the process-wide micro-batcher for a model, creating it on first use."""
+    batcher = _batchers.get(model_name)
+    if batcher is None:
+        with _batchers_lock:
+            batcher = _batchers.setdefault(model_name, MicroBatcher(model_name))
+    return batcher
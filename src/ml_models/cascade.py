@@ -0,0 +1,128 @@
+import threading
+import time
+import numpy as np
+from typing import Dict, Any, Optional, Tuple
+from config.settings import CASCADE_FAST_MODEL, CASCADE_UNCERTAINTY_BAND, DEFAULT_MODEL
+from .base_model import BaseDiagnosisModel, BatchInput
+from .preprocessing import build_feature_matrix
+from .registry import ModelRegistry, model_registry
+
+class CascadeStats:
+    """Thread-safe counters describing how often the cascade short-circuits."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.short_circuited = 0
+            self.fast_seconds = 0.0
+            self.slow_seconds = 0.0
+
+    def record(self, rows: int, escalated: int, fast_seconds: float, slow_seconds: float) -> None:
+        with self._lock:
+            self.requests += rows
+            self.short_circuited += rows - escalated
+            self.fast_seconds += fast_seconds
+            self.slow_seconds += slow_seconds
+
+    def report(self) -> Dict[str, Optional[float]]:
+        """Summarize short-circuit rate and the estimated latency saved.
+
+        Time saved is estimated from the measured slow-stage cost per
+        escalated request, applied to the requests that never reached it.
+        It is None until at least one request has escalated, since the
+        slow stage has no measured cost before then.
+        """
+        with self._lock:
+            escalated = self.requests - self.short_circuited
+            saved = None
+            if escalated:
+                slow_per_request = self.slow_seconds / escalated
+                saved = self.short_circuited * slow_per_request - self.fast_seconds
+            return {
+                'requests': self.requests,
+                'short_circuited': self.short_circuited,
+                'short_circuit_fraction': (
+                    self.short_circuited / self.requests if self.requests else 0.0
+                ),
+                'fast_seconds': self.fast_seconds,
+                'slow_seconds': self.slow_seconds,
+                'estimated_seconds_saved': saved,
+            }
+
+class CascadeModel:
+    """Score with a cheap model first and consult the slow one only when unsure.
+
+    A request escalates when the fast model's top-class probability falls
+    inside ``band`` (``low <= p < high``). Models are fetched from the
+    registry on every call, so both stages always use the active artifacts.
+    Neither stage reads the models' prediction caches; a cached answer could
+    not say which stage decided it.
+    """
+
+    def __init__(
+        self,
+        fast_model_name: str = CASCADE_FAST_MODEL,
+        slow_model_name: str = DEFAULT_MODEL,
+        band: Tuple[float, float] = CASCADE_UNCERTAINTY_BAND,
+        registry: ModelRegistry = model_registry,
+    ):
+        self.fast_model_name = fast_model_name
+        self.slow_model_name = slow_model_name
+        self.band = band
+        self.registry = registry
+        self.stats = CascadeStats()
+
+    def load(self) -> None:
+        """Load both stages now, so a missing artifact fails before any request."""
+        self.registry.get(self.fast_model_name)
+        self.registry.get(self.slow_model_name)
+
+    def _is_uncertain(self, probabilities: np.ndarray) -> np.ndarray:
+        top = probabilities.max(axis=1)
+        low, high = self.band
+        return (top >= low) & (top < high)
+
+    def get_prediction_with_confidence(
+        self, data: Dict[str, Any]
+    ) -> Tuple[int, float, BaseDiagnosisModel]:
+        """Get prediction, confidence and the model of the stage that decided."""
+        predictions, confidences, deciders = self.predict_batch([data])
+        return int(predictions[0]), float(confidences[0]), deciders[0]
+
+    def predict_batch(self, data: BatchInput) -> Tuple[np.ndarray, np.ndarray, list]:
+        """Score many records, escalating only the uncertain rows in one slow call."""
+        fast = self.registry.get(self.fast_model_name)
+        raw_features = build_feature_matrix(data)
+
+        start = time.perf_counter()
+        predictions, probabilities, confidences = fast.predict_with_proba(
+            fast.scale_features(raw_features)
+        )
+        fast_seconds = time.perf_counter() - start
+
+        escalate = np.flatnonzero(self._is_uncertain(probabilities))
+        deciders = [fast] * len(predictions)
+        slow_seconds = 0.0
+        if len(escalate):
+            slow = self.registry.get(self.slow_model_name)
+            start = time.perf_counter()
+            slow_predictions, _, slow_confidences = slow.predict_with_proba(
+                slow.scale_features(raw_features[escalate])
+            )
+            slow_seconds = time.perf_counter() - start
+
+            predictions = predictions.copy()
+            confidences = confidences.copy()
+            predictions[escalate] = slow_predictions
+            confidences[escalate] = slow_confidences
+            for row in escalate:
+                deciders[row] = slow
+
+        self.stats.record(len(predictions), len(escalate), fast_seconds, slow_seconds)
+        return predictions, confidences, deciders
+
+default_cascade = CascadeModel()
@@ -0,0 +1,315 @@
+import numpy as np
+from typing import Any, Dict, Optional, Tuple
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+# Rows evaluated together, bounding the (trees x rows) node index matrix
+EVAL_CHUNK_SIZE = 4096
+# Trees evaluated between early-exit checks
+EARLY_EXIT_TREE_CHUNK = 20
+
+def _raw_thresholds(threshold: np.ndarray, mean: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """Find the largest raw value each standardized split still sends left.
+
+    sklearn rounds the standardized value to float32 before comparing, so
+    ``threshold * scale + mean`` can disagree with it on values that land
+    next to a threshold. Because standardize-then-round is monotonic, each
+    split has an exact raw boundary, found here by bisecting over float64.
+    """
+    def goes_left(x):
+        return ((x - mean) / scale).astype(np.float32) <= threshold
+
+    guess = threshold * scale + mean
+    step = np.maximum(np.abs(guess), scale) * 1e-6
+    low, high = guess - step, guess + step
+    # Widen until every boundary is bracketed by [low, high)
+    while True:
+        low_right = ~goes_left(low)
+        high_left = goes_left(high)
+        if not (low_right.any() or high_left.any()):
+            break
+        step *= 2
+        low = np.where(low_right, guess - step, low)
+        high = np.where(high_left, guess + step, high)
+
+    while True:
+        middle = low + (high - low) / 2
+        active = (middle > low) & (middle < high)
+        if not active.any():
+            return low
+        left = goes_left(middle)
+        low = np.where(active & left, middle, low)
+        high = np.where(active & ~left, middle, high)
+
+class CompiledForest:
+    """A fitted random forest flattened into contiguous NumPy node arrays.
+
+    All trees share one set of node arrays. Leaves point to themselves, so a
+    batch of rows can be walked through every tree at once, one level per
+    step, without per-tree Python calls or sklearn input validation.
+    Probabilities are accumulated in the same order as sklearn, giving
+    identical results.
+    """
+
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        children: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        classes: np.ndarray,
+        max_depth: int,
+        input_dtype: type = np.float32,
+    ):
+        self.feature = feature
+        self.threshold = threshold
+        # Row 0 holds left children and row 1 right children
+        self.children = children
+        self.value = value
+        self.roots = roots
+        self.classes = classes
+        self.max_depth = max_depth
+        # sklearn compares float32 inputs; folded thresholds compare raw float64
+        self.input_dtype = input_dtype
+
+    @property
+    def left(self) -> np.ndarray:
+        return self.children[0]
+
+    @property
+    def right(self) -> np.ndarray:
+        return self.children[1]
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_classes(self) -> int:
+        return self.value.shape[1]
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the node arrays."""
+        return sum(array.nbytes for array in (
+            self.feature, self.threshold, self.children, self.value, self.roots
+        ))
+
+    @classmethod
+    def from_sklearn(cls, forest: RandomForestClassifier) -> 'CompiledForest':
+        """Export a fitted RandomForestClassifier into flat node arrays."""
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            n_nodes = tree.node_count
+            node_ids = np.arange(offset, offset + n_nodes)
+            is_leaf = tree.children_left == -1
+
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            lefts.append(np.where(is_leaf, node_ids, tree.children_left + offset))
+            rights.append(np.where(is_leaf, node_ids, tree.children_right + offset))
+
+            # Per-node class probabilities, normalized the way sklearn's
+            # DecisionTreeClassifier.predict_proba does
+            value = tree.value[:, 0, :forest.n_classes_].astype(np.float64)
+            normalizer = value.sum(axis=1, keepdims=True)
+            if not np.allclose(normalizer, 1.0):
+                normalizer[normalizer == 0.0] = 1.0
+                value = value / normalizer
+            values.append(value)
+
+            roots.append(offset)
+            max_depth = max(max_depth, tree.max_depth)
+            offset += n_nodes
+
+        return cls(
+            feature=np.concatenate(features).astype(np.intp),
+            threshold=np.concatenate(thresholds).astype(np.float64),
+            children=np.stack([np.concatenate(lefts), np.concatenate(rights)]).astype(np.intp),
+            value=np.concatenate(values),
+            roots=np.asarray(roots, dtype=np.intp),
+            classes=forest.classes_,
+            max_depth=int(max_depth),
+        )
+
+    def to_arrays(self) -> Dict[str, Any]:
+        """Export the node arrays for saving in an uncompressed artifact."""
+        return {
+            'feature': self.feature,
+            'threshold': self.threshold,
+            'children': self.children,
+            'value': self.value,
+            'roots': self.roots,
+            'classes': self.classes,
+            'max_depth': self.max_depth,
+            'input_dtype': np.dtype(self.input_dtype).name,
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, Any]) -> 'CompiledForest':
+        """Rebuild a forest from ``to_arrays`` output without copying.
+
+        Arrays loaded with ``mmap_mode='r'`` stay backed by the artifact
+        file, so every process that maps it shares one page-cache copy.
+        """
+        # Plain ndarray views of the memmaps skip np.memmap's per-operation
+        # subclass overhead while sharing the same mapped pages
+        view = np.asarray
+        return cls(
+            feature=view(arrays['feature']),
+            threshold=view(arrays['threshold']),
+            children=view(arrays['children']),
+            value=view(arrays['value']),
+            roots=view(arrays['roots']),
+            classes=view(arrays['classes']),
+            max_depth=int(arrays['max_depth']),
+            input_dtype=np.dtype(arrays['input_dtype']).type,
+        )
+
+    def fold_scaler(self, scaler: StandardScaler) -> 'CompiledForest':
+        """Rewrite split thresholds from standardized into raw feature units.
+
+        Trees only compare one feature against a threshold and standardizing
+        is monotonic per feature, so every split ``scaled(x) <= t`` is the
+        same as ``x <= r`` for some raw threshold ``r``. The folded forest
+        takes raw features and skips the scaler entirely.
+        """
+        is_leaf = self.left == np.arange(len(self.left))
+        split = ~is_leaf
+        threshold = np.full(len(self.threshold), np.inf)
+        threshold[split] = _raw_thresholds(
+            self.threshold[split],
+            scaler.mean_[self.feature[split]],
+            scaler.scale_[self.feature[split]],
+        )
+        return CompiledForest(
+            feature=self.feature,
+            threshold=threshold,
+            children=self.children,
+            value=self.value,
+            roots=self.roots,
+            classes=self.classes,
+            max_depth=self.max_depth,
+            input_dtype=np.float64,
+        )
+
+    def prune(self, trees: Optional[np.ndarray] = None, max_depth: Optional[int] = None) -> 'CompiledForest':
+        """Keep only some trees and cut them at a depth, dropping unreachable nodes.
+
+        Nodes at ``max_depth`` become leaves that predict the class
+        distribution they already store, as a shallower tree would.
+        """
+        roots = self.roots if trees is None else self.roots[trees]
+        is_leaf = self.left == np.arange(self.n_nodes)
+
+        # Walk level by level, so kept nodes are numbered in breadth-first order
+        levels = [roots]
+        while max_depth is None or len(levels) <= max_depth:
+            internal = levels[-1][~is_leaf[levels[-1]]]
+            if len(internal) == 0:
+                break
+            levels.append(np.concatenate([self.left[internal], self.right[internal]]))
+        kept = np.concatenate(levels)
+        new_ids = np.arange(len(kept))
+        index = np.full(self.n_nodes, -1, dtype=np.intp)
+        index[kept] = new_ids
+
+        leaf = is_leaf[kept]
+        if max_depth is not None and len(levels) > max_depth:
+            leaf[len(kept) - len(levels[-1]):] = True
+        children = np.where(leaf, new_ids, index[self.children[:, kept]])
+
+        return CompiledForest(
+            feature=np.where(leaf, 0, self.feature[kept]),
+            threshold=np.where(leaf, np.inf, self.threshold[kept]),
+            children=children,
+            value=self.value[kept],
+            roots=index[roots],
+            classes=self.classes,
+            max_depth=len(levels) - 1,
+            input_dtype=self.input_dtype,
+        )
+
+    def apply(self, X: np.ndarray, trees: Optional[np.ndarray] = None) -> np.ndarray:
+        """Get the (trees, rows) leaf indices reached by each row."""
+        X = np.ascontiguousarray(X, dtype=self.input_dtype)
+        n_rows, n_features = X.shape
+        roots = self.roots if trees is None else self.roots[trees]
+        nodes = np.repeat(roots[:, None], n_rows, axis=1)
+        values = X.ravel()
+        row_offsets = np.arange(n_rows) * n_features
+        for _ in range(self.max_depth):
+            go_right = values[row_offsets + self.feature[nodes]] > self.threshold[nodes]
+            nodes = self.children[go_right.view(np.int8), nodes]
+        return nodes
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Average per-tree class probabilities for a batch of rows."""
+        X = np.asarray(X)
+        proba = np.empty((X.shape[0], self.n_classes))
+        for start in range(0, X.shape[0], EVAL_CHUNK_SIZE):
+            chunk = slice(start, start + EVAL_CHUNK_SIZE)
+            leaves = self.apply(X[chunk])
+            # Summing over the leading tree axis adds trees one after another,
+            # matching sklearn's accumulation order
+            proba[chunk] = self.value[leaves].sum(axis=0)
+        proba /= self.n_trees
+        return proba
+
+    def predict_proba_early_exit(
+        self,
+        X: np.ndarray,
+        tree_chunk: int = EARLY_EXIT_TREE_CHUNK,
+        tolerance: float = 0.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Average class probabilities over only as many trees as each row needs.
+
+        Trees are evaluated in chunks. A row stops once its leading class
+        can no longer be overturned: every remaining tree can move the vote
+        margin by at most 1, so the row is decided when the margin exceeds
+        the number of trees left. ``tolerance`` (in ``[0, 1)``) ignores that share
+        of the worst-case swing and stops earlier. With 0, the predicted
+        class always matches full evaluation. Probabilities are averaged over
+        the trees actually used. Returns the probabilities and the number of
+        trees used per row.
+        """
+        if not 0 <= tolerance < 1:
+            raise ValueError(f"tolerance must be in [0, 1), got {tolerance}")
+        X = np.asarray(X)
+        n_rows = X.shape[0]
+        totals = np.zeros((n_rows, self.n_classes))
+        trees_used = np.zeros(n_rows, dtype=np.intp)
+        active = np.arange(n_rows)
+
+        # After k trees the margin is at most k, so no row can stop before
+        # k > (n_trees - k) * (1 - tolerance); evaluate that many up front
+        slack = 1 - tolerance
+        first = min(int(self.n_trees * slack / (1 + slack)) + 1, self.n_trees)
+        bounds = [0] + list(range(first, self.n_trees, tree_chunk)) + [self.n_trees]
+
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            trees = np.arange(start, stop)
+            leaves = self.apply(X[active], trees)
+            # Seeding the sum with the running totals keeps the tree-by-tree
+            # accumulation order of predict_proba, so exact ties break the same way
+            totals[active] = np.concatenate(
+                [totals[active][None], self.value[leaves]]
+            ).sum(axis=0)
+            trees_used[active] = trees[-1] + 1
+
+            remaining = self.n_trees - trees[-1] - 1
+            ranked = np.sort(totals[active], axis=1)
+            margin = ranked[:, -1] - ranked[:, -2] if self.n_classes > 1 else ranked[:, -1]
+            active = active[margin <= remaining * (1 - tolerance)]
+            if len(active) == 0:
+                break
+
+        return totals / trees_used[:, None], trees_used
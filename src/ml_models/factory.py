@@ -0,0 +1,23 @@
+from typing import Dict, Type
+from config.settings import ALLOWED_MODELS
+from .base_model import BaseDiagnosisModel
+from .logistic_regression import LogisticRegressionModel
+from .random_forest import RandomForestModel
+from .svm import SVMModel
+
+MODEL_CLASSES: Dict[str, Type[BaseDiagnosisModel]] = {
+    model_class.name: model_class
+    for model_class in (SVMModel, LogisticRegressionModel, RandomForestModel)
+}
+
+def get_model_class(name: str) -> Type[BaseDiagnosisModel]:
+    """Look up the model class registered under a name from ALLOWED_MODELS."""
+    if name not in ALLOWED_MODELS or name not in MODEL_CLASSES:
+        raise ValueError(
+            f"Unknown model '{name}'. Choose one of: {', '.join(ALLOWED_MODELS)}"
+        )
+    return MODEL_CLASSES[name]
+
+def create_model(name: str) -> BaseDiagnosisModel:
+    """Create an untrained model by name."""
+    return get_model_class(name)()
@@ -0,0 +1,72 @@
+import logging
+import threading
+from typing import List, Optional, Tuple
+from config.settings import MODEL_RELOAD_INTERVAL
+from .artifacts import artifact_version, find_artifact
+from .preprocessing import FEATURE_NAMES
+from .registry import ModelRegistry, model_registry
+
+logger = logging.getLogger(__name__)
+
+class ModelWatcher:
+    """Background thread that switches the registry to newly trained artifacts.
+
+    Every ``interval`` seconds the watcher looks for a newer compatible
+    artifact of each active model. Only manifests are read while polling;
+    a new version is loaded and warmed on the watcher thread and then
+    swapped in with ``ModelRegistry.activate``, so requests never wait on
+    the load.
+    """
+
+    def __init__(
+        self,
+        registry: ModelRegistry = model_registry,
+        interval: float = MODEL_RELOAD_INTERVAL,
+    ):
+        self.registry = registry
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self) -> List[Tuple[str, str]]:
+        """Activate any newer artifacts now and return the (name, version) swapped in."""
+        swapped = []
+        for name, model in self.registry.active().items():
+            path = find_artifact(name, FEATURE_NAMES, self.registry.model_dir)
+            version = artifact_version(name, path) if path is not None else None
+            # Versions are timestamps, so string order is release order
+            if version is None or (model.version is not None and version <= model.version):
+                continue
+            try:
+                self.registry.activate(name, version)
+            except Exception:
+                # Keep serving the current model; the next poll retries
+                logger.exception("Failed to load %s version %s", name, version)
+                continue
+            logger.info("Switched %s from version %s to %s", name, model.version, version)
+            swapped.append((name, version))
+        return swapped
+
+    def start(self) -> None:
+        """Start polling in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="model-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Model watcher poll failed")
+
+model_watcher = ModelWatcher()
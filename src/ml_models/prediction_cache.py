@@ -0,0 +1,86 @@
+import threading
+import time
+import numpy as np
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+from config.settings import (
+    PREDICTION_CACHE_SIZE, PREDICTION_CACHE_TTL, PREDICTION_CACHE_PRECISION
+)
+
+class PredictionCache:
+    """Bounded LRU cache of single-record predictions with TTL eviction.
+
+    Keys combine the model version with the cleaned feature vector rounded
+    to ``precision`` decimals, so resubmitting the same parameters is a
+    dictionary lookup. A ``max_size`` of 0 disables caching.
+    """
+
+    def __init__(
+        self,
+        max_size: int = PREDICTION_CACHE_SIZE,
+        ttl: float = PREDICTION_CACHE_TTL,
+        precision: int = PREDICTION_CACHE_PRECISION,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.precision = precision
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def make_key(self, version: str, features: np.ndarray) -> Hashable:
+        """Build the cache key for one raw feature row."""
+        return (version, tuple(np.round(features, self.precision).tolist()))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after a new model artifact is loaded."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Snapshot of the hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+            }
@@ -0,0 +1,198 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Tuple, Union
+
+FEATURE_NAMES = [
+    'glucose_level', 'blood_pressure', 'skin_thickness',
+    'insulin_level', 'bmi', 'diabetes_pedigree_function', 'age'
+]
+
+# Valid ranges used to clip outliers
+CLIP_RANGES = {
+    'glucose_level': (0, 500),
+    'skin_thickness': (0, 100),
+    'insulin_level': (0, 1000),
+    'bmi': (0, 100),
+    'diabetes_pedigree_function': (0, 10),
+    'age': (0, 120),
+}
+SYSTOLIC_RANGE = (70, 200)
+DIASTOLIC_RANGE = (40, 130)
+
+# Columns up to this length are parsed with a plain loop
+SMALL_COLUMN_SIZE = 16
+# Rows per block when parsing long columns, bounding temporary memory
+PARSE_CHUNK_SIZE = 65536
+
+# Input accepted by the columnar pipeline
+Records = Union[Dict[str, Any], List[Dict[str, Any]], pd.DataFrame, np.ndarray]
+Columns = Dict[str, np.ndarray]
+
+def to_numeric(values: np.ndarray) -> np.ndarray:
+    """Convert a column to floats, turning missing or invalid entries into NaN."""
+    try:
+        return np.asarray(values, dtype=float)
+    except (ValueError, TypeError):
+        return pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=float)
+
+def to_columns(data: Records) -> Columns:
+    """Split records into one array per feature.
+
+    A 2-D ndarray is taken as raw features in ``FEATURE_NAMES`` order, with
+    blood pressure already converted to mean arterial pressure.
+    """
+    if isinstance(data, np.ndarray):
+        if data.ndim != 2 or data.shape[1] != len(FEATURE_NAMES):
+            raise ValueError(
+                f"Expected an array of shape (n, {len(FEATURE_NAMES)}), got {data.shape}"
+            )
+        return {feature: data[:, i] for i, feature in enumerate(FEATURE_NAMES)}
+
+    if isinstance(data, pd.DataFrame):
+        n_rows = len(data)
+        return {
+            feature: data[feature].to_numpy() if feature in data
+            else np.zeros(n_rows)
+            for feature in FEATURE_NAMES
+        }
+
+    if isinstance(data, dict):
+        data = [data]
+    columns = {}
+    for feature in FEATURE_NAMES:
+        column = np.empty(len(data), dtype=object)
+        column[:] = [record.get(feature) for record in data]
+        columns[feature] = column
+    return columns
+
+def _parse_readings(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Parse readings one by one with ``float``, for short or irregular input."""
+    systolic = np.full(len(values), np.nan)
+    diastolic = np.full(len(values), np.nan)
+    for i, value in enumerate(values):
+        if isinstance(value, str) and '/' in value:
+            try:
+                high, low = value.split('/', 1)
+                systolic[i], diastolic[i] = float(high), float(low)
+            except ValueError:
+                pass
+    return systolic, diastolic
+
+def _parse_code_points(text: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse plain "ddd[.d]/ddd[.d]" readings from a fixed-width unicode array.
+
+    Characters are scanned one position at a time across all rows and the
+    digits accumulated arithmetically, so no string is converted on its own.
+    The result equals ``float()`` on each side; rows in any other format are
+    flagged in the returned mask.
+    """
+    n_rows = len(text)
+    codes = np.ascontiguousarray(text).view(np.uint32).reshape(n_rows, -1)
+    systolic = np.zeros(n_rows)
+    diastolic = np.zeros(n_rows)
+    systolic_decimals = np.zeros(n_rows, dtype=np.int64)
+    diastolic_decimals = np.zeros(n_rows, dtype=np.int64)
+    systolic_digits = np.zeros(n_rows, dtype=np.int64)
+    diastolic_digits = np.zeros(n_rows, dtype=np.int64)
+    after_slash = np.zeros(n_rows, dtype=bool)
+    after_dot = np.zeros(n_rows, dtype=bool)
+    parsed = np.ones(n_rows, dtype=bool)
+
+    for code in codes.T:
+        is_digit = (code >= ord('0')) & (code <= ord('9'))
+        is_dot = code == ord('.')
+        is_slash = code == ord('/')
+        parsed &= is_digit | is_dot | is_slash | (code == 0)
+        parsed &= ~(is_dot & after_dot) & ~(is_slash & after_slash)
+
+        digit = code.astype(float) - ord('0')
+        on_systolic = is_digit & ~after_slash
+        on_diastolic = is_digit & after_slash
+        systolic = np.where(on_systolic, systolic * 10 + digit, systolic)
+        diastolic = np.where(on_diastolic, diastolic * 10 + digit, diastolic)
+        systolic_decimals += on_systolic & after_dot
+        diastolic_decimals += on_diastolic & after_dot
+        systolic_digits += on_systolic
+        diastolic_digits += on_diastolic
+
+        after_dot = (after_dot | is_dot) & ~is_slash
+        after_slash |= is_slash
+
+    # Mantissas stay exact integers below 2**53, so one division rounds
+    # exactly like float() does
+    for n_digits in (systolic_digits, diastolic_digits):
+        parsed &= (n_digits > 0) & (n_digits <= 15)
+    systolic /= 10.0 ** systolic_decimals
+    diastolic /= 10.0 ** diastolic_decimals
+    return systolic, diastolic, parsed
+
+def parse_blood_pressure(values: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse a column of "systolic/diastolic" readings.
+
+    Returns systolic, diastolic and mean arterial pressure arrays. Entries
+    that are missing, numeric or malformed come back as NaN.
+    """
+    values = np.asarray(values, dtype=object).ravel()
+    if len(values) <= SMALL_COLUMN_SIZE:
+        # Array setup costs more than a plain loop on the single-record path
+        systolic, diastolic = _parse_readings(values)
+    else:
+        systolic = np.empty(len(values))
+        diastolic = np.empty(len(values))
+        for start in range(0, len(values), PARSE_CHUNK_SIZE):
+            chunk = slice(start, start + PARSE_CHUNK_SIZE)
+            text = values[chunk].astype(str)
+            systolic[chunk], diastolic[chunk], parsed = _parse_code_points(text)
+
+            # Hand anything unusual (spaces, signs, exponents, junk) to float()
+            irregular = np.flatnonzero(~parsed)
+            if len(irregular):
+                systolic[chunk][irregular], diastolic[chunk][irregular] = (
+                    _parse_readings(values[chunk][irregular])
+                )
+
+    # Use mean arterial pressure formula
+    mean_arterial = (systolic + 2 * diastolic) / 3
+    return systolic, diastolic, mean_arterial
+
+def clean_columns(columns: Columns) -> Columns:
+    """Handle missing values and outliers for whole columns at once.
+
+    Blood pressure strings are split into clipped ``systolic`` and
+    ``diastolic`` columns; numeric blood pressure values pass through.
+    """
+    cleaned = {}
+    for feature, (low, high) in CLIP_RANGES.items():
+        values = to_numeric(columns[feature])
+        cleaned[feature] = np.clip(np.where(np.isnan(values), 0.0, values), low, high)
+
+    blood_pressure = columns['blood_pressure']
+    if blood_pressure.dtype.kind in 'OUS':
+        systolic, diastolic, _ = parse_blood_pressure(blood_pressure)
+        numeric = to_numeric(np.where(np.isnan(systolic), blood_pressure, None))
+    else:
+        numeric = to_numeric(blood_pressure)
+        systolic = diastolic = np.full(len(numeric), np.nan)
+    cleaned['systolic'] = np.clip(systolic, *SYSTOLIC_RANGE)
+    cleaned['diastolic'] = np.clip(diastolic, *DIASTOLIC_RANGE)
+    cleaned['blood_pressure'] = numeric
+    return cleaned
+
+def transform_columns(cleaned: Columns) -> Columns:
+    """Convert cleaned columns into model features."""
+    transformed = dict(cleaned)
+    # Use mean arterial pressure formula
+    mean_arterial = (cleaned['systolic'] + 2 * cleaned['diastolic']) / 3
+    blood_pressure = np.where(
+        np.isnan(mean_arterial), cleaned['blood_pressure'], mean_arterial
+    )
+    transformed['blood_pressure'] = np.where(np.isnan(blood_pressure), 0.0, blood_pressure)
+    return transformed
+
+def feature_matrix(transformed: Columns) -> np.ndarray:
+    """Stack transformed columns into an (n, 7) feature matrix."""
+    return np.column_stack([transformed[feature] for feature in FEATURE_NAMES]).astype(float)
+
+def build_feature_matrix(data: Records) -> np.ndarray:
+    """Complete columnar pipeline from raw records to unscaled features."""
+    return feature_matrix(transform_columns(clean_columns(to_columns(data))))
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from sklearn.metrics import f1_score
+from .compiled_forest import CompiledForest, EVAL_CHUNK_SIZE
+
+@dataclass
+class PruneCandidate:
+    """A tree-prefix size and depth limit with its validation score."""
+    n_trees: int
+    max_depth: int
+    n_nodes: int
+    f1_score: float
+
+def prefix_labels(forest: CompiledForest, X: np.ndarray) -> np.ndarray:
+    """Predicted labels of every tree prefix: row k holds the first k+1 trees' vote."""
+    labels = np.empty((forest.n_trees, len(X)), dtype=forest.classes.dtype)
+    for start in range(0, len(X), EVAL_CHUNK_SIZE):
+        chunk = slice(start, start + EVAL_CHUNK_SIZE)
+        # Cumulative sums add trees one after another, like predict_proba
+        totals = np.cumsum(forest.value[forest.apply(X[chunk])], axis=0)
+        labels[:, chunk] = forest.classes[np.argmax(totals, axis=2)]
+    return labels
+
+def prune_search(
+    forest: CompiledForest,
+    X_val: np.ndarray,
+    y_val: np.ndarray,
+    tolerance: float = 0.01,
+    depths: Optional[Sequence[int]] = None,
+) -> Tuple[PruneCandidate, float, List[PruneCandidate]]:
+    """Find the smallest forest whose weighted F1 stays within ``tolerance``.
+
+    For each depth limit, every prefix of the trees is scored in one pass
+    and the shortest prefix within budget is kept. The winner is the
+    candidate with the fewest nodes. Trees of a random forest are
+    exchangeable, so prefixes stand in for arbitrary subsets. Returns the
+    winner, the unpruned F1 and the best candidate per depth.
+    """
+    baseline = f1_score(y_val, prefix_labels(forest, X_val)[-1], average='weighted')
+    if depths is None:
+        depths = range(1, forest.max_depth + 1)
+
+    candidates = []
+    for depth in depths:
+        truncated = forest.prune(max_depth=depth)
+        labels = prefix_labels(truncated, X_val)
+        for k in range(forest.n_trees):
+            score = f1_score(y_val, labels[k], average='weighted')
+            if score >= baseline - tolerance:
+                candidates.append(PruneCandidate(
+                    n_trees=k + 1,
+                    max_depth=truncated.max_depth,
+                    n_nodes=forest.prune(np.arange(k + 1), depth).n_nodes,
+                    f1_score=float(score),
+                ))
+                break
+
+    best = min(candidates, key=lambda c: (c.n_nodes, c.n_trees, -c.f1_score))
+    return best, float(baseline), candidates
@@ -1,12 +1,30 @@
+import threading
 import numpy as np
+from pathlib import Path
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
+from typing import Dict, Any, List, Optional, Tuple
+from .artifacts import estimator_path, is_compressed
 from .base_model import BaseDiagnosisModel
-from typing import Dict, Any, Tuple
+from .compiled_forest import CompiledForest, EARLY_EXIT_TREE_CHUNK
+from .preprocessing import parse_blood_pressure
+
+# Largest batch scored by the compiled forest; sklearn's C tree walk wins above it
+COMPILED_BATCH_LIMIT = 512
 
 class RandomForestModel(BaseDiagnosisModel):
+    """Random forest served from its compiled node arrays.
+
+    Artifacts store the compiled forest as plain uncompressed arrays that
+    are memory-mapped on load. The sklearn estimator lives in a separate
+    file and is only unpickled when first needed (large batches, feature
+    importance), since its trees always copy their nodes into private memory.
+    """
+    name = 'random_forest'
+
     def __init__(self):
+        self._estimator_path: Optional[Path] = None
+        self._estimator_lock = threading.Lock()
         super().__init__()
         # Enhanced model parameters based on medical diagnosis requirements
         self.model = RandomForestClassifier(
@@ -18,77 +36,12 @@ class RandomForestModel(BaseDiagnosisModel):
             class_weight='balanced'
         )
         self.scaler = StandardScaler()
-        
-        # Initialize with training data
-        self._initialize_model()
-    
-    def _initialize_model(self):
-        """Initialize model with training data following the system architecture."""
-        # Medical dataset (disease symptoms)
-        X_train = np.array([
-            # Healthy cases (Normal ranges)
-            [85, 80, 20, 80, 22, 0.2, 35],   # Young adult, healthy
-            [90, 85, 22, 90, 23, 0.3, 40],   # Middle-aged, healthy
-            [95, 90, 25, 100, 24, 0.25, 45], # Middle-aged, healthy
-            [92, 82, 21, 85, 21.5, 0.22, 38],# Adult, very healthy
-            [88, 78, 19, 75, 20.5, 0.18, 32],# Young adult, athletic
-            [93, 88, 23, 95, 23.5, 0.28, 42],# Middle-aged, active
-            
-            # Pre-diabetic cases (Borderline ranges)
-            [120, 95, 28, 130, 27, 0.45, 50],  # Early pre-diabetes
-            [125, 100, 30, 140, 28, 0.5, 55],  # Pre-diabetes with family history
-            [130, 105, 32, 150, 29, 0.55, 60], # Pre-diabetes with hypertension
-            [118, 98, 29, 135, 27.5, 0.48, 52],# Early pre-diabetes
-            [128, 102, 31, 145, 28.5, 0.52, 57],# Pre-diabetes with obesity
-            [122, 97, 28, 138, 27.8, 0.47, 51], # Pre-diabetes
-            
-            # Diabetic cases (Above threshold ranges)
-            [140, 110, 35, 160, 31, 0.7, 65],  # Type 2 diabetes
-            [150, 115, 38, 170, 32, 0.8, 70],  # Advanced diabetes
-            [160, 120, 40, 180, 33, 0.9, 75],  # Severe diabetes
-            [145, 112, 36, 165, 31.5, 0.75, 67],# Uncontrolled diabetes
-            [155, 118, 39, 175, 32.5, 0.85, 72],# Long-term diabetes
-            [142, 111, 35, 162, 31.2, 0.72, 66] # Moderate diabetes
-        ])
-        
-        # Disease labels
-        y_train = np.array([0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2])
-        
-        # Split into training and validation sets
-        X_train, X_val, y_train, y_val = train_test_split(
-            X_train, y_train, test_size=0.2, random_state=42, stratify=y_train
-        )
-        
-        # Train the model
-        self.train(X_train, y_train)
-        
-        # Evaluate the model
-        metrics = self.evaluate_model(X_val, y_val)
-        print("Model Performance Metrics:")
-        for metric, value in metrics.items():
-            print(f"{metric}: {value:.4f}")
+        self.compiled: CompiledForest = None
 
     def preprocess_blood_pressure(self, bp_str: str) -> float:
         """Convert blood pressure string to a single numeric value."""
-        try:
-            systolic, diastolic = map(float, bp_str.split('/'))
-            # Use mean arterial pressure formula
-            return (systolic + 2 * diastolic) / 3
-        except (ValueError, AttributeError):
-            return 0.0
-
-    def preprocess_data(self, data: Dict[str, Any]) -> np.ndarray:
-        """Preprocess input data with blood pressure handling."""
-        processed_data = data.copy()
-        if 'blood_pressure' in processed_data:
-            processed_data['blood_pressure'] = self.preprocess_blood_pressure(processed_data['blood_pressure'])
-        
-        features = np.array([[
-            float(processed_data.get(feature, 0)) for feature in self.feature_names
-        ]])
-        if self.scaler:
-            features = self.scaler.transform(features)
-        return features
+        _, _, mean_arterial = parse_blood_pressure([bp_str])
+        return 0.0 if np.isnan(mean_arterial[0]) else float(mean_arterial[0])
 
     def train(self, X: np.ndarray, y: np.ndarray) -> None:
         """Train the Random Forest model following the preprocessing pipeline."""
@@ -98,19 +51,130 @@ class RandomForestModel(BaseDiagnosisModel):
         
         # Train the model
         self.model.fit(X_scaled, y)
+        self.compile()
+
+    def fit_scaled(self, X_scaled: np.ndarray, y: np.ndarray) -> None:
+        """Fit the forest on pre-scaled features and compile it."""
+        self.model.fit(X_scaled, y)
+        self.compile()
+
+    def compile(self) -> None:
+        """Export the fitted forest into the flat array inference engine.
+
+        The scaler is folded into the split thresholds, so inference runs on
+        raw features.
+        """
+        self.compiled = CompiledForest.from_sklearn(self.model).fold_scaler(self.scaler)
+
+    @property
+    def model(self) -> Optional[RandomForestClassifier]:
+        """The sklearn estimator, unpickled from its sidecar on first access."""
+        model = self.__dict__.get('_model')
+        if model is None and self._estimator_path is not None:
+            with self._estimator_lock:
+                model = self.__dict__.get('_model')
+                if model is None and self._estimator_path.exists():
+                    import joblib
+                    model = joblib.load(self._estimator_path)
+                    # A cache fill rather than a mutation, so allowed when frozen
+                    self.__dict__['_model'] = model
+        return model
+
+    @model.setter
+    def model(self, value: Optional[RandomForestClassifier]) -> None:
+        self.__dict__['_model'] = value
+
+    @property
+    def classes_(self) -> np.ndarray:
+        return self.compiled.classes
+
+    def save_model(self, path: str, compress: int = 0) -> List[Path]:
+        """Save the compiled arrays and, if there is one, the estimator beside them.
+
+        Pruned forests have no matching sklearn estimator and are saved
+        compiled-only; they serve every batch size from the compiled arrays.
+        """
+        import joblib
+        joblib.dump({
+            'compiled': self.compiled.to_arrays(),
+            'scaler': self.scaler,
+            'version': self.version
+        }, path, compress=compress)
+        if self.model is None:
+            return [Path(path)]
+        joblib.dump(self.model, estimator_path(path), compress=compress)
+        return [Path(path), estimator_path(path)]
+
+    def load_model(self, path: str) -> None:
+        """Load model from disk, memory-mapping the compiled forest."""
+        import joblib
+        data = joblib.load(path, mmap_mode=None if is_compressed(path) else 'r')
+        if 'compiled' not in data:
+            # Artifacts from before the compiled format carry only the estimator
+            super().load_model(path)
+            self.compile()
+            return
+        self.compiled = CompiledForest.from_arrays(data['compiled'])
+        self.scaler = data['scaler']
+        self.version = data.get('version')
+        self.model = None
+        self._estimator_path = estimator_path(path)
+        self.prediction_cache.clear()
+
+    def scale_features(self, features: np.ndarray) -> np.ndarray:
+        """Pass raw features through; scaling is folded into the compiled forest."""
+        return features
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Get class probabilities, using the compiled forest for small batches.
+
+        Larger batches go to sklearn unless the artifact has no estimator.
+        """
+        if len(X) <= COMPILED_BATCH_LIMIT or self.model is None:
+            return self.compiled.predict_proba(X)
+        return self.model.predict_proba(super().scale_features(X))
+
+    def predict_early_exit(
+        self,
+        X: np.ndarray,
+        tree_chunk: int = EARLY_EXIT_TREE_CHUNK,
+        tolerance: float = 0.0
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Approximate inference that stops each row once its vote is settled.
+
+        Returns labels, probabilities, confidences and trees used per row.
+        With ``tolerance=0`` the labels match full evaluation; confidences
+        come from the trees actually evaluated. Not used when serving: for
+        single rows it is slower than full evaluation at every tolerance.
+        """
+        probabilities, trees_used = self.compiled.predict_proba_early_exit(
+            X, tree_chunk=tree_chunk, tolerance=tolerance
+        )
+        predictions = self.classes_[np.argmax(probabilities, axis=1)]
+        return predictions, probabilities, self.scale_confidence(probabilities), trees_used
+
+    def get_prediction_with_confidence_early_exit(
+        self,
+        data: Dict[str, Any],
+        tree_chunk: int = EARLY_EXIT_TREE_CHUNK,
+        tolerance: float = 0.0
+    ) -> Tuple[int, float, int]:
+        """Get prediction, confidence and the number of trees evaluated."""
+        features = self.preprocess_data(data)
+        predictions, _, confidences, trees_used = self.predict_early_exit(
+            features, tree_chunk=tree_chunk, tolerance=tolerance
+        )
+        return int(predictions[0]), float(confidences[0]), int(trees_used[0])
 
     def predict(self, X: np.ndarray) -> np.ndarray:
         """Make predictions using the Random Forest model."""
-        return self.model.predict(X)
+        predictions, _, _ = self.predict_with_proba(X)
+        return predictions
 
     def get_confidence_score(self, X: np.ndarray) -> float:
         """Get prediction probability as confidence score."""
-        probabilities = self.model.predict_proba(X)
-        confidence = float(np.max(probabilities[0]) * 100)  # Convert to percentage
-        
-        # Apply sigmoid scaling to boost mid-range confidences
-        scaled_confidence = 100 / (1 + np.exp(-0.1 * (confidence - 50)))
-        return scaled_confidence
+        probabilities = self.predict_proba(X)
+        return float(self.scale_confidence(probabilities[0]))
 
     def get_feature_importance(self) -> dict:
         """Get feature importance scores for interpretability."""
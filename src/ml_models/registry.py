@@ -0,0 +1,105 @@
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Type
+from config.settings import DEFAULT_MODEL, TRAIN_MODEL_IF_MISSING
+from .artifacts import artifact_path, find_artifact
+from .base_model import BaseDiagnosisModel
+from .factory import get_model_class
+from .preprocessing import FEATURE_NAMES
+
+class ModelRegistry:
+    """Process-wide cache of loaded models keyed by (name, version).
+
+    Each artifact is loaded once per process and the same frozen instance is
+    handed to every caller, so Streamlit sessions and threads share one copy.
+    """
+
+    def __init__(self, model_dir: Optional[Path] = None):
+        self.model_dir = model_dir
+        self._models: Dict[Tuple[str, str], BaseDiagnosisModel] = {}
+        self._active: Dict[str, BaseDiagnosisModel] = {}
+        self._lock = threading.RLock()
+
+    def get(self, name: str = DEFAULT_MODEL, version: Optional[str] = None) -> BaseDiagnosisModel:
+        """Get a shared model instance, loading its artifact on first use.
+
+        Without a version the latest compatible artifact at first load is
+        returned.
+        """
+        model_class = get_model_class(name)
+
+        # Lock-free fast path once the model is loaded
+        if version is None:
+            model = self._active.get(name)
+        else:
+            model = self._models.get((name, version))
+        if model is not None:
+            return model
+
+        with self._lock:
+            return self._load(model_class, version)
+
+    def _load(self, model_class: Type[BaseDiagnosisModel], version: Optional[str]) -> BaseDiagnosisModel:
+        name = model_class.name
+        # Another thread may have loaded it while we waited for the lock
+        if version is None and name in self._active:
+            return self._active[name]
+        if version is not None and (name, version) in self._models:
+            return self._models[(name, version)]
+
+        if version is None:
+            path = find_artifact(name, FEATURE_NAMES, self.model_dir)
+        else:
+            path = artifact_path(name, version, self.model_dir)
+        model = model_class.from_artifact(
+            path, train_if_missing=TRAIN_MODEL_IF_MISSING and version is None
+        )
+        model = self._models.setdefault((name, model.version), model)
+        model.freeze()
+        model.warm_up()
+        if version is None:
+            self._active[name] = model
+        return model
+
+    def activate(self, name: str, version: str) -> BaseDiagnosisModel:
+        """Load a version and make it the one served by ``get(name)``.
+
+        The new model is loaded and warmed before the swap, which is a single
+        dict assignment. Requests already holding the previous instance
+        finish on it; the registry drops its own reference.
+        """
+        model = self.get(name, version)
+        with self._lock:
+            previous = self._active.get(name)
+            self._active[name] = model
+            if previous is not None and previous is not model:
+                self._models.pop((name, previous.version), None)
+        return model
+
+    def warm(self, name: str = DEFAULT_MODEL, version: Optional[str] = None) -> BaseDiagnosisModel:
+        """Load a model ahead of the first request."""
+        return self.get(name, version)
+
+    def unload(self, name: Optional[str] = None, version: Optional[str] = None) -> None:
+        """Drop loaded models so their memory can be reclaimed."""
+        with self._lock:
+            for key in list(self._models):
+                if name is not None and key[0] != name:
+                    continue
+                if version is not None and key[1] != version:
+                    continue
+                model = self._models.pop(key)
+                if self._active.get(key[0]) is model:
+                    del self._active[key[0]]
+
+    def loaded(self) -> Dict[Tuple[str, str], BaseDiagnosisModel]:
+        """Snapshot of the currently loaded models."""
+        with self._lock:
+            return dict(self._models)
+
+    def active(self) -> Dict[str, BaseDiagnosisModel]:
+        """Snapshot of the model served for each name."""
+        with self._lock:
+            return dict(self._active)
+
+model_registry = ModelRegistry()
@@ -0,0 +1,39 @@
+import numpy as np
+from sklearn.svm import SVC
+from sklearn.preprocessing import StandardScaler
+from .base_model import BaseDiagnosisModel
+
+class SVMModel(BaseDiagnosisModel):
+    name = 'svm'
+
+    def __init__(self):
+        super().__init__()
+        # RBF kernel with Platt-scaled probabilities for confidence scores
+        self.model = SVC(
+            kernel='rbf',
+            C=1.0,
+            gamma='scale',
+            probability=True,
+            random_state=42,
+            class_weight='balanced'
+        )
+        self.scaler = StandardScaler()
+
+    def train(self, X: np.ndarray, y: np.ndarray) -> None:
+        """Train the SVM model following the preprocessing pipeline."""
+        # Scale the features
+        self.scaler.fit(X)
+        X_scaled = self.scaler.transform(X)
+
+        # Train the model
+        self.model.fit(X_scaled, y)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Make predictions using the SVM model."""
+        predictions, _, _ = self.predict_with_proba(X)
+        return predictions
+
+    def get_confidence_score(self, X: np.ndarray) -> float:
+        """Get prediction probability as confidence score."""
+        probabilities = self.predict_proba(X)
+        return float(self.scale_confidence(probabilities[0]))
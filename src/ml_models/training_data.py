@@ -0,0 +1,77 @@
+import numpy as np
+from typing import Tuple
+from sklearn.model_selection import train_test_split
+
+# Medical dataset (disease symptoms)
+DEFAULT_TRAINING_FEATURES = np.array([
+    # Healthy cases (Normal ranges)
+    [85, 80, 20, 80, 22, 0.2, 35],   # Young adult, healthy
+    [90, 85, 22, 90, 23, 0.3, 40],   # Middle-aged, healthy
+    [95, 90, 25, 100, 24, 0.25, 45], # Middle-aged, healthy
+    [92, 82, 21, 85, 21.5, 0.22, 38],# Adult, very healthy
+    [88, 78, 19, 75, 20.5, 0.18, 32],# Young adult, athletic
+    [93, 88, 23, 95, 23.5, 0.28, 42],# Middle-aged, active
+
+    # Pre-diabetic cases (Borderline ranges)
+    [120, 95, 28, 130, 27, 0.45, 50],  # Early pre-diabetes
+    [125, 100, 30, 140, 28, 0.5, 55],  # Pre-diabetes with family history
+    [130, 105, 32, 150, 29, 0.55, 60], # Pre-diabetes with hypertension
+    [118, 98, 29, 135, 27.5, 0.48, 52],# Early pre-diabetes
+    [128, 102, 31, 145, 28.5, 0.52, 57],# Pre-diabetes with obesity
+    [122, 97, 28, 138, 27.8, 0.47, 51], # Pre-diabetes
+
+    # Diabetic cases (Above threshold ranges)
+    [140, 110, 35, 160, 31, 0.7, 65],  # Type 2 diabetes
+    [150, 115, 38, 170, 32, 0.8, 70],  # Advanced diabetes
+    [160, 120, 40, 180, 33, 0.9, 75],  # Severe diabetes
+    [145, 112, 36, 165, 31.5, 0.75, 67],# Uncontrolled diabetes
+    [155, 118, 39, 175, 32.5, 0.85, 72],# Long-term diabetes
+    [142, 111, 35, 162, 31.2, 0.72, 66] # Moderate diabetes
+])
+
+# Disease labels
+DEFAULT_TRAINING_LABELS = np.array([0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2, 2, 2])
+
+# Human-readable names of the labels above, recorded in artifact manifests
+LABEL_NAMES = {0: 'Healthy', 1: 'Pre-diabetes', 2: 'Diabetes'}
+
+def load_default_dataset() -> Tuple[np.ndarray, np.ndarray]:
+    """Return copies of the built-in training features and labels."""
+    return DEFAULT_TRAINING_FEATURES.copy(), DEFAULT_TRAINING_LABELS.copy()
+
+def sample_cluster_features(
+    y: np.ndarray, rng: np.random.Generator, spread: float = 2.0
+) -> np.ndarray:
+    """Draw one feature row per label around the built-in cluster of that label.
+
+    Rows come from a normal distribution per class using the cluster's mean
+    and its standard deviation widened by ``spread``, so the classes overlap
+    the way real measurements do. Values are clipped at zero.
+    """
+    X = np.empty((len(y), DEFAULT_TRAINING_FEATURES.shape[1]))
+    for label in np.unique(DEFAULT_TRAINING_LABELS):
+        cluster = DEFAULT_TRAINING_FEATURES[DEFAULT_TRAINING_LABELS == label]
+        rows = y == label
+        X[rows] = rng.normal(
+            cluster.mean(axis=0), cluster.std(axis=0) * spread,
+            size=(rows.sum(), cluster.shape[1])
+        )
+    return np.clip(X, 0, None)
+
+def make_synthetic_dataset(
+    n_samples: int, random_state: int = 42, spread: float = 2.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample a larger dataset around the built-in healthy, pre-diabetic and diabetic clusters."""
+    rng = np.random.default_rng(random_state)
+    y = rng.choice(np.unique(DEFAULT_TRAINING_LABELS), size=n_samples)
+    return sample_cluster_features(y, rng, spread), y
+
+def split_validation(
+    X: np.ndarray, y: np.ndarray, test_size: float = 0.2
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Stratified train/validation split, identical on every call for the same data.
+
+    Training holds out this split, so offline jobs can repeat it to score a
+    model on exactly the rows it was not fitted on.
+    """
+    return train_test_split(X, y, test_size=test_size, random_state=42, stratify=y)
@@ -0,0 +1,171 @@
+import itertools
+import multiprocessing
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import numpy as np
+from sklearn.model_selection import StratifiedKFold
+from sklearn.preprocessing import StandardScaler
+from .factory import create_model
+
+# Candidate values explored per model; every name is an estimator parameter
+SEARCH_SPACES: Dict[str, Dict[str, list]] = {
+    'random_forest': {
+        'n_estimators': [25, 50, 100, 200],
+        'max_depth': [4, 8, 15, None],
+        'min_samples_split': [2, 5, 10],
+        'min_samples_leaf': [1, 2, 4],
+        'max_features': ['sqrt', 0.5],
+    },
+    'svm': {
+        'C': [0.1, 1.0, 10.0],
+        'gamma': ['scale', 0.01, 0.1],
+    },
+    'logistic_regression': {
+        'C': [0.01, 0.1, 1.0, 10.0],
+    },
+}
+
+# Single-row predictions timed per candidate and fold
+LATENCY_SAMPLES = 200
+
+@dataclass
+class CandidateResult:
+    """Cross-validated quality and cost of one parameter set."""
+    params: Dict[str, Any]
+    metrics: Dict[str, float]
+    training_seconds: float
+    latency_p50_ms: float
+    latency_p99_ms: float
+    folds: int
+    pareto: bool = field(default=False)
+
+def grid_candidates(space: Dict[str, list]) -> Iterator[Dict[str, Any]]:
+    """Every combination of the search space."""
+    names = list(space)
+    for values in itertools.product(*(space[name] for name in names)):
+        yield dict(zip(names, values))
+
+def random_candidates(
+    space: Dict[str, list], n_candidates: int, random_state: int = 42
+) -> List[Dict[str, Any]]:
+    """Distinct combinations sampled uniformly from the grid."""
+    grid = list(grid_candidates(space))
+    rng = np.random.default_rng(random_state)
+    picked = rng.choice(len(grid), size=min(n_candidates, len(grid)), replace=False)
+    return [grid[i] for i in picked]
+
+@dataclass
+class _Fold:
+    scaler: StandardScaler
+    X_train_scaled: np.ndarray
+    y_train: np.ndarray
+    X_val: np.ndarray
+    y_val: np.ndarray
+
+# Per-process state filled once by _init_worker and reused by every candidate
+_model_name: Optional[str] = None
+_folds: List[_Fold] = []
+
+def _init_worker(model_name: str, X: np.ndarray, y: np.ndarray, n_splits: int, random_state: int) -> None:
+    """Split the data and fit one scaler per fold, once per worker process."""
+    global _model_name, _folds
+    _model_name = model_name
+    _folds = []
+    splitter = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    for train_index, val_index in splitter.split(X, y):
+        scaler = StandardScaler().fit(X[train_index])
+        _folds.append(_Fold(
+            scaler=scaler,
+            X_train_scaled=scaler.transform(X[train_index]),
+            y_train=y[train_index],
+            X_val=X[val_index],
+            y_val=y[val_index],
+        ))
+
+def _evaluate(params: Dict[str, Any]) -> CandidateResult:
+    """Fit and score one candidate on every cached fold."""
+    fold_metrics, training_seconds, latencies = [], 0.0, []
+    for fold in _folds:
+        model = create_model(_model_name)
+        model.model.set_params(**params)
+        model.scaler = fold.scaler
+
+        start = time.perf_counter()
+        model.fit_scaled(fold.X_train_scaled, fold.y_train)
+        training_seconds += time.perf_counter() - start
+
+        fold_metrics.append(model.evaluate_model(model.scale_features(fold.X_val), fold.y_val))
+        # Time the serving path: raw row in, label and confidence out
+        for row in fold.X_val[:LATENCY_SAMPLES]:
+            start = time.perf_counter()
+            model.predict_with_proba(model.scale_features(row[None]))
+            latencies.append(time.perf_counter() - start)
+
+    latencies_ms = np.asarray(latencies) * 1000
+    return CandidateResult(
+        params=params,
+        metrics={
+            metric: float(np.mean([m[metric] for m in fold_metrics]))
+            for metric in fold_metrics[0]
+        },
+        training_seconds=training_seconds / len(_folds),
+        latency_p50_ms=float(np.percentile(latencies_ms, 50)),
+        latency_p99_ms=float(np.percentile(latencies_ms, 99)),
+        folds=len(_folds),
+    )
+
+def mark_pareto_front(results: List[CandidateResult], metric: str = 'f1_score') -> List[CandidateResult]:
+    """Flag candidates no other candidate beats on both ``metric`` and p50 latency.
+
+    Returns the front ordered from fastest to slowest.
+    """
+    for result in results:
+        result.pareto = not any(
+            other.metrics[metric] >= result.metrics[metric]
+            and other.latency_p50_ms <= result.latency_p50_ms
+            and (other.metrics[metric] > result.metrics[metric]
+                 or other.latency_p50_ms < result.latency_p50_ms)
+            for other in results
+        )
+    return sorted((r for r in results if r.pareto), key=lambda r: r.latency_p50_ms)
+
+def pick_candidate(
+    front: List[CandidateResult], tolerance: float = 0.0, metric: str = 'f1_score'
+) -> CandidateResult:
+    """Fastest front candidate within ``tolerance`` of the best ``metric``."""
+    best = max(result.metrics[metric] for result in front)
+    return next(r for r in front if r.metrics[metric] >= best - tolerance)
+
+def search(
+    model_name: str,
+    X: np.ndarray,
+    y: np.ndarray,
+    candidates: List[Dict[str, Any]],
+    n_splits: int = 5,
+    max_workers: Optional[int] = None,
+    random_state: int = 42,
+    on_result: Optional[Callable[[CandidateResult], None]] = None,
+) -> List[CandidateResult]:
+    """Cross-validate candidates across a process pool.
+
+    Each worker receives the data once, through its initializer, and keeps
+    the fold splits and scaled training matrices for all of its candidates.
+    ``on_result`` runs in this process as each candidate finishes, e.g. to
+    record it in the database. An interrupt stops the workers instead of
+    waiting for the remaining candidates.
+    """
+    results = []
+    with multiprocessing.Pool(
+        processes=max_workers,
+        initializer=_init_worker,
+        initargs=(model_name, X, y, n_splits, random_state),
+    ) as pool:
+        # Leaving the block terminates the workers, so an interrupt does not
+        # wait for the candidates in flight; only finished candidates are kept
+        for result in pool.imap_unordered(_evaluate, candidates):
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    mark_pareto_front(results)
+    return results
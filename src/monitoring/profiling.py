@@ -0,0 +1,115 @@
+import cProfile
+import pstats
+import random
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+from config.settings import (
+    PROFILING_ENABLED, PROFILING_SAMPLE_RATE, PROFILE_DIR, PROFILE_KEEP, PROFILE_TOP_N
+)
+
+@dataclass
+class PageProfile:
+    """A captured profile of one rerun and the top of its cumulative-time table."""
+    page: str
+    path: Path
+    captured_at: str
+    total_seconds: float
+    top: List[Dict[str, Any]] = field(default_factory=list)
+
+def top_functions(stats: pstats.Stats, limit: int = PROFILE_TOP_N) -> List[Dict[str, Any]]:
+    """The ``limit`` functions with the highest cumulative time."""
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [
+        {
+            'function': pstats.func_std_string(func),
+            'calls': calls,
+            'tottime_ms': tottime * 1000,
+            'cumtime_ms': cumtime * 1000,
+        }
+        for func, (_, calls, tottime, cumtime, _) in rows
+    ]
+
+class PageProfiler:
+    """Profile a sampled fraction of Streamlit reruns with cProfile.
+
+    Each sampled rerun is written to ``directory`` as a ``.prof`` file
+    (open it with ``python -m pstats`` or snakeviz); only the newest
+    ``keep`` files are kept. One rerun is profiled at a time per process,
+    since cProfile cannot nest across threads; overlapping reruns are
+    simply not sampled.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = PROFILING_ENABLED,
+        sample_rate: float = PROFILING_SAMPLE_RATE,
+        directory: Path = PROFILE_DIR,
+        keep: int = PROFILE_KEEP,
+        top_n: int = PROFILE_TOP_N,
+    ):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.directory = Path(directory)
+        self.keep = keep
+        self.top_n = top_n
+        self._active = threading.Lock()
+
+    @contextmanager
+    def profile(self, page: str) -> Iterator[List[PageProfile]]:
+        """Profile the enclosed block if this rerun is sampled.
+
+        Yields a list that holds the ``PageProfile`` once the block exits
+        and stays empty when the rerun was not sampled.
+        """
+        captured: List[PageProfile] = []
+        if not self.enabled or random.random() >= self.sample_rate:
+            yield captured
+            return
+        if not self._active.acquire(blocking=False):
+            yield captured
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiling tool (a debugger, say) owns the interpreter
+            self._active.release()
+            yield captured
+            return
+        try:
+            yield captured
+        finally:
+            # Also reached when the page ends in st.rerun() or st.stop()
+            profiler.disable()
+            self._active.release()
+            captured.append(self._save(page, profiler))
+
+    def _save(self, page: str, profiler: cProfile.Profile) -> PageProfile:
+        now = datetime.utcnow()
+        slug = re.sub(r'[^a-z0-9]+', '-', page.lower()).strip('-') or 'page'
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{now:%Y%m%d-%H%M%S-%f}-{slug}.prof"
+        profiler.dump_stats(path)
+        self.rotate()
+
+        stats = pstats.Stats(profiler)
+        return PageProfile(
+            page=page,
+            path=path,
+            captured_at=now.isoformat(),
+            total_seconds=stats.total_tt,
+            top=top_functions(stats, self.top_n),
+        )
+
+    def rotate(self) -> None:
+        """Delete all but the newest ``keep`` profiles."""
+        profiles = sorted(self.directory.glob('*.prof'), key=lambda p: p.name, reverse=True)
+        for stale in profiles[self.keep:]:
+            stale.unlink(missing_ok=True)
+
+page_profiler = PageProfiler()
@@ -0,0 +1,112 @@
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional, Tuple
+from config.settings import QUERY_REPEAT_WARNING, SLOW_QUERY_MS
+from .tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+class QueryStats:
+    """Number and total time of the SQL statements run inside a scope.
+
+    Statements are also counted by their text, so the same query issued
+    once per row of a loop (an N+1) stands out in ``repeated``.
+    """
+
+    def __init__(self, name: str, parent: Optional['QueryStats'] = None):
+        self.name = name
+        self.parent = parent
+        self.count = 0
+        self.seconds = 0.0
+        self.slow = 0
+        self.statements: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def milliseconds(self) -> float:
+        return self.seconds * 1000
+
+    def record(self, statement: str, seconds: float, slow: bool) -> None:
+        with self._lock:
+            self.count += 1
+            self.seconds += seconds
+            self.slow += slow
+            self.statements[statement] += 1
+
+    def repeated(self, min_count: int = QUERY_REPEAT_WARNING) -> List[Tuple[str, int]]:
+        """Statements run at least ``min_count`` times, most frequent first."""
+        with self._lock:
+            return [(s, n) for s, n in self.statements.most_common() if n >= min_count]
+
+    def reset(self) -> None:
+        with self._lock:
+            self.count = 0
+            self.seconds = 0.0
+            self.slow = 0
+            self.statements.clear()
+
+# Every statement of the process, for tests and diagnostics
+process_stats = QueryStats('process')
+_current_scope: ContextVar[Optional[QueryStats]] = ContextVar('query_scope', default=None)
+
+def current_scope() -> Optional[QueryStats]:
+    """Innermost open query scope of this context, if any."""
+    return _current_scope.get()
+
+@contextmanager
+def query_scope(name: str) -> Iterator[QueryStats]:
+    """Attribute the statements run inside the block to ``name``.
+
+    Scopes nest: a statement counts toward every enclosing scope, so a page
+    render includes the service calls it makes. On exit, statements
+    repeated ``QUERY_REPEAT_WARNING`` times or more are logged as a likely
+    N+1, and the totals are added to the enclosing tracing span if any.
+    """
+    stats = QueryStats(name, _current_scope.get())
+    token = _current_scope.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_scope.reset(token)
+        for statement, count in stats.repeated():
+            logger.warning(
+                "Possible N+1 in %s: statement ran %d times: %s",
+                name, count, _one_line(statement)
+            )
+        span = tracer.current()
+        if span is not None:
+            span.set(db_queries=stats.count, db_ms=stats.milliseconds)
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    """Types of the bound parameters without their values, which may hold patient data."""
+    if executemany and isinstance(parameters, (list, tuple)):
+        first = parameter_shape(parameters[0]) if parameters else None
+        return {'rows': len(parameters), 'row': first}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+def record_query(statement: str, parameters: Any, seconds: float, executemany: bool) -> None:
+    """Count one finished statement toward the process and every open scope."""
+    slow = seconds * 1000 >= SLOW_QUERY_MS
+    process_stats.record(statement, seconds, slow)
+    scope = _current_scope.get()
+    while scope is not None:
+        scope.record(statement, seconds, slow)
+        scope = scope.parent
+    if slow:
+        current = _current_scope.get()
+        logger.warning(
+            "Slow query (%.1f ms) in %s: %s; parameters %s",
+            seconds * 1000, current.name if current is not None else "no scope",
+            _one_line(statement), parameter_shape(parameters, executemany)
+        )
+
+def _one_line(statement: str, limit: int = 500) -> str:
+    statement = ' '.join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + '...'
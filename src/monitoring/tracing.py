@@ -0,0 +1,182 @@
+import atexit
+import functools
+import itertools
+import json
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional
+from config.settings import LOG_FILE, TRACING_ENABLED
+
+# Seconds between writes of queued spans
+TRACE_FLUSH_INTERVAL = 1.0
+# Span ids are a per-process random prefix plus a counter, cheaper than uuid4
+_SPAN_PREFIX = uuid.uuid4().hex[:8]
+_span_ids = itertools.count(1)
+
+class Span:
+    """One timed stage of a request, nested under the span that was open when it started."""
+
+    __slots__ = (
+        'name', 'trace_id', 'span_id', 'parent_id', 'attributes',
+        'started_at', 'duration_ms', 'status', 'error', '_start'
+    )
+
+    def __init__(self, name: str, parent: Optional['Span'], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else uuid.uuid4().hex
+        self.span_id = f"{_SPAN_PREFIX}{next(_span_ids):08x}"
+        self.parent_id = parent.span_id if parent is not None else None
+        self.attributes = attributes
+        # Wall clock only labels the span; durations use the monotonic clock
+        self.started_at = time.time()
+        self.duration_ms: Optional[float] = None
+        self.status = 'ok'
+        self.error: Optional[str] = None
+        self._start = time.perf_counter()
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes learned while the span is open."""
+        self.attributes.update(attributes)
+
+    def finish(self) -> None:
+        self.duration_ms = (time.perf_counter() - self._start) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'timestamp': datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'duration_ms': self.duration_ms,
+            'status': self.status,
+            'error': self.error,
+            'attributes': self.attributes,
+        }
+
+class _SpanWriter(threading.Thread):
+    """Daemon thread that periodically appends queued spans to a file.
+
+    Waking once per interval rather than once per span keeps the writer
+    from competing with request threads for the GIL mid-request.
+    """
+
+    def __init__(self, path: Path, spans: queue.SimpleQueue, interval: float):
+        super().__init__(name='trace-writer', daemon=True)
+        self.path = path
+        self.spans = spans
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as out:
+            while not self.stopped.wait(self.interval):
+                self.write_pending(out)
+            self.write_pending(out)
+
+    def write_pending(self, out) -> None:
+        lines = []
+        while True:
+            try:
+                lines.append(json.dumps(self.spans.get_nowait().to_dict(), default=str))
+            except queue.Empty:
+                break
+        if lines:
+            out.write('\n'.join(lines) + '\n')
+            out.flush()
+
+class Tracer:
+    """Nested request spans written as JSON lines by a background thread.
+
+    The request thread only puts finished spans on an in-memory queue; a
+    writer thread serializes them and appends them to ``path`` every
+    ``TRACE_FLUSH_INTERVAL`` seconds. The current
+    span is held in a context variable, so nesting follows the call stack
+    within a thread or asyncio task. When disabled, ``span`` yields None
+    and records nothing.
+    """
+
+    def __init__(self, path: Path = LOG_FILE, enabled: bool = TRACING_ENABLED):
+        self.path = Path(path)
+        self.enabled = enabled
+        self._current: ContextVar[Optional[Span]] = ContextVar('current_span', default=None)
+        self._spans: Optional[queue.SimpleQueue] = None
+        self._writer: Optional[_SpanWriter] = None
+        self._lock = threading.Lock()
+
+    def _start_writer(self) -> queue.SimpleQueue:
+        with self._lock:
+            if self._spans is None:
+                spans: queue.SimpleQueue = queue.SimpleQueue()
+                self._writer = _SpanWriter(self.path, spans, TRACE_FLUSH_INTERVAL)
+                self._writer.start()
+                self._spans = spans
+        return self._spans
+
+    def current(self) -> Optional[Span]:
+        """The innermost open span of this context, if any."""
+        return self._current.get()
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+        """Time the enclosed block as a child of the current span.
+
+        An exception marks the span as failed and propagates unchanged.
+        """
+        if not self.enabled:
+            yield None
+            return
+        span = Span(name, self._current.get(), attributes)
+        token = self._current.set(span)
+        try:
+            yield span
+        except Exception as e:
+            span.status = 'error'
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        except BaseException as e:
+            # Control flow such as Streamlit's rerun and stop, not a failure
+            span.status = 'interrupted'
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.finish()
+            self._current.reset(token)
+            (self._spans or self._start_writer()).put(span)
+
+    def traced(self, name: Optional[str] = None) -> Callable:
+        """Decorator running the whole function inside a span."""
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def flush(self) -> None:
+        """Write out every queued span and stop the writer thread.
+
+        The writer restarts on the next span.
+        """
+        with self._lock:
+            if self._writer is not None:
+                self._writer.stopped.set()
+                self._writer.join()
+            self._spans = None
+            self._writer = None
+
+tracer = Tracer()
+span = tracer.span
+traced = tracer.traced
+
+atexit.register(tracer.flush)
@@ -1,7 +1,8 @@
+import json
 from datetime import datetime
 from typing import Dict, Any, Tuple, Optional
 from sqlalchemy.orm import Session
-from config.settings import MODEL_PATH, DEFAULT_MODEL
+from config.settings import DEFAULT_MODEL, CASCADE_ENABLED, MICRO_BATCHING_ENABLED
 from src.database.models import (
     Diagnosis, Disease, PatientRecord, MedicalParameter,
     ModelPerformance
@@ -9,19 +10,43 @@ from src.database.models import (
 from src.database.schemas import (
     DiagnosisCreate, MedicalParameterCreate
 )
-from src.ml_models.random_forest import RandomForestModel
+from src.ml_models.base_model import BaseDiagnosisModel
+from src.ml_models.batching import MicroBatcher, get_batcher
+from src.ml_models.cascade import CascadeModel, default_cascade
+from src.ml_models.registry import model_registry
+from src.monitoring.query_stats import query_scope
+from src.monitoring.tracing import span
 
 class DiagnosisService:
-    def __init__(self):
-        self.model = self._load_model()
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL,
+        cascade: Optional[CascadeModel] = None,
+        batcher: Optional[MicroBatcher] = None
+    ):
+        self.model_name = model_name
+        # Load eagerly so a missing artifact fails when the service is built
+        self._load_model()
+        # Cheap model first, model_name only for uncertain requests
+        if cascade is None and CASCADE_ENABLED and model_name == default_cascade.slow_model_name:
+            cascade = default_cascade
+        if cascade is not None:
+            # The fast stage too, or a bad artifact would surface mid-request
+            cascade.load()
+        self.cascade = cascade
+        # Concurrent sessions share one vectorized model call
+        if batcher is None and MICRO_BATCHING_ENABLED and cascade is None:
+            batcher = get_batcher(model_name)
+        self.batcher = batcher
 
-    def _load_model(self) -> RandomForestModel:
-        """Load the ML model."""
-        model = RandomForestModel()
-        model_path = MODEL_PATH / f"{DEFAULT_MODEL}.joblib"
-        if model_path.exists():
-            model.load_model(str(model_path))
-        return model
+    def _load_model(self) -> BaseDiagnosisModel:
+        """Get the process-wide shared instance of the selected ML model."""
+        return model_registry.get(self.model_name)
+
+    @property
+    def model(self) -> BaseDiagnosisModel:
+        """The currently active model, looked up per request for hot reloads."""
+        return self._load_model()
 
     def create_medical_parameters(
         self, db: Session, params: Dict[str, Any], record_id: int
@@ -83,41 +108,68 @@ class DiagnosisService:
         self, db: Session, params: Dict[str, Any], record_id: int
     ) -> Tuple[Disease, float]:
         """Make a disease prediction."""
-        # Create medical parameters record
-        self.create_medical_parameters(db, params, record_id)
-        
-        # Get prediction from model
-        prediction, confidence = self.model.get_prediction_with_confidence(params)
-        
-        # Get disease from database
-        disease = db.query(Disease).filter(Disease.disease_id == prediction).first()
-        
-        # Create diagnosis record
-        self.create_diagnosis(
-            db=db,
-            disease_id=disease.disease_id,
-            record_id=record_id,
-            confidence_score=confidence,
-            model_version=DEFAULT_MODEL,
-            notes=f"Automated diagnosis using {DEFAULT_MODEL}"
-        )
-        
+        with span('predict_disease', record_id=record_id) as trace, query_scope('predict_disease'):
+            # Create medical parameters record
+            with span('create_medical_parameters'):
+                self.create_medical_parameters(db, params, record_id)
+
+            # Get prediction from model
+            with span('model_prediction') as stage:
+                if self.cascade is not None:
+                    prediction, confidence, model = self.cascade.get_prediction_with_confidence(params)
+                    notes = f"Automated diagnosis using {model.name} (cascade)"
+                    route = 'cascade'
+                elif self.batcher is not None:
+                    prediction, confidence, model = self.batcher.get_prediction_with_confidence(params)
+                    notes = f"Automated diagnosis using {model.name}"
+                    route = 'micro_batch'
+                else:
+                    model = self.model
+                    prediction, confidence = model.get_prediction_with_confidence(params)
+                    notes = f"Automated diagnosis using {model.name}"
+                    route = 'direct'
+                if stage is not None:
+                    stage.set(route=route, model=model.name, model_version=model.version)
+
+            # Get disease from database
+            with span('disease_lookup'):
+                disease = db.query(Disease).filter(Disease.disease_id == prediction).first()
+
+            # Create diagnosis record
+            with span('create_diagnosis'):
+                self.create_diagnosis(
+                    db=db,
+                    disease_id=disease.disease_id,
+                    record_id=record_id,
+                    confidence_score=confidence,
+                    model_version=f"{model.name}-{model.version}" if model.version else model.name,
+                    notes=notes
+                )
+            if trace is not None:
+                trace.set(prediction=int(prediction), confidence=float(confidence))
+
         return disease, confidence
 
+    @staticmethod
     def update_model_performance(
-        self, db: Session, 
+        db: Session,
         metrics: Dict[str, float],
-        parameters: Dict[str, Any]
+        parameters: Dict[str, Any],
+        model_name: str = DEFAULT_MODEL,
+        dataset_version: Optional[str] = None
     ) -> ModelPerformance:
-        """Update model performance metrics."""
+        """Update model performance metrics.
+
+        Static so offline jobs can record results without loading a model.
+        """
         performance = ModelPerformance(
-            model_name=DEFAULT_MODEL,
+            model_name=model_name,
             accuracy=metrics['accuracy'],
             precision=metrics['precision'],
             recall=metrics['recall'],
             f1_score=metrics['f1_score'],
-            dataset_version=datetime.utcnow().strftime("%Y%m%d"),
-            parameters=parameters
+            dataset_version=dataset_version or datetime.utcnow().strftime("%Y%m%d"),
+            parameters=json.dumps(parameters, default=str)
         )
         db.add(performance)
         db.commit()
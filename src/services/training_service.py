@@ -0,0 +1,248 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from sklearn.utils.class_weight import compute_class_weight
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+from src.database.models import Diagnosis, Disease, MedicalParameter
+from src.ml_models.artifacts import find_artifact, new_version
+from src.ml_models.preprocessing import FEATURE_NAMES, build_feature_matrix
+from src.ml_models.random_forest import RandomForestModel
+from src.ml_models.training_data import (
+    LABEL_NAMES, load_default_dataset, make_synthetic_dataset, split_validation
+)
+from src.services.diagnosis_service import DiagnosisService
+
+# Rows fetched per round trip while streaming training data
+TRAINING_FETCH_SIZE = 10000
+# Trees added to the forest by each incremental update
+INCREMENTAL_NEW_TREES = 20
+# Diagnosis status of a label a clinician has confirmed; rejected or
+# corrected diagnoses are reviewed too but their label is wrong
+CONFIRMED_STATUS = 'confirmed'
+
+def reviewed_filter(since: Optional[int] = None, until: Optional[int] = None):
+    """Diagnoses whose label a clinician has confirmed, within a diagnosis id range."""
+    condition = (Diagnosis.reviewed_by.isnot(None)) & (Diagnosis.status == CONFIRMED_STATUS)
+    if since is not None:
+        condition &= Diagnosis.diagnosis_id > since
+    if until is not None:
+        condition &= Diagnosis.diagnosis_id <= until
+    return condition
+
+def training_query(since: Optional[int] = None, until: Optional[int] = None) -> Select:
+    """Core select pairing each reviewed diagnosis with its measurements.
+
+    Each diagnosis is joined to the latest medical parameters of the same
+    record taken at or before the diagnosis date. ``since`` and ``until``
+    bound the diagnosis ids (exclusive and inclusive).
+    """
+    latest_parameters = (
+        select(MedicalParameter.parameter_id)
+        .where(
+            MedicalParameter.record_id == Diagnosis.record_id,
+            MedicalParameter.measurement_date <= Diagnosis.diagnosis_date
+        )
+        .order_by(MedicalParameter.measurement_date.desc(), MedicalParameter.parameter_id.desc())
+        .limit(1)
+        .correlate(Diagnosis)
+        .scalar_subquery()
+    )
+    columns = [getattr(MedicalParameter, feature) for feature in FEATURE_NAMES]
+    return (
+        select(*columns, Diagnosis.disease_id)
+        .select_from(Diagnosis)
+        .join(MedicalParameter, MedicalParameter.parameter_id == latest_parameters)
+        .where(reviewed_filter(since, until))
+        .order_by(Diagnosis.diagnosis_id)
+    )
+
+def reviewed_snapshot(
+    db: Session, since: Optional[int] = None, until: Optional[int] = None
+) -> Tuple[int, Optional[int]]:
+    """Count and highest id of reviewed diagnoses after ``since`` and up to ``until``.
+
+    Read from the diagnoses table alone; the count bounds the training rows.
+    """
+    count, latest = db.execute(
+        select(func.count(), func.max(Diagnosis.diagnosis_id))
+        .select_from(Diagnosis)
+        .where(reviewed_filter(since, until))
+    ).one()
+    return count, latest
+
+def stream_training_chunks(
+    db: Session, query: Select, fetch_size: int = TRAINING_FETCH_SIZE
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yield (features, labels) chunks without building ORM objects.
+
+    ``yield_per`` makes drivers that support it (psycopg2) use a server-side
+    cursor, so only one chunk of rows is held in memory at a time.
+    """
+    result = db.execute(query, execution_options={'yield_per': fetch_size})
+    for rows in result.partitions():
+        frame = pd.DataFrame.from_records(rows, columns=FEATURE_NAMES + ['disease_id'])
+        yield build_feature_matrix(frame), frame['disease_id'].to_numpy(dtype=np.int64)
+
+def load_training_data(
+    db: Session,
+    since: Optional[int] = None,
+    fetch_size: int = TRAINING_FETCH_SIZE,
+    until: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray, Optional[int]]:
+    """Read reviewed diagnoses after the ``since`` watermark into preallocated arrays.
+
+    Returns features, labels and the new watermark: the highest diagnosis
+    id covered by the read, which the next incremental read starts after.
+    ``until`` re-reads a range that was trained on earlier.
+    """
+    max_rows, watermark = reviewed_snapshot(db, since, until)
+    if watermark is None:
+        return np.empty((0, len(FEATURE_NAMES))), np.empty(0, dtype=np.int64), since
+    query = training_query(since, watermark)
+    X = np.empty((max_rows, len(FEATURE_NAMES)))
+    y = np.empty(max_rows, dtype=np.int64)
+
+    filled = 0
+    for features, labels in stream_training_chunks(db, query, fetch_size):
+        # Reviews can land between the count and the read; grow if they do
+        if filled + len(labels) > len(y):
+            capacity = max(2 * len(y), filled + len(labels))
+            X = np.concatenate([X[:filled], np.empty((capacity - filled, X.shape[1]))])
+            y = np.concatenate([y[:filled], np.empty(capacity - filled, dtype=np.int64)])
+        X[filled:filled + len(labels)] = features
+        y[filled:filled + len(labels)] = labels
+        filled += len(labels)
+
+    return X[:filled], y[:filled], watermark
+
+def disease_names(db: Session, labels: np.ndarray) -> Dict[int, str]:
+    """Name of each label of a database-trained model, whose labels are disease ids."""
+    return dict(db.execute(
+        select(Disease.disease_id, Disease.name)
+        .where(Disease.disease_id.in_([int(label) for label in labels]))
+    ).all())
+
+def load_dataset(
+    source: str, rows: int = 5000, random_state: int = 42
+) -> Tuple[np.ndarray, np.ndarray, Dict[int, str]]:
+    """Features, labels and label names for offline jobs: built-in, synthetic or reviewed diagnoses.
+
+    ``rows`` and ``random_state`` only apply to synthetic data.
+    """
+    if source == "db":
+        from src.database.database import SessionLocal
+        db = SessionLocal()
+        try:
+            X, y, _ = load_training_data(db)
+            if len(y) == 0:
+                raise ValueError("No reviewed diagnoses with medical parameters found")
+            return X, y, disease_names(db, np.unique(y))
+        finally:
+            db.close()
+    if source == "synthetic":
+        return (*make_synthetic_dataset(rows, random_state=random_state), dict(LABEL_NAMES))
+    return (*load_default_dataset(), dict(LABEL_NAMES))
+
+def load_holdout_data(
+    db: Session, batch_watermarks: List[int], fetch_size: int = TRAINING_FETCH_SIZE
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Reviewed diagnoses that a database-trained model held out for validation.
+
+    Re-reads each id range the model was trained on, the initial fit and
+    then every incremental update, and repeats that range's split, so the
+    result is data none of the trees were fitted on.
+    """
+    X_parts, y_parts = [], []
+    since = None
+    for until in batch_watermarks:
+        X, y, _ = load_training_data(db, since=since, fetch_size=fetch_size, until=until)
+        if len(y):
+            _, X_val, _, y_val = split_validation(X, y)
+            X_parts.append(X_val)
+            y_parts.append(y_val)
+        since = until
+    if not y_parts:
+        raise ValueError("No reviewed diagnoses found in the ranges the model was trained on")
+    return np.concatenate(X_parts), np.concatenate(y_parts)
+
+def update_model_incrementally(
+    db: Session,
+    model_dir: Optional[Path] = None,
+    new_trees: int = INCREMENTAL_NEW_TREES,
+    validation_size: float = 0.2,
+    fetch_size: int = TRAINING_FETCH_SIZE
+) -> Optional[Path]:
+    """Grow the latest random forest with trees fitted only on newly reviewed data.
+
+    Reads the reviewed diagnoses after the artifact's watermark, fits
+    ``new_trees`` extra trees on them with ``warm_start`` (the existing
+    trees and the scaler stay as they are), and writes a new artifact with
+    the advanced watermark. Metrics come from a held-out slice of the new
+    data and are recorded in model_performance. Returns the new artifact
+    path, or None when nothing new has been reviewed.
+    """
+    path = find_artifact(RandomForestModel.name, FEATURE_NAMES, model_dir)
+    if path is None:
+        raise FileNotFoundError("No random forest artifact found. Run scripts/train_model.py first.")
+    model = RandomForestModel.from_artifact(path)
+    if model.watermark is None:
+        raise ValueError(
+            "The artifact has no watermark; train it with scripts/train_model.py --source db first"
+        )
+    if model.model is None:
+        raise ValueError("The artifact has no sklearn estimator to extend (was it pruned?)")
+
+    X, y, watermark = load_training_data(db, since=model.watermark, fetch_size=fetch_size)
+    if len(y) == 0:
+        return None
+    # New trees vote in the same probability columns as the old ones
+    if not np.array_equal(np.unique(y), model.classes_):
+        raise ValueError(
+            f"New data has labels {np.unique(y).tolist()}, the model needs all of "
+            f"{model.classes_.tolist()}; wait for more reviews"
+        )
+
+    X_train, X_val, y_train, y_val = split_validation(X, y, validation_size)
+    previous_trees = model.compiled.n_trees
+    previous_watermark = model.watermark
+    class_weight = model.model.class_weight
+    params = {'warm_start': True, 'n_estimators': len(model.model.estimators_) + new_trees}
+    if class_weight == 'balanced':
+        # Balance the new trees on the batch they see, explicitly, as sklearn
+        # asks for under warm_start
+        params['class_weight'] = dict(zip(
+            model.classes_, compute_class_weight('balanced', classes=model.classes_, y=y_train)
+        ))
+    model.model.set_params(**params)
+    model.fit_scaled(model.scaler.transform(X_train), y_train)
+    # Save the estimator as configured, not tied to this batch's weights, so
+    # the next update balances its own batch
+    model.model.set_params(class_weight=class_weight, warm_start=False)
+
+    model.version = new_version()
+    model.trained_at = datetime.utcnow().isoformat()
+    model.watermark = watermark
+    model.batch_watermarks = (model.batch_watermarks or [previous_watermark]) + [watermark]
+    model.label_names = disease_names(db, model.classes_)
+    model.metrics = model.evaluate_model(model.scale_features(X_val), y_val)
+    path = model.save_artifact(model_dir)
+
+    DiagnosisService.update_model_performance(
+        db, model.metrics,
+        parameters={
+            'update': 'incremental',
+            'new_trees': new_trees,
+            'total_trees': model.compiled.n_trees,
+            'previous_trees': previous_trees,
+            'new_rows': int(len(y)),
+            'watermark_from': previous_watermark,
+            'watermark_to': watermark,
+            'artifact_version': model.version,
+        },
+        model_name=RandomForestModel.name,
+        dataset_version=model.version
+    )
+    return path
@@ -0,0 +1,75 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+import numpy as np
+import pytest
+
+# Add the project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.ml_models.preprocessing import FEATURE_NAMES
+from src.ml_models.random_forest import RandomForestModel
+from src.ml_models.training_data import make_synthetic_dataset
+
+# One submission of the diagnosis form
+RECORD = {
+    'glucose_level': 120, 'blood_pressure': '120/80', 'skin_thickness': 25,
+    'insulin_level': 100, 'bmi': 25, 'diabetes_pedigree_function': 0.4, 'age': 45,
+}
+
+def train_forest(n_trees: int = 20) -> RandomForestModel:
+    """A small random forest trained on synthetic data, not yet saved."""
+    model = RandomForestModel()
+    model.model.set_params(n_estimators=n_trees)
+    model.train_and_evaluate(*make_synthetic_dataset(400))
+    return model
+
+@pytest.fixture
+def model_dir(tmp_path):
+    return tmp_path / "models"
+
+@pytest.fixture
+def db(tmp_path):
+    """Session on an empty SQLite database with one reviewer and the label diseases."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from src.database.database import Base
+    from src.database.models import Disease, User
+    from src.ml_models.training_data import LABEL_NAMES
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add(User(user_id=1, username="reviewer", email="reviewer@example.com",
+                     password_hash="x", role="doctor"))
+    session.add_all(Disease(disease_id=label, name=name) for label, name in LABEL_NAMES.items())
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+def add_diagnoses(db, X: np.ndarray, y: np.ndarray, status: str = 'confirmed') -> List[int]:
+    """One patient, measurement and reviewed diagnosis per row; returns the diagnosis ids."""
+    from src.database.models import Diagnosis, MedicalParameter, PatientRecord
+
+    ids = []
+    diagnosed_at = datetime(2024, 1, 1)
+    for features, label in zip(X, y):
+        record = PatientRecord(user_id=1)
+        db.add(record)
+        db.flush()
+        # Measurements must be positive
+        values = dict(zip(FEATURE_NAMES, (max(float(value), 0.1) for value in features)))
+        values['blood_pressure'] = str(round(values['blood_pressure'], 1))
+        values['age'] = max(int(values['age']), 1)
+        db.add(MedicalParameter(record_id=record.record_id,
+                                measurement_date=diagnosed_at - timedelta(hours=1), **values))
+        diagnosis = Diagnosis(record_id=record.record_id, disease_id=int(label),
+                              diagnosis_date=diagnosed_at, status=status, reviewed_by=1)
+        db.add(diagnosis)
+        db.flush()
+        ids.append(diagnosis.diagnosis_id)
+    db.commit()
+    return ids
@@ -0,0 +1,55 @@
+import pytest
+from conftest import train_forest
+from src.ml_models.artifacts import find_artifact, list_versions, new_version, read_manifest
+from src.ml_models.hot_reload import ModelWatcher
+from src.ml_models.preprocessing import FEATURE_NAMES
+from src.ml_models.random_forest import RandomForestModel
+from src.ml_models.registry import ModelRegistry
+
+def test_versions_within_one_second_are_distinct_and_ordered():
+    versions = [new_version() for _ in range(50)]
+    assert len(set(versions)) == len(versions)
+    assert versions == sorted(versions)
+    # Versions from before microseconds were added sort first
+    assert versions[0][:14] < versions[0]
+
+def test_saving_an_existing_version_is_refused(model_dir):
+    model = train_forest()
+    model.save_artifact(model_dir)
+    with pytest.raises(FileExistsError):
+        model.save_artifact(model_dir)
+    assert list_versions(model.name, model_dir) == [model.version]
+
+def test_watcher_switches_to_a_save_made_in_the_same_second(model_dir):
+    first = train_forest()
+    first.save_artifact(model_dir)
+    registry = ModelRegistry(model_dir)
+    registry.get(first.name)
+
+    second = train_forest()
+    second.save_artifact(model_dir)
+
+    assert ModelWatcher(registry).check() == [(second.name, second.version)]
+    assert registry.get(second.name).version == second.version
+
+def test_versions_without_a_manifest_are_still_being_saved(model_dir):
+    model = train_forest()
+    path = model.save_artifact(model_dir)
+    in_progress = path.with_name(f"{model.name}-{new_version()}.joblib")
+    in_progress.write_bytes(path.read_bytes()[:100])
+
+    assert find_artifact(model.name, FEATURE_NAMES, model_dir) == path
+
+def test_manifest_labels_are_only_named_by_the_training_data(model_dir):
+    default = RandomForestModel()
+    default.model.set_params(n_estimators=5)
+    default.train_default()
+    assert read_manifest(default.save_artifact(model_dir))['labels'] == {
+        '0': 'Healthy', '1': 'Pre-diabetes', '2': 'Diabetes'
+    }
+
+    # Nothing names the labels of a model trained on bare arrays
+    unnamed = train_forest(n_trees=5)
+    assert read_manifest(unnamed.save_artifact(model_dir))['labels'] == {
+        '0': None, '1': None, '2': None
+    }
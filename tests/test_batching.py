@@ -0,0 +1,58 @@
+import threading
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+import pytest
+from conftest import RECORD, train_forest
+from src.ml_models.batching import MicroBatcher
+from src.ml_models.registry import ModelRegistry
+
+class GatedRegistry(ModelRegistry):
+    """Registry whose lookups wait until the test opens the gate."""
+
+    def __init__(self, model_dir):
+        super().__init__(model_dir)
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+
+    def get(self, *args, **kwargs):
+        self.entered.set()
+        self.gate.wait(5)
+        return super().get(*args, **kwargs)
+
+@pytest.fixture
+def batcher(model_dir):
+    train_forest().save_artifact(model_dir)
+    registry = GatedRegistry(model_dir)
+    batcher = MicroBatcher('random_forest', max_wait_ms=0, registry=registry)
+    yield batcher
+    registry.gate.set()
+    batcher.stop()
+
+def test_cancelled_request_does_not_stop_the_worker(batcher):
+    first = batcher.submit(RECORD)
+    # The worker is now scoring the first batch; the next request waits in the queue
+    assert batcher.registry.entered.wait(5)
+    cancelled = batcher.submit(RECORD)
+    assert cancelled.cancel()
+    batcher.registry.gate.set()
+
+    assert first.result(5)[0] is not None
+    prediction, confidence, model = batcher.get_prediction_with_confidence(RECORD, timeout=5)
+    assert model.name == 'random_forest'
+    assert 0 <= confidence <= 100
+    assert cancelled.cancelled()
+
+def test_timed_out_request_is_skipped(batcher):
+    with pytest.raises(FuturesTimeoutError):
+        batcher.get_prediction_with_confidence(RECORD, timeout=0.05)
+    batcher.registry.gate.set()
+
+    assert batcher.get_prediction_with_confidence(RECORD, timeout=5)[2].name == 'random_forest'
+
+def test_worker_is_restarted_if_it_died(batcher):
+    batcher.registry.gate.set()
+    dead = threading.Thread(target=lambda: None)
+    dead.start()
+    dead.join()
+    batcher._thread = dead
+
+    assert batcher.get_prediction_with_confidence(RECORD, timeout=5)[2].name == 'random_forest'
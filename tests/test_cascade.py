@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from conftest import RECORD, train_forest
+from src.ml_models.cascade import CascadeModel, CascadeStats
+from src.ml_models.factory import create_model
+from src.ml_models.registry import ModelRegistry
+from src.ml_models.training_data import make_synthetic_dataset
+
+def test_time_saved_is_unknown_until_a_request_escalates():
+    stats = CascadeStats()
+    stats.record(rows=10, escalated=0, fast_seconds=0.01, slow_seconds=0.0)
+    assert stats.report()['estimated_seconds_saved'] is None
+
+    stats.record(rows=2, escalated=2, fast_seconds=0.002, slow_seconds=0.2)
+    report = stats.report()
+    assert report['short_circuited'] == 10
+    assert report['estimated_seconds_saved'] == pytest.approx(10 * 0.1 - 0.012)
+
+@pytest.fixture
+def registry(model_dir):
+    train_forest().save_artifact(model_dir)
+    logistic = create_model('logistic_regression')
+    logistic.train_and_evaluate(*make_synthetic_dataset(400))
+    logistic.save_artifact(model_dir)
+    return ModelRegistry(model_dir)
+
+def cascade(registry, band):
+    return CascadeModel('logistic_regression', 'random_forest', band=band, registry=registry)
+
+def test_confident_requests_are_decided_by_the_fast_model(registry):
+    X, _ = make_synthetic_dataset(50, random_state=7)
+    never = cascade(registry, band=(0.0, 0.0))
+    predictions, _, deciders = never.predict_batch(X)
+
+    fast = registry.get('logistic_regression')
+    assert all(model is fast for model in deciders)
+    assert (predictions == fast.predict(fast.scale_features(X))).all()
+    assert never.stats.report()['short_circuited'] == 50
+
+def test_uncertain_requests_escalate_to_the_slow_model(registry):
+    X, _ = make_synthetic_dataset(50, random_state=7)
+    always = cascade(registry, band=(0.0, 1.01))
+    predictions, _, deciders = always.predict_batch(X)
+
+    slow = registry.get('random_forest')
+    assert all(model is slow for model in deciders)
+    assert (predictions == slow.predict(slow.scale_features(X))).all()
+    assert always.stats.report()['short_circuited'] == 0
+
+def test_only_rows_inside_the_band_escalate(registry):
+    X, _ = make_synthetic_dataset(200, random_state=7)
+    fast = registry.get('logistic_regression')
+    _, probabilities, _ = fast.predict_with_proba(fast.scale_features(X))
+    band = (0.0, float(np.median(probabilities.max(axis=1))))
+
+    _, _, deciders = cascade(registry, band).predict_batch(X)
+    escalated = np.array([model.name == 'random_forest' for model in deciders])
+    assert (escalated == (probabilities.max(axis=1) < band[1])).all()
+
+def test_single_request_reports_the_deciding_model(registry):
+    always = cascade(registry, band=(0.0, 1.01))
+    prediction, _, model = always.get_prediction_with_confidence(RECORD)
+    assert model.name == 'random_forest'
+    assert prediction in model.classes_
@@ -0,0 +1,45 @@
+import time
+import pytest
+from conftest import train_forest
+from src.ml_models.hot_reload import ModelWatcher
+from src.ml_models.registry import ModelRegistry
+
+@pytest.fixture
+def registry(model_dir):
+    train_forest().save_artifact(model_dir)
+    registry = ModelRegistry(model_dir)
+    registry.get('random_forest')
+    return registry
+
+def test_nothing_is_swapped_without_a_newer_artifact(registry):
+    assert ModelWatcher(registry).check() == []
+
+def test_newer_artifact_is_swapped_in(registry, model_dir):
+    newer = train_forest(n_trees=5)
+    newer.save_artifact(model_dir)
+
+    assert ModelWatcher(registry).check() == [('random_forest', newer.version)]
+    assert registry.get('random_forest').version == newer.version
+
+def test_broken_artifact_keeps_the_current_model(registry, model_dir, caplog):
+    current = registry.get('random_forest')
+    broken = train_forest(n_trees=5)
+    path = broken.save_artifact(model_dir)
+    path.write_bytes(b"not a joblib file")
+
+    assert ModelWatcher(registry).check() == []
+    assert registry.get('random_forest') is current
+    assert f"Failed to load random_forest version {broken.version}" in caplog.text
+
+def test_background_thread_picks_up_new_artifacts(registry, model_dir):
+    watcher = ModelWatcher(registry, interval=0.01)
+    watcher.start()
+    try:
+        newer = train_forest(n_trees=5)
+        newer.save_artifact(model_dir)
+        deadline = time.monotonic() + 5
+        while registry.get('random_forest').version != newer.version:
+            assert time.monotonic() < deadline, "watcher did not switch to the new artifact"
+            time.sleep(0.01)
+    finally:
+        watcher.stop()
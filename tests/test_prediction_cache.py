@@ -0,0 +1,67 @@
+import pytest
+from conftest import RECORD, train_forest
+from src.ml_models import prediction_cache
+from src.ml_models.prediction_cache import PredictionCache
+from src.ml_models.registry import ModelRegistry
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(prediction_cache.time, 'monotonic', lambda: now[0])
+    return now
+
+def test_entries_expire_after_the_ttl(clock):
+    cache = PredictionCache(max_size=10, ttl=60)
+    cache.put('key', (1, 90.0))
+    clock[0] += 59
+    assert cache.get('key') == (1, 90.0)
+
+    clock[0] += 2
+    assert cache.get('key') is None
+    assert cache.stats()['expirations'] == 1
+    assert cache.stats()['size'] == 0
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PredictionCache(max_size=2, ttl=60)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+
+def test_zero_size_disables_caching():
+    cache = PredictionCache(max_size=0)
+    cache.put('a', 1)
+    assert cache.get('a') is None
+
+def test_repeated_record_is_served_from_the_cache(model_dir):
+    train_forest().save_artifact(model_dir)
+    model = ModelRegistry(model_dir).get('random_forest')
+
+    first = model.get_prediction_with_confidence(RECORD)
+    assert model.get_prediction_with_confidence(RECORD) == first
+    assert model.prediction_cache.stats()['hits'] == 1
+
+def test_swapped_in_model_does_not_answer_from_the_old_cache(model_dir):
+    train_forest().save_artifact(model_dir)
+    registry = ModelRegistry(model_dir)
+    old = registry.get('random_forest')
+    old.get_prediction_with_confidence(RECORD)
+
+    newer = train_forest(n_trees=5)
+    newer.save_artifact(model_dir)
+    new = registry.activate('random_forest', newer.version)
+    new.get_prediction_with_confidence(RECORD)
+    assert new.prediction_cache.stats()['hits'] == 0
+    assert new.prediction_cache.stats()['misses'] == 1
+
+def test_loading_an_artifact_clears_the_cache(model_dir):
+    path = train_forest().save_artifact(model_dir)
+    model = train_forest()
+    model.prediction_cache.put('stale', (0, 50.0))
+    model.load_model(str(path))
+    assert model.prediction_cache.stats()['size'] == 0
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from src.ml_models.preprocessing import (
+    SMALL_COLUMN_SIZE, _parse_code_points, parse_blood_pressure
+)
+
+def float_loop(values):
+    """Reference parser: ``float()`` on each side of the first slash."""
+    systolic = np.full(len(values), np.nan)
+    diastolic = np.full(len(values), np.nan)
+    for i, value in enumerate(values):
+        if isinstance(value, str) and '/' in value:
+            high, low = value.split('/', 1)
+            try:
+                systolic[i], diastolic[i] = float(high), float(low)
+            except ValueError:
+                pass
+    return systolic, diastolic
+
+def parse_long(values):
+    """Parse through the vectorized path, padding the column past the loop cutoff."""
+    padding = ["120/80"] * (SMALL_COLUMN_SIZE + 1)
+    systolic, diastolic, mean_arterial = parse_blood_pressure(list(values) + padding)
+    n = len(values)
+    return systolic[:n], diastolic[:n], mean_arterial[:n]
+
+def assert_bit_exact(actual, expected):
+    assert np.array_equal(actual, expected, equal_nan=True)
+    finite = ~np.isnan(expected)
+    assert np.array_equal(actual[finite].view(np.int64), expected[finite].view(np.int64))
+
+PLAIN = ["120/80", "95/60", "200/130", "120.5/80.25", "0.1/0.7", "99.99/59.01", "7/3", "120./80."]
+SIGNED = ["+120/80", "-120/-80", "120/+80.5"]
+WHITESPACE = [" 120/80", "120/80 ", "120 / 80", "\t120/80\n"]
+MALFORMED = [
+    "", "120", "120/", "/80", "/", "abc/def", "120/80/70", "1.2.3/80", "12a/80",
+    "1e2/80", "nan/80", "inf/80", "1234567890123456/80", None, 120, 12.5,
+]
+
+@pytest.mark.parametrize("values", [PLAIN, SIGNED, WHITESPACE, MALFORMED], ids=[
+    "plain", "signs", "whitespace", "malformed"
+])
+def test_vectorized_parse_matches_float(values):
+    systolic, diastolic, mean_arterial = parse_long(values)
+    expected_systolic, expected_diastolic = float_loop(values)
+
+    assert_bit_exact(systolic, expected_systolic)
+    assert_bit_exact(diastolic, expected_diastolic)
+    assert_bit_exact(mean_arterial, (expected_systolic + 2 * expected_diastolic) / 3)
+
+def test_short_and_long_columns_agree():
+    values = PLAIN + SIGNED + WHITESPACE + MALFORMED
+    short = [parse_blood_pressure([value]) for value in values]
+    long = parse_long(values)
+    for i, (systolic, diastolic, _) in enumerate(short):
+        assert_bit_exact(long[0][i:i + 1], systolic)
+        assert_bit_exact(long[1][i:i + 1], diastolic)
+
+def test_code_points_parse_plain_readings_and_flag_the_rest():
+    systolic, diastolic, parsed = _parse_code_points(np.array(PLAIN + ["+120/80", " 120/80", "1e2/80"]))
+
+    assert parsed.tolist() == [True] * len(PLAIN) + [False, False, False]
+    expected_systolic, expected_diastolic = float_loop(PLAIN)
+    assert_bit_exact(systolic[:len(PLAIN)], expected_systolic)
+    assert_bit_exact(diastolic[:len(PLAIN)], expected_diastolic)
+
+def test_random_readings_match_float():
+    rng = np.random.default_rng(0)
+    n = 20000
+    decimals = rng.integers(0, 4, size=(n, 2))
+    sides = rng.uniform(0, 300, size=(n, 2))
+    values = [
+        f"{high:.{high_decimals}f}/{low:.{low_decimals}f}"
+        for (high, low), (high_decimals, low_decimals) in zip(sides, decimals)
+    ]
+    systolic, diastolic, _ = parse_blood_pressure(values)
+    expected_systolic, expected_diastolic = float_loop(values)
+
+    assert_bit_exact(systolic, expected_systolic)
+    assert_bit_exact(diastolic, expected_diastolic)
@@ -0,0 +1,67 @@
+import logging
+import threading
+import pytest
+from sqlalchemy import create_engine, text
+from config.settings import QUERY_REPEAT_WARNING
+from src.database.database import instrument_engine
+from src.monitoring.query_stats import current_scope, process_stats, query_scope
+
+@pytest.fixture
+def connection():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE readings (value INTEGER)"))
+        yield conn
+    engine.dispose()
+
+def test_counts_are_attributed_to_page_and_service(connection):
+    before = process_stats.count
+    with query_scope("page:History") as page:
+        connection.execute(text("SELECT COUNT(*) FROM readings"))
+        with query_scope("predict_disease") as service:
+            for value in range(3):
+                connection.execute(text("INSERT INTO readings VALUES (:value)"), {"value": value})
+        connection.execute(text("SELECT value FROM readings"))
+
+    assert service.count == 3
+    assert service.statements == {"INSERT INTO readings VALUES (?)": 3}
+    # The page includes the service call it made
+    assert page.count == 5
+    assert page.statements["INSERT INTO readings VALUES (?)"] == 3
+    assert page.seconds >= service.seconds > 0
+    assert process_stats.count - before == 5
+    assert current_scope() is None
+
+def test_statements_outside_a_scope_count_only_for_the_process(connection):
+    before = process_stats.count
+    with query_scope("page:History") as page:
+        pass
+    connection.execute(text("SELECT 1"))
+
+    assert page.count == 0
+    assert process_stats.count - before == 1
+
+def test_scopes_do_not_leak_across_threads(connection):
+    def query_elsewhere():
+        with connection.engine.connect() as other:
+            other.execute(text("SELECT 1"))
+
+    before = process_stats.count
+    with query_scope("page:History") as page:
+        worker = threading.Thread(target=query_elsewhere)
+        worker.start()
+        worker.join()
+        connection.execute(text("SELECT 2"))
+
+    assert page.count == 1
+    assert process_stats.count - before == 2
+
+def test_repeated_statement_is_reported_as_possible_n_plus_one(connection, caplog):
+    with caplog.at_level(logging.WARNING, logger="src.monitoring.query_stats"):
+        with query_scope("page:History") as page:
+            for value in range(QUERY_REPEAT_WARNING):
+                connection.execute(text("SELECT :value"), {"value": value})
+
+    assert page.repeated() == [("SELECT ?", QUERY_REPEAT_WARNING)]
+    assert "Possible N+1 in page:History" in caplog.text
@@ -0,0 +1,48 @@
+import pytest
+from conftest import RECORD, train_forest
+from src.ml_models.factory import create_model
+from src.ml_models.registry import ModelRegistry
+from src.ml_models.training_data import make_synthetic_dataset
+
+@pytest.fixture
+def registry(model_dir):
+    train_forest().save_artifact(model_dir)
+    return ModelRegistry(model_dir)
+
+def test_models_are_loaded_once_and_shared_read_only(registry):
+    model = registry.get('random_forest')
+    assert registry.get('random_forest') is model
+    with pytest.raises(AttributeError):
+        model.version = 'changed'
+
+def test_activate_serves_the_new_version_and_drops_the_old(registry, model_dir):
+    old = registry.get('random_forest')
+    newer = train_forest(n_trees=5)
+    newer.save_artifact(model_dir)
+
+    new = registry.activate('random_forest', newer.version)
+    assert new.version == newer.version
+    assert registry.get('random_forest') is new
+    assert set(registry.loaded()) == {('random_forest', newer.version)}
+    # Requests still holding the old instance finish on it
+    assert old.get_prediction_with_confidence(RECORD)[0] in old.classes_
+
+def test_unload_drops_the_model_until_it_is_requested_again(registry):
+    model = registry.get('random_forest')
+    registry.unload('random_forest')
+    assert registry.loaded() == {}
+    assert registry.active() == {}
+
+    reloaded = registry.get('random_forest')
+    assert reloaded is not model
+    assert reloaded.version == model.version
+
+def test_unload_leaves_other_models_loaded(registry, model_dir):
+    logistic = create_model('logistic_regression')
+    logistic.train_and_evaluate(*make_synthetic_dataset(400))
+    logistic.save_artifact(model_dir)
+    registry.get('random_forest')
+    registry.get('logistic_regression')
+
+    registry.unload('logistic_regression')
+    assert list(registry.active()) == ['random_forest']
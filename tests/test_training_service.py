@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from sklearn.utils.class_weight import compute_class_weight
+from conftest import add_diagnoses
+from src.database.models import Disease
+from src.ml_models.artifacts import read_manifest
+from src.ml_models.random_forest import RandomForestModel
+from src.ml_models.training_data import sample_cluster_features, split_validation
+from src.services.training_service import load_training_data, update_model_incrementally
+
+def labelled_batch(counts, seed):
+    """Synthetic rows with ``counts[label]`` rows of each label."""
+    y = np.repeat(np.arange(len(counts)), counts)
+    return sample_cluster_features(y, np.random.default_rng(seed)), y
+
+@pytest.fixture
+def trained_forest(db, model_dir):
+    add_diagnoses(db, *labelled_batch([60, 60, 60], seed=0))
+    X, y, watermark = load_training_data(db)
+    model = RandomForestModel()
+    model.model.set_params(n_estimators=10)
+    model.train_and_evaluate(X, y)
+    model.watermark = watermark
+    model.batch_watermarks = [watermark]
+    model.save_artifact(model_dir)
+    return model
+
+def test_only_confirmed_diagnoses_are_training_labels(db):
+    confirmed = add_diagnoses(db, *labelled_batch([5, 5, 5], seed=4))
+    add_diagnoses(db, *labelled_batch([2, 2, 2], seed=5), status='rejected')
+    add_diagnoses(db, *labelled_batch([2, 2, 2], seed=6), status='pending')
+
+    X, y, watermark = load_training_data(db)
+    assert len(y) == len(confirmed)
+    assert watermark == max(confirmed)
+
+def test_training_reads_are_bounded_by_diagnosis_ids(db):
+    ids = add_diagnoses(db, *labelled_batch([3, 3, 3], seed=7))
+
+    _, y, watermark = load_training_data(db, since=ids[2], until=ids[5])
+    assert len(y) == 3
+    assert watermark == ids[5]
+    _, y, watermark = load_training_data(db, since=ids[-1])
+    assert len(y) == 0
+    assert watermark == ids[-1]
+
+def test_each_incremental_update_balances_its_own_batch(db, model_dir, trained_forest, monkeypatch):
+    fitted_weights = []
+    fit_scaled = RandomForestModel.fit_scaled
+
+    def record_weights(model, X_scaled, y):
+        fitted_weights.append(model.model.class_weight)
+        fit_scaled(model, X_scaled, y)
+
+    monkeypatch.setattr(RandomForestModel, 'fit_scaled', record_weights)
+
+    add_diagnoses(db, *labelled_batch([80, 10, 10], seed=1))
+    first = RandomForestModel.from_artifact(update_model_incrementally(db, model_dir, new_trees=5))
+    assert first.model.class_weight == 'balanced'
+    assert first.model.warm_start is False
+
+    X, y = labelled_batch([10, 10, 80], seed=2)
+    add_diagnoses(db, X, y)
+    second = RandomForestModel.from_artifact(update_model_incrementally(db, model_dir, new_trees=5))
+    assert len(second.model.estimators_) == 20
+
+    classes = np.unique(y)
+    expected = compute_class_weight('balanced', classes=classes, y=split_validation(X, y)[2])
+    assert fitted_weights[1] == pytest.approx(dict(zip(classes, expected)))
+    assert second.model.class_weight == 'balanced'
+    assert second.model.warm_start is False
+
+def test_update_names_labels_from_the_disease_table(db, model_dir, trained_forest):
+    db.get(Disease, 2).name = "Type 2 diabetes"
+    db.commit()
+    add_diagnoses(db, *labelled_batch([30, 30, 30], seed=3))
+    path = update_model_incrementally(db, model_dir, new_trees=5)
+
+    assert read_manifest(path)['labels'] == {
+        '0': 'Healthy', '1': 'Pre-diabetes', '2': 'Type 2 diabetes'
+    }
+    assert RandomForestModel.from_artifact(path).label_names[2] == "Type 2 diabetes"